@@ -51,19 +51,17 @@ def _knn_shapley_score(neighbor_indices: np.ndarray, y: np.ndarray, k: int) -> n
         - This simplification implies that the term min(K, j + 1) will always be j + 1, which is offset by the
           corresponding denominator term in the inner loop.
         - Dividing by K in the end achieves the same result as dividing by K* in the paper.
-    - The pre-allocated `scores` array incorporates equation (18) for j = k - 1, ensuring efficient computation.
+    - Equation (18) gives the k-th neighbor of every test point a score of zero, so the recursion in equation (19)
+      telescopes: the j-th neighbor of test point alpha receives ``match[j] - match[k - 1]``, where ``match``
+      indicates which neighbors share the label of alpha. These contributions are summed per training point with
+      :py:func:`numpy.bincount`, which takes O(N * k) time and memory instead of materializing an N x N matrix.
     """
     N = y.shape[0]
-    scores = np.zeros((N, N))
-
-    for y_alpha, s_alpha, idx in zip(y, scores, neighbor_indices):
-        y_neighbors = y[idx]
-        ans_matches = (y_neighbors == y_alpha).flatten()
-        for j in range(k - 2, -1, -1):
-            s_alpha[idx[j]] = s_alpha[idx[j + 1]] + float(
-                int(ans_matches[j]) - int(ans_matches[j + 1])
-            )
-    return np.mean(scores / k, axis=0)
+    neighbor_indices = np.asarray(neighbor_indices)[:, :k]
+    matches = (y[neighbor_indices] == y[:, None]).astype(np.float64)
+    contributions = matches - matches[:, [-1]]
+    scores = np.bincount(neighbor_indices.ravel(), weights=contributions.ravel(), minlength=N)
+    return scores / (k * N)
 
 
 def data_shapley_knn(
@@ -50,7 +50,9 @@ if TYPE_CHECKING:  # pragma: no cover
     from datasets.arrow_dataset import Dataset
     from scipy.sparse import csr_matrix
 
-    DatasetLike = Union[Dataset, pd.DataFrame, Dict[str, Any], List[Dict[str, Any]], str]
+    import pyarrow as pa
+
+    DatasetLike = Union[Dataset, pd.DataFrame, pa.Table, Dict[str, Any], List[Dict[str, Any]], str]
 
 
 __all__ = ["Datalab"]
@@ -65,7 +67,7 @@ class Datalab:
 
     Parameters
     ----------
-    data : Union[Dataset, pd.DataFrame, dict, list, str]
+    data : Union[Dataset, pd.DataFrame, pyarrow.Table, dict, list, str]
         Dataset-like object that can be converted to a Hugging Face Dataset object.
 
         It should contain the labels for all examples, identified by a
@@ -73,7 +75,8 @@ class Datalab:
 
         Supported formats:
           - datasets.Dataset
-          - pandas.DataFrame
+          - pandas.DataFrame (only the label column is converted to a Dataset up front)
+          - pyarrow.Table (wrapped without copying or hashing its contents)
           - dict (keys are strings, values are arrays/lists of length ``N``)
           - list (list of dictionaries that each have the same keys)
           - str
@@ -123,15 +126,13 @@ class Datalab:
         # Assume continuous values of labels for regression task
         # Map labels to integers for classification task
         self.task = Task.from_str(task)
-        self._data = Data(data, self.task, label_name)
-        self.data = self._data._data
+        self._data = Data(data, self.task, label_name, columns=[image_key] if image_key else None)
         self._labels = self._data.labels
         self._label_map = self._labels.label_map
         self.label_name = self._labels.label_name
-        self._data_hash = self._data._data_hash
         self.cleanlab_version = cleanlab.version.__version__
         self.verbosity = verbosity
-        self._imagelab = create_imagelab(dataset=self.data, image_key=image_key)
+        self._imagelab = create_imagelab(dataset=self._data._data, image_key=image_key)
         self._correlations_df = pd.DataFrame(columns=["property", "score"])
 
         # Create the builder for DataIssues
@@ -146,6 +147,19 @@ class Datalab:
     def __str__(self) -> str:
         return _Displayer(data_issues=self.data_issues, task=self.task).__str__()
 
+    @property
+    def data(self) -> "Dataset":
+        """The dataset as a Hugging Face Dataset.
+
+        If a pandas DataFrame was provided, only the label column is converted when Datalab is constructed,
+        and the full DataFrame is converted the first time this is accessed.
+        """
+        return self._data.dataset
+
+    @data.setter
+    def data(self, data: "Dataset") -> None:
+        self._data.dataset = data
+
     @property
     def labels(self) -> Union[np.ndarray, List[List[int]]]:
         """Labels of the dataset, in a [0, 1, ..., K-1] format."""
@@ -171,6 +185,7 @@ class Datalab:
         features: Optional[npt.NDArray] = None,
         knn_graph: Optional[csr_matrix] = None,
         issue_types: Optional[Dict[str, Any]] = None,
+        n_jobs: Optional[int] = None,
     ) -> None:
         """
         Checks the dataset for all sorts of common issues in real-world data (in both labels and feature values).
@@ -266,6 +281,12 @@ class Datalab:
             .. seealso::
                 :py:class:`IssueManager <cleanlab.datalab.internal.issue_manager.issue_manager.IssueManager>`
 
+        n_jobs :
+            Number of threads used to check for independent issue types concurrently.
+            Issue types that still need to construct a k nearest neighbor graph are always checked first, one after the other.
+            If None or 1, all issue types are checked sequentially. If -1, all CPUs are used.
+            The results do not depend on this setting.
+
         Examples
         --------
 
@@ -361,6 +382,7 @@ class Datalab:
             features=features,
             knn_graph=knn_graph,
             issue_types=issue_types,
+            n_jobs=n_jobs,
         )
 
         if self.verbosity:
@@ -368,6 +390,95 @@ class Datalab:
                 f"\nAudit complete. {self.data_issues.issue_summary['num_issues'].sum()} issues found in the dataset."
             )
 
+    def update(
+        self,
+        new_data: "DatasetLike",
+        *,
+        pred_probs: Optional[np.ndarray] = None,
+        features: Optional[npt.NDArray] = None,
+    ) -> None:
+        """
+        Appends new examples to the dataset and updates the issues found by :py:meth:`find_issues`,
+        without re-auditing the whole dataset.
+
+        The new examples are scored with statistics stored from the previous audit:
+
+        - label issues: with the confident thresholds estimated from the `pred_probs` passed to :py:meth:`find_issues`.
+        - outlier issues: relative to the previously audited examples (with the stored nearest neighbors search index or `OutOfDistribution` object).
+        - near_duplicate issues: the new examples are inserted into the near-duplicate sets via the stored nearest neighbors search index.
+        - class_imbalance issues: from the updated class counts.
+
+        Other issue types (or issue types that were found with different inputs than those provided here)
+        cannot be updated incrementally. Their results are marked as stale and only cover the previously audited examples,
+        see :py:attr:`stale_issue_types`. Call :py:meth:`find_issues` on the full dataset to recompute them.
+
+        Parameters
+        ----------
+        new_data :
+            The new examples, in any of the formats supported by Datalab, with the same columns as the current dataset.
+            For classification, the labels of the new examples must be among the classes of the current dataset.
+
+        pred_probs :
+            Out-of-sample predicted class probabilities for the new examples only.
+            Required to update label issues.
+
+        features :
+            Feature embeddings of the new examples only.
+            Required to update outlier and near_duplicate issues that were found with features.
+
+        Examples
+        --------
+        >>> lab = Datalab(data=data, label_name="y")
+        >>> lab.find_issues(features=features, pred_probs=pred_probs)
+        >>> lab.update(new_data, features=new_features, pred_probs=new_pred_probs)
+        >>> lab.stale_issue_types
+        ['non_iid', 'underperforming_group']
+        """
+        if self.data_issues.issue_summary.empty:
+            raise ValueError("Call find_issues() before updating the issues with new examples.")
+        num_previous_examples = len(self._data)
+        data = self._data.append(new_data, self.task)
+        num_new_examples = len(data) - num_previous_examples
+        for name, array in [("pred_probs", pred_probs), ("features", features)]:
+            if array is not None and len(array) != num_new_examples:
+                raise ValueError(
+                    f"{name} must have one row per new example ({num_new_examples}), but has {len(array)}."
+                )
+        if self.task.is_classification and data.labels.label_map != self._label_map:
+            raise ValueError(
+                "The new examples have labels that are not among the classes of the current dataset. "
+                "Create a new Datalab and call find_issues() on the full dataset instead."
+            )
+
+        self._data = data
+        self._labels = data.labels
+        self.data_issues.append_examples(data)
+
+        issue_finder = issue_finder_factory(self._imagelab)(
+            datalab=self, task=self.task, verbosity=self.verbosity
+        )
+        issue_finder.update_issues(
+            num_previous_examples=num_previous_examples,
+            pred_probs=pred_probs,
+            features=features,
+        )
+
+        if self.verbosity:
+            print(f"\nUpdate complete. Added {num_new_examples} examples to the dataset.")
+            if self.stale_issue_types:
+                print(
+                    f"These issue types could not be updated, call find_issues() to recompute them: {self.stale_issue_types}"
+                )
+
+    @property
+    def stale_issue_types(self) -> List[str]:
+        """Issue types whose results do not cover all examples in the dataset,
+        because they could not be updated incrementally by :py:meth:`update`.
+
+        Calling :py:meth:`find_issues` for these issue types on the full dataset makes them up to date again.
+        """
+        return self.data_issues.stale_issue_types
+
     def report(
         self,
         *,
@@ -376,6 +487,7 @@ class Datalab:
         include_description: bool = True,
         show_summary_score: bool = False,
         show_all_issues: bool = False,
+        show_profile: bool = False,
     ) -> None:
         """Prints informative summary of all issues.
 
@@ -401,6 +513,11 @@ class Datalab:
             Whether or not the report should show all issue types that were checked for, or only the types of issues detected in the dataset.
             With this set to ``True``, the report may include more types of issues that were not detected in the dataset.
 
+        show_profile :
+            Whether or not to include the time and memory spent on each type of issue (and on constructing the knn graph)
+            during :py:meth:`find_issues`, as stored in ``get_info("statistics")["profile"]``.
+            Peak memory is only available if :py:func:`tracemalloc.start` was called before :py:meth:`find_issues`.
+
         See Also
         --------
         For advanced usage, see documentation for the
@@ -419,6 +536,7 @@ class Datalab:
             include_description=include_description,
             show_summary_score=show_summary_score,
             show_all_issues=show_all_issues,
+            show_profile=show_profile,
             imagelab=self._imagelab,
             correlations_df=self._correlations_df,
         )
@@ -618,6 +736,7 @@ class Datalab:
     @staticmethod
     def load(path: str, data: Optional[Dataset] = None) -> "Datalab":
         """Loads Datalab object from a previously saved folder.
+        Only the issue summary is read right away; the issues and info are read when first accessed.
 
         Parameters
         ----------
@@ -154,6 +154,7 @@ class ImagelabReporterAdapter(Reporter):
         include_description: bool = True,
         show_summary_score: bool = False,
         show_all_issues: bool = False,
+        show_profile: bool = False,
     ):
         super().__init__(
             data_issues=data_issues,
@@ -162,6 +163,7 @@ class ImagelabReporterAdapter(Reporter):
             include_description=include_description,
             show_summary_score=show_summary_score,
             show_all_issues=show_all_issues,
+            show_profile=show_profile,
         )
         self.imagelab = imagelab
         self.correlations_df = correlations_df
@@ -252,6 +254,7 @@ class ImagelabIssueFinderAdapter(IssueFinder):
         features: Optional[npt.NDArray] = None,
         knn_graph: Optional[csr_matrix] = None,
         issue_types: Optional[Dict[str, Any]] = None,
+        n_jobs: Optional[int] = None,
     ) -> None:
         datalab_issue_types = (
             {k: v for k, v in issue_types.items() if k != "image_issue_types"}
@@ -263,6 +266,7 @@ class ImagelabIssueFinderAdapter(IssueFinder):
             features=features,
             knn_graph=knn_graph,
             issue_types=datalab_issue_types,
+            n_jobs=n_jobs,
         )
 
         issue_types_copy = self._get_imagelab_issue_types(issue_types)
@@ -15,6 +15,7 @@
 # along with cleanlab.  If not, see <https://www.gnu.org/licenses/>.
 """Classes and methods for datasets that are loaded into Datalab."""
 
+import hashlib
 import os
 from typing import Any, Callable, Dict, List, Mapping, Optional, Union, cast, TYPE_CHECKING, Tuple
 
@@ -31,14 +32,17 @@ except ImportError as error:
 from abc import ABC, abstractmethod
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 from datasets.arrow_dataset import Dataset
 from datasets import ClassLabel
+from datasets.fingerprint import generate_random_fingerprint
+from datasets.table import InMemoryTable
 
 from cleanlab.internal.validation import labels_to_array, labels_to_list_multilabel
 
 
 if TYPE_CHECKING:  # pragma: no cover
-    DatasetLike = Union[Dataset, pd.DataFrame, Dict[str, Any], List[Dict[str, Any]], str]
+    DatasetLike = Union[Dataset, pd.DataFrame, pa.Table, Dict[str, Any], List[Dict[str, Any]], str]
 
 
 class DataFormatError(ValueError):
@@ -49,7 +53,7 @@ class DataFormatError(ValueError):
         message = (
             f"Unsupported data type: {type(data)}\n"
             "Supported types: "
-            "datasets.Dataset, pandas.DataFrame, dict, list, str"
+            "datasets.Dataset, pandas.DataFrame, pyarrow.Table, dict, list, str"
         )
         super().__init__(message)
 
@@ -102,6 +106,13 @@ class Data:
         Supported formats:
             - datasets.Dataset
             - pandas.DataFrame
+                - only the label column (and any `columns`) is converted right away,
+                  the remaining columns are converted when the full dataset is first accessed
+                - columns added to or replaced in the DataFrame afterwards are ignored,
+                  but values modified in place before that first access are included
+            - pyarrow.Table
+                - wrapped without copying or hashing its contents, so the Dataset
+                  is only considered unchanged if it is the same object (see :py:attr:`fingerprint`)
             - dict
                 - keys are strings
                 - values are arrays or lists of equal length
@@ -135,6 +146,10 @@ class Data:
             the labels for a single example. If the task is not a multilabel task,
             the labels will be formatted as a 1D numpy array.
 
+    columns : List[str], optional
+        Names of other columns that are read directly from the dataset (e.g. a column of images),
+        which are converted right away along with the label column for a pandas DataFrame.
+
     Warnings
     --------
     Optional dependencies:
@@ -150,10 +165,20 @@ class Data:
         data: "DatasetLike",
         task: Task,
         label_name: Optional[str] = None,
+        columns: Optional[List[str]] = None,
     ) -> None:
         self._validate_data(data)
-        self._data = self._load_data(data)
-        self._data_hash = hash(self._data)
+        self._source: Optional[pd.DataFrame] = None
+        if isinstance(data, pd.DataFrame) and label_name in data.columns:
+            # Only convert the columns that are read by Datalab, keep a (shallow) copy of the rest
+            self._source = data.copy(deep=False)
+            columns = [label_name] + [
+                column for column in columns or [] if column != label_name and column in data
+            ]
+            self._data = Dataset.from_pandas(data[columns])
+        else:
+            self._data = self._load_data(data)
+        self._fingerprint: Optional[str] = None
         self.labels: Label
         label_class = MultiLabel if task.is_multilabel else MultiClass
         map_to_int = task.is_classification
@@ -165,6 +190,7 @@ class Data:
         dataset_factory_map: Dict[type, Callable[..., Dataset]] = {
             Dataset: lambda x: x,
             pd.DataFrame: Dataset.from_pandas,
+            pa.Table: self._load_dataset_from_arrow,
             dict: self._load_dataset_from_dict,
             list: self._load_dataset_from_list,
             str: self._load_dataset_from_string,
@@ -173,9 +199,75 @@ class Data:
             raise DataFormatError(data)
         return dataset_factory_map[type(data)](data)
 
+    def append(self, data: "DatasetLike", task: Task) -> "Data":
+        """Creates a new Data object with the examples in `data` appended to the end of this dataset.
+
+        Parameters
+        ----------
+        data :
+            Dataset with the new examples, in any of the supported formats.
+            It must have the same columns as this dataset.
+
+        task :
+            The task associated with the dataset.
+
+        Returns
+        -------
+        data :
+            A new Data object with all examples. This object is left unchanged.
+        """
+        self._validate_data(data)
+        new_dataset = self._load_data(data)
+        dataset = datasets.concatenate_datasets([self.dataset, new_dataset])
+        return Data(dataset, task, self.labels.label_name)
+
+    @property
+    def dataset(self) -> Dataset:
+        """The full dataset as a Hugging Face Dataset.
+
+        For a pandas DataFrame, the columns that were not needed at construction are converted
+        on first access.
+        """
+        if getattr(self, "_source", None) is not None:
+            self._data = Dataset.from_pandas(self._source)
+            self._source = None
+        return self._data
+
+    @dataset.setter
+    def dataset(self, dataset: Dataset) -> None:
+        self._data = dataset
+        self._source = None
+        self._fingerprint = None
+
     def __len__(self) -> int:
         return len(self._data)
 
+    @property
+    def fingerprint(self) -> str:
+        """Fingerprint of the dataset's contents, used to check that a dataset is unchanged.
+
+        This is the fingerprint that the datasets library tracks for every Dataset (it is
+        saved and restored along with the Dataset). Datasets without one cannot be identified
+        by their contents, so they are only considered unchanged if they are the same object.
+        The fingerprint is only computed once it is needed.
+        """
+        if getattr(self, "_fingerprint", None) is None:
+            self._fingerprint = self._compute_fingerprint(self.dataset)
+        return cast(str, self._fingerprint)
+
+    @staticmethod
+    def _compute_fingerprint(dataset: Dataset) -> str:
+        fingerprint = getattr(dataset, "_fingerprint", None)
+        if fingerprint is not None:
+            return fingerprint
+        # Identity-based, like hash(dataset)
+        return f"{type(dataset).__name__}-{id(dataset)}"
+
+    @property
+    def _data_hash(self) -> int:
+        # Stable across processes, unlike hash() of a string
+        return int(hashlib.sha256(self.fingerprint.encode()).hexdigest()[:16], 16)
+
     def __eq__(self, other) -> bool:
         if isinstance(other, Data):
             # Equality checks
@@ -200,9 +292,14 @@ class Data:
     def _validate_data(data) -> None:
         if isinstance(data, datasets.DatasetDict):
             raise DatasetDictError()
-        if not isinstance(data, (Dataset, pd.DataFrame, dict, list, str)):
+        if not isinstance(data, (Dataset, pd.DataFrame, pa.Table, dict, list, str)):
             raise DataFormatError(data)
 
+    @staticmethod
+    def _load_dataset_from_arrow(table: pa.Table) -> Dataset:
+        # A random fingerprint avoids hashing the whole table, which requires serializing it
+        return Dataset(InMemoryTable(table), fingerprint=generate_random_fingerprint())
+
     @staticmethod
     def _load_dataset_from_dict(data_dict: Dict[str, Any]) -> Dataset:
         try:
@@ -30,7 +30,7 @@ from __future__ import annotations
 
 import warnings
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Type, Union
 import numpy as np
 
 import pandas as pd
@@ -199,6 +199,7 @@ class DataIssues:
     """
 
     def __init__(self, data: Data, strategy: Type[_InfoStrategy]) -> None:
+        self._lazy_attributes: Dict[str, Callable[[], Any]] = {}
         self.issues: pd.DataFrame = pd.DataFrame(index=range(len(data)))
         self.issue_summary: pd.DataFrame = pd.DataFrame(
             columns=["issue_type", "score", "num_issues"]
@@ -209,6 +210,50 @@ class DataIssues:
         self._data = data
         self._strategy = strategy
 
+    def _load_lazily(self, name: str, loader: Callable[[], Any]) -> None:
+        """Defer loading the `issues` or `info` attribute until it is first accessed,
+        e.g. when this object was loaded from disk.
+        """
+        self._lazy_attributes[name] = loader
+
+    def _get_attribute(self, name: str) -> Any:
+        loader = self._lazy_attributes.pop(name, None)
+        if loader is not None:
+            setattr(self, f"_{name}", loader())
+        return getattr(self, f"_{name}")
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Load any deferred attributes, the loaders themselves are not picklable
+        for name in list(self._lazy_attributes):
+            self._get_attribute(name)
+        return self.__dict__.copy()
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        # Objects pickled by older versions store `issues` and `info` as plain attributes
+        for name in ["issues", "info"]:
+            if name in state:
+                state[f"_{name}"] = state.pop(name)
+        state.setdefault("_lazy_attributes", {})
+        self.__dict__.update(state)
+
+    @property
+    def issues(self) -> pd.DataFrame:
+        return self._get_attribute("issues")
+
+    @issues.setter
+    def issues(self, issues: pd.DataFrame) -> None:
+        self._lazy_attributes.pop("issues", None)
+        self._issues = issues
+
+    @property
+    def info(self) -> Dict[str, Dict[str, Any]]:
+        return self._get_attribute("info")
+
+    @info.setter
+    def info(self, info: Dict[str, Dict[str, Any]]) -> None:
+        self._lazy_attributes.pop("info", None)
+        self._info = info
+
     def get_info(self, issue_name: Optional[str] = None) -> Dict[str, Any]:
         return self._strategy.get_info(data=self._data, info=self.info, issue_name=issue_name)
 
@@ -278,7 +323,11 @@ class DataIssues:
         if issue_name == "near_duplicate":
             column_dict = {
                 k: info.get(k)
-                for k in ["near_duplicate_sets", "distance_to_nearest_neighbor"]
+                for k in [
+                    "near_duplicate_sets",
+                    "distance_to_nearest_neighbor",
+                    "near_duplicate_cluster_id",
+                ]
                 if info.get(k) is not None
             }
             specific_issues = specific_issues.assign(**column_dict)
@@ -317,6 +366,36 @@ class DataIssues:
             raise ValueError(f"Issue type {issue_name} not found in the summary.")
         return self.issue_summary[row_mask].reset_index(drop=True)
 
+    @property
+    def stale_issue_types(self) -> List[str]:
+        """Issue types whose results do not account for all examples in the dataset,
+        because they could not be updated after new examples were appended to it.
+
+        Call `find_issues` on the full dataset to recompute them.
+        """
+        return self.statistics.get("stale_issue_types", [])
+
+    def append_examples(self, data: Data) -> None:
+        """Point to a dataset that has grown by appending new examples to the end of the dataset.
+
+        The issues of the new examples are missing until they are collected again.
+        Any stored knn graph only covers the previous examples, so it is dropped from the statistics.
+        """
+        self._data = data
+        self.issues = self.issues.reindex(range(len(data)))
+        for key in ["weighted_knn_graph", "knn_metric"]:
+            self.statistics.pop(key, None)
+        self.statistics.update(
+            {k: v for k, v in get_data_statistics(data).items() if k != "health_score"}
+        )
+
+    def mark_stale(self, issue_names: List[str]) -> None:
+        """Mark the results of the given issue types as stale."""
+        stale_issue_types = self.stale_issue_types + [
+            issue_name for issue_name in issue_names if issue_name not in self.stale_issue_types
+        ]
+        self.statistics["stale_issue_types"] = stale_issue_types
+
     def collect_statistics(self, issue_manager: Union[IssueManager, "Imagelab"]) -> None:
         """Update the statistics in the info dictionary.
 
@@ -393,6 +472,12 @@ class DataIssues:
             ignore_index=True,
         )
         self._update_issue_info(issue_manager.issue_name, issue_manager.info)
+        if issue_manager.issue_name in self.stale_issue_types:
+            self.statistics["stale_issue_types"] = [
+                issue_name
+                for issue_name in self.stale_issue_types
+                if issue_name != issue_manager.issue_name
+            ]
 
     def collect_issues_from_imagelab(self, imagelab: "Imagelab", issue_types: List[str]) -> None:
         pass  # pragma: no cover
@@ -29,13 +29,25 @@ and collects the results to :py:class:`DataIssues <cleanlab.datalab.internal.dat
 """
 from __future__ import annotations
 
+import os
+import time
+import tracemalloc
 import warnings
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional
 
 import numpy as np
 from scipy.sparse import csr_matrix
 
+from cleanlab.datalab.internal.issue_manager.knn_graph_helpers import (
+    knn_graph_with_k_neighbors,
+    knn_index_with_k_neighbors,
+    num_neighbors_in_knn_graph,
+    same_knn_metric,
+)
 from cleanlab.datalab.internal.issue_manager_factory import (
+    REGISTRY,
     _IssueManagerFactory,
     list_default_issue_types,
 )
@@ -45,6 +57,8 @@ from cleanlab.datalab.internal.model_outputs import (
     RegressionPredictions,
 )
 from cleanlab.datalab.internal.task import Task
+from cleanlab.internal.neighbor.knn_graph import create_knn_graph_and_index
+from cleanlab.internal.neighbor.metric import decide_default_metric, decide_euclidean_metric
 
 if TYPE_CHECKING:  # pragma: no cover
     from typing import Callable
@@ -52,10 +66,12 @@ if TYPE_CHECKING:  # pragma: no cover
     import numpy.typing as npt
 
     from cleanlab.datalab.datalab import Datalab
+    from cleanlab.datalab.internal.issue_manager import IssueManager
+    from cleanlab.typing import Metric
 
 
 _CLASSIFICATION_ARGS_DICT = {
-    "label": ["pred_probs", "features"],
+    "label": ["pred_probs", "features", "knn_graph"],
     "outlier": ["pred_probs", "features", "knn_graph"],
     "near_duplicate": ["features", "knn_graph"],
     "non_iid": ["pred_probs", "features", "knn_graph"],
@@ -84,6 +100,50 @@ _MULTILABEL_ARGS_DICT = {
 }
 
 
+_KNN_GRAPH_ISSUE_TYPES = [
+    "outlier",
+    "near_duplicate",
+    "non_iid",
+    "underperforming_group",
+    "data_valuation",
+]
+"""Issue types whose managers rely on a (weighted) knn graph that can be shared among them."""
+
+
+@contextmanager
+def _profile_step(
+    profile: Dict[str, Dict[str, Any]],
+    name: str,
+    inputs: Dict[str, Any],
+    trace_memory: bool = True,
+) -> Iterator[None]:
+    """Record the wall time, CPU time, peak traced memory and input sizes of a step of
+    :py:meth:`IssueFinder.find_issues` in ``profile[name]``.
+
+    The CPU time is that of the calling thread. The peak memory (in bytes, relative to the memory
+    allocated when the step started) is measured with :py:mod:`tracemalloc` and is only recorded
+    when `trace_memory` is True and memory is being traced, otherwise it is None.
+    """
+    trace_memory = trace_memory and tracemalloc.is_tracing() and hasattr(tracemalloc, "reset_peak")
+    if trace_memory:
+        tracemalloc.reset_peak()
+        start_memory = tracemalloc.get_traced_memory()[0]
+    start_wall_time, start_cpu_time = time.perf_counter(), time.thread_time()
+    try:
+        yield
+    finally:
+        profile[name] = {
+            "wall_time": time.perf_counter() - start_wall_time,
+            "cpu_time": time.thread_time() - start_cpu_time,
+            "peak_memory": (
+                tracemalloc.get_traced_memory()[1] - start_memory if trace_memory else None
+            ),
+            "input_sizes": {
+                key: tuple(value.shape) for key, value in inputs.items() if hasattr(value, "shape")
+            },
+        }
+
+
 def _resolve_required_args_for_classification(**kwargs):
     """Resolves the required arguments for each issue type intended for classification tasks."""
     initial_args_dict = _CLASSIFICATION_ARGS_DICT.copy()
@@ -242,6 +302,7 @@ class IssueFinder:
         self.datalab = datalab
         self.task = task
         self.verbosity = verbosity
+        self._profile: Dict[str, Dict[str, Any]] = {}
 
     def find_issues(
         self,
@@ -250,6 +311,7 @@ class IssueFinder:
         features: Optional[npt.NDArray] = None,
         knn_graph: Optional[csr_matrix] = None,
         issue_types: Optional[Dict[str, Any]] = None,
+        n_jobs: Optional[int] = None,
     ) -> None:
         """
         Checks the dataset for all sorts of common issues in real-world data (in both labels and feature values).
@@ -259,6 +321,12 @@ class IssueFinder:
         The more of these inputs you provide, the more types of issues Datalab can detect in your dataset/labels.
         If you provide a subset of these inputs, Datalab will output what insights it can based on the limited information from your model.
 
+        The wall time, CPU time and input sizes of each issue manager (and of the construction of
+        a shared knn graph, under the ``"knn_graph"`` key) are recorded in ``statistics["profile"]``,
+        which is replaced on each call.
+        Their peak memory is recorded as well if memory allocations are being traced,
+        i.e. after calling :py:func:`tracemalloc.start`.
+
         Note
         ----
         This method is not intended to be used directly. Instead, use the
@@ -298,7 +366,12 @@ class IssueFinder:
 
             .. seealso::
                 :py:class:`IssueManager <cleanlab.datalab.internal.issue_manager.issue_manager.IssueManager>`
+
+        n_jobs :
+            Number of threads used to run independent issue managers concurrently.
+            If None or 1, the issue managers run one after the other. If -1, all CPUs are used.
         """
+        num_workers = self._get_num_workers(n_jobs)
 
         issue_types_copy = self.get_available_issue_types(
             pred_probs=pred_probs,
@@ -317,21 +390,278 @@ class IssueFinder:
             )
         ]
 
-        failed_managers = []
+        self._profile = {}
+        self._share_knn_graph(
+            new_issue_managers,
+            list(issue_types_copy.values()),
+            features=features,
+            knn_graph=knn_graph,
+        )
+
+        failed_managers = self._run_issue_managers(
+            new_issue_managers, list(issue_types_copy.values()), num_workers=num_workers
+        )
+        self.datalab.data_issues.statistics["profile"] = self._profile
+        if failed_managers:
+            print(f"Failed to check for these issue types: {failed_managers}")
+        self.datalab.data_issues.set_health_score()
+
+    def update_issues(
+        self,
+        *,
+        num_previous_examples: int,
+        pred_probs: Optional[np.ndarray] = None,
+        features: Optional[npt.NDArray] = None,
+    ) -> None:
+        """Update the issues found by previous calls to :py:meth:`find_issues`, after new examples have
+        been appended to the dataset.
+
+        Each previously checked issue type is updated incrementally by its issue manager, see
+        :py:meth:`IssueManager.update_issues <cleanlab.datalab.internal.issue_manager.issue_manager.IssueManager.update_issues>`.
+        Issue types that cannot be updated (with the given inputs) are marked as stale in the DataIssues.
+
+        Parameters
+        ----------
+        num_previous_examples :
+            The number of examples in the dataset before the new examples were appended.
+
+        pred_probs :
+            Predicted probabilities for the new examples only.
+
+        features :
+            Feature embeddings of the new examples only.
+        """
         data_issues = self.datalab.data_issues
-        for issue_manager, arg_dict in zip(new_issue_managers, issue_types_copy.values()):
+        stale_issue_types = []
+        for issue_name in data_issues.issue_summary["issue_type"].tolist():
+            if issue_name in data_issues.stale_issue_types:
+                continue
+            if issue_name not in REGISTRY[self.task]:
+                # E.g. image issues found by an Imagelab
+                stale_issue_types.append(issue_name)
+                continue
             try:
+                factory = _IssueManagerFactory.from_str(issue_name, task=self.task)
+                issue_manager = factory(datalab=self.datalab)
                 if self.verbosity:
-                    print(f"Finding {issue_manager.issue_name} issues ...")
-                issue_manager.find_issues(**arg_dict)
-                data_issues.collect_statistics(issue_manager)
+                    print(f"Updating {issue_name} issues ...")
+                issue_manager.update_issues(
+                    num_previous_examples=num_previous_examples,
+                    pred_probs=pred_probs,
+                    features=features,
+                )
+            except Exception as e:
+                if self.verbosity and not isinstance(e, NotImplementedError):
+                    print(f"Error in updating {issue_name}: {e}")
+                stale_issue_types.append(issue_name)
+                continue
+            with warnings.catch_warnings():
+                # The previous results are meant to be overwritten
+                warnings.simplefilter("ignore")
+                data_issues.collect_issues_from_issue_manager(issue_manager)
+        data_issues.mark_stale(stale_issue_types)
+        data_issues.set_health_score()
+
+    def _run_issue_managers(
+        self,
+        issue_managers: List[IssueManager],
+        args_dicts: List[Dict[str, Any]],
+        num_workers: int = 1,
+    ) -> List[IssueManager]:
+        """Run the issue managers and collect their results into the Datalab's DataIssues.
+
+        With a single worker, the issue managers run one after the other, and the results of each
+        issue manager are collected right after it runs. Otherwise, they are scheduled in two stages:
+
+        1. Issue managers that still have to construct a knn graph (i.e. that did not receive one
+           from :py:meth:`_share_knn_graph`) run one after the other, so that the graph stored in the
+           statistics by one of them can be reused by the next.
+        2. All other issue managers only read from the Datalab, so they run concurrently on a pool of
+           `num_workers` threads. Most of their work happens in NumPy/SciPy/scikit-learn routines that
+           release the GIL.
+
+        Results of the concurrent issue managers are collected (and their progress messages printed)
+        in the order of `issue_managers`, regardless of the order in which they finish.
+
+        Returns
+        -------
+        failed_managers :
+            The issue managers that raised an error.
+        """
+        profile = self._profile
+        data_issues = self.datalab.data_issues
+        failed: List[int] = []
+
+        def run(i: int, trace_memory: bool = True) -> Optional[Exception]:
+            try:
+                with _profile_step(
+                    profile, issue_managers[i].issue_name, args_dicts[i], trace_memory
+                ):
+                    issue_managers[i].find_issues(**args_dicts[i])
+            except Exception as e:
+                return e
+            return None
+
+        def collect(i: int, error: Optional[Exception], statistics: bool = True) -> None:
+            issue_manager = issue_managers[i]
+            try:
+                if error is not None:
+                    raise error
+                if statistics:
+                    data_issues.collect_statistics(issue_manager)
                 data_issues.collect_issues_from_issue_manager(issue_manager)
             except Exception as e:
                 print(f"Error in {issue_manager.issue_name}: {e}")
-                failed_managers.append(issue_manager)
-        if failed_managers:
-            print(f"Failed to check for these issue types: {failed_managers}")
-        data_issues.set_health_score()
+                failed.append(i)
+
+        producers = [
+            i
+            for i, (issue_manager, args_dict) in enumerate(zip(issue_managers, args_dicts))
+            if issue_manager.issue_name in _KNN_GRAPH_ISSUE_TYPES
+            and args_dict.get("knn_graph", None) is None
+        ]
+        independent = [i for i in range(len(issue_managers)) if i not in producers]
+        if num_workers == 1 or len(independent) < 2:
+            for i in range(len(issue_managers)):
+                if self.verbosity:
+                    print(f"Finding {issue_managers[i].issue_name} issues ...")
+                collect(i, run(i))
+            return [issue_managers[i] for i in failed]
+
+        errors: Dict[int, Optional[Exception]] = {}
+        for i in producers:
+            if self.verbosity:
+                print(f"Finding {issue_managers[i].issue_name} issues ...")
+            errors[i] = run(i)
+            if errors[i] is None:
+                # The knn graph of this issue manager may be reused by the next one
+                data_issues.collect_statistics(issue_managers[i])
+            else:
+                print(f"Error in {issue_managers[i].issue_name}: {errors[i]}")
+                failed.append(i)
+        # Memory allocated by concurrent issue managers cannot be told apart
+        with ThreadPoolExecutor(max_workers=min(num_workers, len(independent))) as executor:
+            errors.update(
+                zip(independent, executor.map(lambda i: run(i, trace_memory=False), independent))
+            )
+        for i in range(len(issue_managers)):
+            if i in failed:
+                continue
+            if self.verbosity and i in independent:
+                print(f"Finding {issue_managers[i].issue_name} issues ...")
+            collect(i, errors[i], statistics=i in independent)
+        return [issue_managers[i] for i in sorted(failed)]
+
+    @staticmethod
+    def _get_num_workers(n_jobs: Optional[int]) -> int:
+        """Resolve the `n_jobs` argument of `find_issues` into a number of threads."""
+        if n_jobs is None:
+            return 1
+        if n_jobs == -1:
+            return os.cpu_count() or 1
+        if not isinstance(n_jobs, int) or n_jobs < 1:
+            raise ValueError(f"n_jobs must be None, -1 or a positive integer, got {n_jobs}.")
+        return n_jobs
+
+    def _share_knn_graph(
+        self,
+        issue_managers: List[IssueManager],
+        args_dicts: List[Dict[str, Any]],
+        *,
+        features: Optional[npt.NDArray],
+        knn_graph: Optional[csr_matrix],
+    ) -> None:
+        """Construct a single knn graph for all issue managers that need one to be built from `features`.
+
+        The graph is built once, with the largest `k` required by any of these issue managers,
+        and stored in the statistics of the Datalab.
+        Each issue manager receives a knn graph restricted to its own `k` (and the fitted search index)
+        via its arguments to `find_issues`. The argument dictionaries are updated in-place.
+
+        For classification tasks, the label issue manager also uses the shared graph to compute
+        out-of-sample predicted probabilities via a neighbor vote, when no `pred_probs` are given.
+        The graph is then built with the metric of the label issue manager (euclidean by default)
+        instead of the default metric for the features, so the neighbors are only searched once.
+
+        Issue managers with a metric that differs from the one used to build the shared graph
+        are left alone, they construct their own graph.
+        If the user provided a `knn_graph`, nothing needs to be built.
+        """
+        if features is None or knn_graph is not None:
+            return None
+
+        metric = decide_default_metric(features)
+        for issue_manager, args_dict in zip(issue_managers, args_dicts):
+            if self._finds_label_issues_from_features(issue_manager, args_dict):
+                label_metric = getattr(issue_manager, "metric", None)
+                metric = decide_euclidean_metric(features) if label_metric is None else label_metric
+        consumers = [
+            (issue_manager, args_dict)
+            for issue_manager, args_dict in zip(issue_managers, args_dicts)
+            if self._uses_knn_graph(issue_manager, args_dict, metric)
+            and args_dict.get("features", None) is not None
+            and args_dict.get("cluster_ids", None) is None
+            and isinstance(getattr(issue_manager, "k", None), int)
+            and getattr(issue_manager, "metric", None) in (None, metric)
+        ]
+        if not consumers:
+            return None
+        max_k = max(issue_manager.k for issue_manager, _ in consumers)  # type: ignore[attr-defined]
+
+        statistics = self.datalab.get_info("statistics")
+        shared_knn_graph = statistics.get("weighted_knn_graph", None)
+        knn = None
+        reuse_existing_graph = (
+            shared_knn_graph is not None
+            and statistics.get("knn_metric", None) == metric
+            and num_neighbors_in_knn_graph(shared_knn_graph) >= max_k
+        )
+        if not reuse_existing_graph:
+            try:
+                with _profile_step(self._profile, "knn_graph", {"features": features}):
+                    shared_knn_graph, knn = create_knn_graph_and_index(
+                        features, n_neighbors=max_k, metric=metric
+                    )
+            except Exception:
+                # Let each issue manager handle (and report) the problem on its own
+                return None
+            self.datalab.data_issues.statistics.update(
+                {"weighted_knn_graph": shared_knn_graph, "knn_metric": metric}
+            )
+
+        for issue_manager, args_dict in consumers:
+            k = issue_manager.k  # type: ignore[attr-defined]
+            issue_manager.metric = metric  # type: ignore[attr-defined]
+            args_dict["knn_graph"] = knn_graph_with_k_neighbors(shared_knn_graph, k)
+            if knn is not None:
+                args_dict["knn"] = knn_index_with_k_neighbors(knn, k)
+        return None
+
+    def _uses_knn_graph(
+        self, issue_manager: IssueManager, args_dict: Dict[str, Any], metric: Metric
+    ) -> bool:
+        """Whether an issue manager will rely on a knn graph built with `metric`,
+        given its arguments to `find_issues`.
+
+        The label issue manager only accepts a graph with its own metric (euclidean by default).
+        """
+        if issue_manager.issue_name in _KNN_GRAPH_ISSUE_TYPES:
+            return True
+        return self._finds_label_issues_from_features(issue_manager, args_dict) and same_knn_metric(
+            getattr(issue_manager, "metric", None), metric
+        )
+
+    def _finds_label_issues_from_features(
+        self, issue_manager: IssueManager, args_dict: Dict[str, Any]
+    ) -> bool:
+        """Whether the label issue manager will compute predicted probabilities from the neighbors
+        of each example, given its arguments to `find_issues`."""
+        return (
+            issue_manager.issue_name == "label"
+            and self.task == Task.CLASSIFICATION
+            and args_dict.get("pred_probs", None) is None
+            and args_dict.get("features", None) is not None
+        )
 
     def _set_issue_types(
         self,
@@ -21,6 +21,8 @@ import warnings
 import numpy as np
 import pandas as pd
 from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import connected_components
+from sklearn.base import clone
 
 
 from cleanlab.datalab.internal.issue_manager import IssueManager
@@ -29,6 +31,7 @@ from cleanlab.internal.constants import EPSILON
 
 if TYPE_CHECKING:  # pragma: no cover
     import numpy.typing as npt
+    from sklearn.neighbors import NearestNeighbors
     from cleanlab.datalab.datalab import Datalab
 
 
@@ -56,20 +59,31 @@ class NearDuplicateIssueManager(IssueManager):
         metric: Optional[Union[str, Callable]] = None,
         threshold: float = 0.13,
         k: int = 10,
+        compute_cluster_ids: bool = False,
         **_,
     ):
+        """
+        Parameters
+        ----------
+        compute_cluster_ids :
+            Whether to also group the near-duplicate examples into clusters
+            (the connected components of the near-duplicate relation), stored as
+            ``"near_duplicate_cluster_id"`` in the info. Examples that are not near-duplicates of any
+            other example get a cluster ID of -1.
+        """
         super().__init__(datalab)
         self.metric = metric
         self.threshold = self._set_threshold(threshold)
         self.k = k
-        self.near_duplicate_sets: List[List[int]] = []
+        self.compute_cluster_ids = compute_cluster_ids
+        self.near_duplicate_sets: List[np.ndarray] = []
 
     def find_issues(
         self,
         features: Optional[npt.NDArray] = None,
         **kwargs,
     ) -> None:
-        knn_graph, self.metric, _ = set_knn_graph(
+        knn_graph, self.metric, knn = set_knn_graph(
             features=features,
             find_issues_kwargs=kwargs,
             metric=self.metric,
@@ -98,47 +112,189 @@ class NearDuplicateIssueManager(IssueManager):
         )
 
         self.summary = self.make_summary(score=scores.mean())
-        self.info = self.collect_info(knn_graph=knn_graph, median_nn_distance=median_nn_distance)
+        self.info = self.collect_info(
+            knn_graph=knn_graph, median_nn_distance=median_nn_distance, knn=knn
+        )
+
+    def update_issues(
+        self,
+        num_previous_examples: int,
+        features: Optional[npt.NDArray] = None,
+        **kwargs,
+    ) -> None:
+        """Inserts new examples appended to the dataset into the near-duplicate sets.
+
+        The new examples are queried against the search index stored by the previous call to
+        :py:meth:`find_issues`, against the indices of the blocks of examples appended by previous updates,
+        and against each other. Near-duplicate pairs are found with the same radius as before (relative to
+        the previous median nearest neighbor distance), and are added to the sets of both examples.
+        Previously audited examples whose nearest neighbor is one of the new examples get an updated score.
+        The stored search index is never refit: an index over the new examples only is kept in
+        ``info["appended_knn"]``, so that later updates also compare against them.
+
+        Parameters
+        ----------
+        num_previous_examples :
+            The number of examples in the dataset before the new examples were appended.
+
+        features :
+            The features of the new examples only.
+        """
+        _, info = self._get_previous_results(num_previous_examples)
+        knn = info.get("knn", None)
+        if features is None or knn is None or not hasattr(knn, "_fit_X"):
+            raise NotImplementedError(
+                "Near-duplicate issues can only be updated with features, "
+                "if a search index was stored when finding them."
+            )
+        features = np.asarray(features)
+        M = len(features)
+        k = min(info["k"], num_previous_examples + M - 1)
+        median_nn_distance = info["median_distance_to_nearest_neighbor"]
+        radius = info["threshold"] * median_nn_distance
+
+        # Neighbors among the examples of each index, and among the new examples (excluding themselves)
+        new_knn = clone(knn).set_params(n_neighbors=max(min(k, M - 1), 1)).fit(features)
+        appended_knn = list(info.get("appended_knn", []))
+        all_distances, all_indices = [], []
+        offset = 0
+        for indexed_knn in [knn] + appended_knn:
+            n_fit = indexed_knn.n_samples_fit_
+            distances, indices = indexed_knn.kneighbors(features, n_neighbors=min(k, n_fit))
+            all_distances.append(distances)
+            all_indices.append(indices + offset)
+            offset += n_fit
+        if M > 1:
+            distances, indices = new_knn.kneighbors()
+            all_distances.append(distances)
+            all_indices.append(indices + offset)
+        distances, indices = np.hstack(all_distances), np.hstack(all_indices)
+        order = np.argsort(distances, axis=1, kind="stable")[:, :k]
+        distances = np.take_along_axis(distances, order, axis=1)
+        indices = np.take_along_axis(indices, order, axis=1)
+        N = num_previous_examples + M
+        new_ids = np.arange(num_previous_examples, N)
+
+        nn_distances = np.concatenate([info["distance_to_nearest_neighbor"], distances[:, 0]])
+        nn_ids = np.concatenate([info["nearest_neighbor"], indices[:, 0]])
+        # Previously audited examples may have one of the new examples as their nearest neighbor
+        query_ids = np.repeat(new_ids, distances.shape[1])
+        neighbor_ids, pair_distances = indices.ravel(), distances.ravel()
+        closer = np.flatnonzero(pair_distances < nn_distances[neighbor_ids])
+        closer = closer[np.lexsort((pair_distances[closer], neighbor_ids[closer]))]
+        _, first_per_neighbor = np.unique(neighbor_ids[closer], return_index=True)
+        closest = closer[first_per_neighbor]
+        nn_distances[neighbor_ids[closest]] = pair_distances[closest]
+        nn_ids[neighbor_ids[closest]] = query_ids[closest]
+
+        # Symmetrize the near-duplicate pairs of the new examples, and add them to the previous sets
+        previous_sets = info["near_duplicate_sets"]
+        previous_sizes = np.array([len(s) for s in previous_sets], dtype=int)
+        previous_near_duplicates = csr_matrix(
+            (
+                np.ones(previous_sizes.sum(), dtype=bool),
+                np.concatenate(previous_sets) if len(previous_sets) else np.array([], dtype=int),
+                np.concatenate([[0], np.cumsum(previous_sizes), np.full(M, previous_sizes.sum())]),
+            ),
+            shape=(N, N),
+        )
+        within_radius = pair_distances < radius
+        new_near_duplicates = csr_matrix(
+            (
+                np.ones(within_radius.sum(), dtype=bool),
+                (query_ids[within_radius], neighbor_ids[within_radius]),
+            ),
+            shape=(N, N),
+        )
+        near_duplicates = (
+            previous_near_duplicates + new_near_duplicates + new_near_duplicates.T
+        ).tocsr()
+        near_duplicates.sort_indices()
+        near_duplicate_sets = np.split(near_duplicates.indices, near_duplicates.indptr[1:-1])
+        self.near_duplicate_sets = near_duplicate_sets
+        if "near_duplicate_cluster_id" in info:
+            info["near_duplicate_cluster_id"] = self._cluster_ids(near_duplicate_sets)
+
+        is_issue_column = np.diff(near_duplicates.indptr) > 0
+        scores = _compute_scores_with_exp_transform(
+            nn_distances, temperature=1.0 / median_nn_distance
+        )
+        self.issues = pd.DataFrame(
+            {f"is_{self.issue_name}_issue": is_issue_column, self.issue_score_key: scores}
+        )
+        self.summary = self.make_summary(score=scores.mean())
+
+        info.update(
+            {
+                "average_near_duplicate_score": scores.mean(),
+                "near_duplicate_sets": near_duplicate_sets,
+                "nearest_neighbor": nn_ids.tolist(),
+                "distance_to_nearest_neighbor": nn_distances.tolist(),
+                "appended_knn": appended_knn + [new_knn],
+            }
+        )
+        self.info = info
 
     @staticmethod
-    def _neighbors_within_radius(knn_graph: csr_matrix, threshold: float, median: float):
-        """Returns a list of lists of indices of near-duplicate examples.
+    def _neighbors_within_radius(
+        knn_graph: csr_matrix, threshold: float, median: float
+    ) -> List[np.ndarray]:
+        """Returns a list of arrays of indices of near-duplicate examples.
 
-        Each list of indices represents a set of near-duplicate examples.
+        Each array of indices represents a set of near-duplicate examples.
 
-        If the list is empty for a given example, then that example is not
+        If the array is empty for a given example, then that example is not
         a near-duplicate of any other example.
-        """
 
+        The near-duplicate relation is reciprocal: if example A is a near-duplicate of example B,
+        then B is also a near-duplicate of A, even if A is not among the nearest neighbors of B.
+        The sets are sorted by index (not by distance) and are views into a single CSR matrix.
+        """
         N = knn_graph.shape[0]
-        distances = knn_graph.data.reshape(N, -1)
-        # Create a mask for the threshold
-        mask = distances < threshold * median
-
-        # Update the indptr to reflect the new number of neighbors
-        indptr = np.zeros(knn_graph.indptr.shape, dtype=knn_graph.indptr.dtype)
-        indptr[1:] = np.cumsum(mask.sum(axis=1))
-
-        # Filter the knn_graph based on the threshold
-        indices = knn_graph.indices[mask.ravel()]
-        near_duplicate_sets = [indices[indptr[i] : indptr[i + 1]] for i in range(N)]
-
-        # Second pass over the data is required to ensure each item is included in the near-duplicate sets of its own near-duplicates.
-        # This is important because a "near-duplicate" relationship is reciprocal.
-        # For example, if item A is a near-duplicate of item B, then item B should also be considered a near-duplicate of item A.
-        # NOTE: This approach does not assure that the sets are ordered by increasing distance.
-        for i, near_duplicates in enumerate(near_duplicate_sets):
-            for j in near_duplicates:
-                if i not in near_duplicate_sets[j]:
-                    near_duplicate_sets[j] = np.append(near_duplicate_sets[j], i)
-
-        return near_duplicate_sets
-
-    def collect_info(self, knn_graph: csr_matrix, median_nn_distance: float) -> dict:
+        mask = knn_graph.data < threshold * median
+        # Number of masked entries before each row
+        indptr = np.concatenate([[0], np.cumsum(mask)])[knn_graph.indptr]
+        near_duplicates = csr_matrix(
+            (np.ones(indptr[-1], dtype=bool), knn_graph.indices[mask], indptr), shape=(N, N)
+        )
+        # Symmetrize the thresholded graph
+        near_duplicates = (near_duplicates + near_duplicates.T).tocsr()
+        near_duplicates.sort_indices()
+        return np.split(near_duplicates.indices, near_duplicates.indptr[1:-1])
+
+    @staticmethod
+    def _cluster_ids(near_duplicate_sets: List[np.ndarray]) -> np.ndarray:
+        """Assigns one cluster ID to each group of connected near-duplicate examples, and -1 to
+        examples that are not near-duplicates of any other example.
+
+        Cluster IDs are numbered by the order of the first example of each group.
+        """
+        N = len(near_duplicate_sets)
+        set_sizes = np.array([len(s) for s in near_duplicate_sets], dtype=int)
+        indices = np.concatenate(near_duplicate_sets) if N > 0 else np.array([], dtype=int)
+        indptr = np.concatenate([[0], np.cumsum(set_sizes)])
+        graph = csr_matrix((np.ones(len(indices), dtype=bool), indices, indptr), shape=(N, N))
+        _, labels = connected_components(graph, directed=False)
+        has_duplicates = set_sizes > 0
+        _, first_occurrence, inverse = np.unique(
+            labels[has_duplicates], return_index=True, return_inverse=True
+        )
+        cluster_ids = np.full(N, -1, dtype=int)
+        cluster_ids[has_duplicates] = np.argsort(np.argsort(first_occurrence))[inverse]
+        return cluster_ids
+
+    def collect_info(
+        self,
+        knn_graph: csr_matrix,
+        median_nn_distance: float,
+        knn: Optional[NearestNeighbors] = None,
+    ) -> dict:
         issues_dict = {
             "average_near_duplicate_score": self.issues[self.issue_score_key].mean(),
             "near_duplicate_sets": self.near_duplicate_sets,
         }
+        if self.compute_cluster_ids:
+            issues_dict["near_duplicate_cluster_id"] = self._cluster_ids(self.near_duplicate_sets)
 
         params_dict = {
             "metric": self.metric,
@@ -154,6 +310,7 @@ class NearDuplicateIssueManager(IssueManager):
             "nearest_neighbor": nn_ids.tolist(),
             "distance_to_nearest_neighbor": dists.tolist(),
             "median_distance_to_nearest_neighbor": median_nn_distance,
+            "knn": knn,
         }
 
         statistics_dict = self._build_statistics_dictionary(knn_graph=knn_graph)
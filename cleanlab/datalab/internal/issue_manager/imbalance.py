@@ -83,6 +83,14 @@ class ClassImbalanceIssueManager(IssueManager):
         self.summary = self.make_summary(score=class_probs[rarest_class_idx])
         self.info = self.collect_info(class_name=rarest_class_name, labels=labels)
 
+    def update_issues(self, num_previous_examples: int, **kwargs) -> None:
+        """Recomputes the class imbalance issues from the class counts of the grown dataset,
+        with the same threshold as the previous call to :py:meth:`find_issues`.
+        """
+        _, info = self._get_previous_results(num_previous_examples)
+        self.threshold = info["threshold"]
+        self.find_issues()
+
     def collect_info(self, class_name: str, labels: np.ndarray) -> dict:
         params_dict = {
             "threshold": self.threshold,
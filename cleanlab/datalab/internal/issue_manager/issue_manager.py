@@ -168,6 +168,57 @@ class IssueManager(ABC, metaclass=IssueManagerMeta):
         """
         raise NotImplementedError
 
+    def update_issues(self, num_previous_examples: int, **kwargs) -> None:
+        """Updates the results of a previous call to :py:meth:`find_issues` after new examples
+        have been appended to the end of the dataset.
+
+        Implementations score the new examples with the statistics stored in the `info` of the
+        previous run (instead of re-auditing the whole dataset), and set the `issues`, `summary`
+        and `info` attributes for the full, grown dataset.
+
+        Parameters
+        ----------
+        num_previous_examples :
+            The number of examples in the dataset before the new examples were appended.
+
+        kwargs :
+            Inputs for the new examples only, e.g. `pred_probs` or `features`.
+
+        Raises
+        ------
+        NotImplementedError
+            If this issue type cannot be updated incrementally (with the given inputs).
+            The Datalab then marks the results of this issue type as stale.
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not support incremental updates. "
+            "Call find_issues() on the full dataset instead."
+        )
+
+    def _get_previous_results(self, num_previous_examples: int) -> Tuple[pd.DataFrame, dict]:
+        """Fetch the issues (of the previously audited examples) and info from a previous call to
+        :py:meth:`find_issues`.
+        """
+        data_issues = self.datalab.data_issues
+        columns = [f"is_{self.issue_name}_issue", self.issue_score_key]
+        if self.issue_name not in data_issues.info or not set(columns) <= set(
+            data_issues.issues.columns
+        ):
+            raise ValueError(f"No previous results found for {self.issue_name} issues.")
+        issues = data_issues.issues.loc[: num_previous_examples - 1, columns]
+        issues = issues.astype({columns[0]: bool, columns[1]: float})
+        return issues, data_issues.info[self.issue_name].copy()
+
+    def _set_updated_results(
+        self, previous_issues: pd.DataFrame, new_issues: pd.DataFrame, info: dict
+    ) -> None:
+        """Set the `issues`, `summary` and `info` attributes after an incremental update, with the
+        issues of the new examples appended to the previous ones.
+        """
+        self.issues = pd.concat([previous_issues, new_issues], ignore_index=True)
+        self.summary = self.make_summary(score=self.issues[self.issue_score_key].mean())
+        self.info = info
+
     def collect_info(self, *args, **kwargs) -> dict:
         """Collects data for the info attribute of the Datalab.
 
@@ -1,5 +1,8 @@
+import copy
+import numpy as np
 import numpy.typing as npt
 from scipy.sparse import csr_matrix
+from scipy.spatial.distance import euclidean
 
 
 from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, cast
@@ -17,6 +20,48 @@ def num_neighbors_in_knn_graph(knn_graph: csr_matrix) -> int:
     return knn_graph.nnz // knn_graph.shape[0]
 
 
+def same_knn_metric(metric: Optional[Metric], graph_metric: Optional[Metric]) -> bool:
+    """Whether a knn graph built with `graph_metric` can be used by an issue manager with `metric`.
+
+    A metric of None stands for euclidean distances (the default of sklearn estimators),
+    and the ``euclidean`` function from scipy is the same metric as ``"euclidean"``.
+    """
+
+    def normalize(m: Optional[Metric]) -> Optional[Metric]:
+        return "euclidean" if m is None or m is euclidean else m
+
+    return graph_metric is not None and normalize(metric) == normalize(graph_metric)
+
+
+def knn_graph_with_k_neighbors(knn_graph: csr_matrix, k: int) -> csr_matrix:
+    """Restrict a knn graph to the `k` nearest neighbors of each example.
+
+    The graph is returned as-is if it does not have more than `k` neighbors per row.
+    Otherwise, only the first `k` (i.e. nearest) entries of each row are kept, which
+    requires the entries of each row to be sorted by distance.
+    """
+    num_neighbors = num_neighbors_in_knn_graph(knn_graph)
+    if k >= num_neighbors:
+        return knn_graph
+    N = knn_graph.shape[0]
+    distances = knn_graph.data.reshape(N, -1)[:, :k]
+    indices = knn_graph.indices.reshape(N, -1)[:, :k]
+    indptr = np.arange(0, N * k + 1, k)
+    return csr_matrix((distances.ravel(), indices.ravel(), indptr), shape=knn_graph.shape)
+
+
+def knn_index_with_k_neighbors(knn: "NearestNeighbors", k: int) -> "NearestNeighbors":
+    """Get a fitted knn search object that queries `k` neighbors by default.
+
+    The returned object is a shallow copy that shares the fitted search index with `knn`.
+    """
+    if knn.n_neighbors == k:
+        return knn
+    knn_k = copy.copy(knn)
+    knn_k.n_neighbors = k
+    return knn_k
+
+
 def _process_knn_graph_from_inputs(
     user_find_issues_kwargs: Dict[str, Any], statistics: Dict[str, Any], k_for_recomputation: int
 ) -> Optional[csr_matrix]:
@@ -61,7 +106,8 @@ def set_knn_graph(
     missing_knn_graph = knn_graph is None
     metric_changes = metric and metric != old_knn_metric
 
-    knn: Optional[NearestNeighbors] = None
+    # A fitted search index may be provided along with the knn graph it was used to construct
+    knn: Optional[NearestNeighbors] = find_issues_kwargs.get("knn", None)
     if missing_knn_graph or metric_changes:
         assert features is not None, "Features must be provided to compute the knn graph."
         knn_graph, knn = create_knn_graph_and_index(features, n_neighbors=k, metric=metric)
@@ -16,19 +16,29 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, ClassVar, Dict, Optional
+import warnings
 
 import numpy as np
+import pandas as pd
 from sklearn.neighbors import KNeighborsClassifier
 from sklearn.preprocessing import OneHotEncoder
 
 from cleanlab.classification import CleanLearning
 from cleanlab.count import get_confident_thresholds
 from cleanlab.datalab.internal.issue_manager import IssueManager
+from cleanlab.datalab.internal.issue_manager.knn_graph_helpers import (
+    _process_knn_graph_from_inputs,
+    num_neighbors_in_knn_graph,
+    same_knn_metric,
+)
 from cleanlab.internal.validation import assert_valid_inputs
+from cleanlab.rank import get_label_quality_scores
 
 if TYPE_CHECKING:  # pragma: no cover
     import numpy.typing as npt
-    import pandas as pd
+    from scipy.sparse import csr_matrix
+
+    from cleanlab.typing import Metric
 
     from cleanlab.datalab.datalab import Datalab
 
@@ -42,9 +52,16 @@ class LabelIssueManager(IssueManager):
         A Datalab instance.
 
     k :
-        The number of nearest neighbors to consider when computing pred_probs from features.
+        The number of nearest neighbors to consider when computing pred_probs from features (or a knn graph).
         Only applicable if features are provided and pred_probs are not.
 
+    metric :
+        The distance metric used to compute pred_probs from features.
+        If None, euclidean distances are used, as by :py:class:`~sklearn.neighbors.KNeighborsClassifier`.
+        The knn graph shared with the other issue managers (that use the default metric) is built with this metric.
+        A knn graph stored by an earlier call with a different metric is not reused.
+        Only applicable if pred_probs are not provided.
+
     clean_learning_kwargs :
         Keyword arguments to pass to the :py:meth:`CleanLearning <cleanlab.classification.CleanLearning>` constructor.
 
@@ -70,6 +87,7 @@ class LabelIssueManager(IssueManager):
         self,
         datalab: Datalab,
         k: int = 10,
+        metric: Optional[Metric] = None,
         clean_learning_kwargs: Optional[Dict[str, Any]] = None,
         health_summary_parameters: Optional[Dict[str, Any]] = None,
         **_,
@@ -77,6 +95,7 @@ class LabelIssueManager(IssueManager):
         super().__init__(datalab)
         self.cl = CleanLearning(**(clean_learning_kwargs or {}))
         self.k = k
+        self.metric = metric
         self.health_summary_parameters: Dict[str, Any] = (
             health_summary_parameters.copy() if health_summary_parameters else {}
         )
@@ -147,7 +166,8 @@ class LabelIssueManager(IssueManager):
             self._find_issues_inputs.update({"pred_probs": True})
         if pred_probs is None:
             self._find_issues_inputs.update({"features": True})
-            if features is None:
+            knn_graph = self._get_knn_graph(kwargs)
+            if features is None and knn_graph is None:
                 raise ValueError(
                     "Either pred_probs or features must be provided to find label issues."
                 )
@@ -160,26 +180,31 @@ class LabelIssueManager(IssueManager):
                 )
                 raise TypeError(error_msg)
 
-            knn = KNeighborsClassifier(n_neighbors=self.k + 1)
-            knn.fit(features, labels)
-            pred_probs = knn.predict_proba(features)
-
-            encoder = OneHotEncoder()
-            label_transform = labels.reshape(-1, 1)
-            one_hot_label = encoder.fit_transform(label_transform)
-
-            # adjust pred_probs so it is out-of-sample
-            pred_probs = np.asarray(
-                (pred_probs - 1 / (self.k + 1) * one_hot_label) * (self.k + 1) / self.k
-            )
+            if knn_graph is not None and (features is None or self._uses_graph_metric(kwargs)):
+                pred_probs = self._pred_probs_from_knn_graph(knn_graph, labels)
+            else:
+                knn_kwargs = {} if self.metric is None else {"metric": self.metric}
+                knn = KNeighborsClassifier(n_neighbors=self.k + 1, **knn_kwargs)
+                knn.fit(features, labels)
+                pred_probs = knn.predict_proba(features)
+
+                encoder = OneHotEncoder()
+                label_transform = labels.reshape(-1, 1)
+                one_hot_label = encoder.fit_transform(label_transform)
+
+                # adjust pred_probs so it is out-of-sample
+                pred_probs = np.asarray(
+                    (pred_probs - 1 / (self.k + 1) * one_hot_label) * (self.k + 1) / self.k
+                )
 
         self.health_summary_parameters.update({"pred_probs": pred_probs})
         # Find examples with label issues
         labels = self.datalab.labels
+        find_label_issues_kwargs = self._process_find_label_issues_kwargs(**kwargs)
         self.issues = self.cl.find_label_issues(
             labels=labels,
             pred_probs=pred_probs,
-            **self._process_find_label_issues_kwargs(**kwargs),
+            **find_label_issues_kwargs,
         )
         self.issues.rename(columns={"label_quality": self.issue_score_key}, inplace=True)
 
@@ -188,7 +213,9 @@ class LabelIssueManager(IssueManager):
         # Get a summarized dataframe of the label issues
         self.summary = self.make_summary(score=summary_dict["overall_label_health_score"])
 
-        confident_thresholds = get_confident_thresholds(labels=labels, pred_probs=pred_probs)
+        confident_thresholds = find_label_issues_kwargs.get("thresholds", None)
+        if confident_thresholds is None:
+            confident_thresholds = get_confident_thresholds(labels=labels, pred_probs=pred_probs)
         # Collect info about the label issues
         self.info = self.collect_info(
             issues=self.issues,
@@ -199,6 +226,110 @@ class LabelIssueManager(IssueManager):
         # Drop columns from issues that are in the info
         self.issues = self.issues.drop(columns=["given_label", "predicted_label"])
 
+    def update_issues(
+        self,
+        num_previous_examples: int,
+        pred_probs: Optional[npt.NDArray] = None,
+        **kwargs,
+    ) -> None:
+        """Scores the label quality of new examples appended to the dataset.
+
+        New examples are flagged with the confident thresholds used by the previous call to
+        :py:meth:`find_issues` (estimated from the data unless `thresholds` were given), and scored
+        with the same ``label_quality_scores_kwargs``: an example is a label issue if the most likely class among the classes
+        whose predicted probability exceeds their confident threshold differs from its given label.
+        The remaining info (e.g. the confident joint) is not re-estimated.
+
+        Parameters
+        ----------
+        num_previous_examples :
+            The number of examples in the dataset before the new examples were appended.
+
+        pred_probs :
+            The predicted probabilities for the new examples only.
+        """
+        previous_issues, info = self._get_previous_results(num_previous_examples)
+        if not info.get("find_issues_inputs", {}).get("pred_probs", False) or pred_probs is None:
+            raise NotImplementedError(
+                "Label issues can only be updated incrementally with pred_probs, "
+                "if they were found with pred_probs."
+            )
+        labels = self.datalab.labels
+        if not isinstance(labels, np.ndarray):
+            raise NotImplementedError("Label issues can only be updated for multi-class labels.")
+        labels = labels[num_previous_examples:]
+        confident_thresholds = np.asarray(info["confident_thresholds"])
+        pred_probs = np.asarray(pred_probs)
+        if pred_probs.shape != (len(labels), len(confident_thresholds)):
+            raise ValueError(
+                f"pred_probs must have shape {(len(labels), len(confident_thresholds))} "
+                f"for the new examples, but got {pred_probs.shape}."
+            )
+        confident_pred_probs = np.where(pred_probs >= confident_thresholds, pred_probs, -np.inf)
+        confident_label = np.argmax(confident_pred_probs, axis=1)
+        has_confident_label = np.isfinite(confident_pred_probs.max(axis=1))
+        is_issue = has_confident_label & (confident_label != labels)
+        scores = get_label_quality_scores(
+            labels, pred_probs, **info.get("label_quality_scores_kwargs", {})
+        )
+        new_issues = pd.DataFrame(
+            {f"is_{self.issue_name}_issue": is_issue, self.issue_score_key: scores}
+        )
+
+        info.update(
+            {
+                "given_label": list(info["given_label"]) + labels.tolist(),
+                "predicted_label": list(info["predicted_label"])
+                + pred_probs.argmax(axis=1).tolist(),
+            }
+        )
+        self._set_updated_results(previous_issues, new_issues, info)
+        num_label_issues = int(self.issues[f"is_{self.issue_name}_issue"].sum())
+        self.info.update(
+            {
+                "num_label_issues": num_label_issues,
+                "average_label_quality": self.issues[self.issue_score_key].mean(),
+            }
+        )
+        # Same as the overall label health score, with the flagged issues as the estimated number of issues
+        self.summary = self.make_summary(score=1 - num_label_issues / len(self.issues))
+
+    def _get_knn_graph(self, kwargs: Dict[str, Any]) -> Optional[csr_matrix]:
+        """Fetch a sufficiently large knn graph (provided or shared by other issue managers), if any."""
+        statistics = self.datalab.get_info("statistics")
+        if kwargs.get("knn_graph", None) is None and not self._uses_graph_metric(kwargs):
+            return None
+        return _process_knn_graph_from_inputs(kwargs, statistics, k_for_recomputation=self.k)
+
+    def _uses_graph_metric(self, kwargs: Dict[str, Any]) -> bool:
+        """Whether the stored knn graph was built with the metric of this issue manager
+        (euclidean distances by default)."""
+        graph_metric = self.datalab.get_info("statistics").get("knn_metric", None)
+        return same_knn_metric(self.metric, graph_metric)
+
+    def _pred_probs_from_knn_graph(self, knn_graph: csr_matrix, labels: np.ndarray) -> np.ndarray:
+        """Computes out-of-sample pred_probs as the fraction of each example's `k` nearest neighbors
+        in the knn graph that share each label.
+
+        Each example is excluded from its own neighbors in the knn graph, so this matches
+        the leave-one-out adjustment of a neighbor vote that includes the example itself.
+        """
+        N = knn_graph.shape[0]
+        num_neighbors = num_neighbors_in_knn_graph(knn_graph)
+        if num_neighbors < self.k:
+            warnings.warn(
+                f"The knn graph only has {num_neighbors} neighbors per example, fewer than k={self.k}. "
+                f"Label issues are found from the votes of {num_neighbors} neighbors instead."
+            )
+        k = min(self.k, num_neighbors)
+        num_classes = max(len(self.datalab._label_map), int(labels.max()) + 1)
+        neighbor_labels = labels[knn_graph.indices.reshape(N, -1)[:, :k]]
+        votes = np.bincount(
+            (np.arange(N).reshape(-1, 1) * num_classes + neighbor_labels).ravel(),
+            minlength=N * num_classes,
+        )
+        return votes.reshape(N, num_classes) / k
+
     def get_health_summary(self, pred_probs) -> dict:
         """Returns a short summary of the health of this Lab."""
         from cleanlab.dataset import health_summary
@@ -253,7 +384,7 @@ class LabelIssueManager(IssueManager):
         )
 
     def collect_info(
-        self, issues: pd.DataFrame, summary_dict: dict, confident_thresholds: np.ndarray
+        self, issues: pd.DataFrame, summary_dict: dict, confident_thresholds: npt.ArrayLike
     ) -> dict:
         issues_info = {
             "num_label_issues": sum(issues[f"is_{self.issue_name}_issue"]),
@@ -278,7 +409,8 @@ class LabelIssueManager(IssueManager):
             **issues_info,
             **health_summary_info,
             **cl_info,
-            "confident_thresholds": confident_thresholds.tolist(),
+            "confident_thresholds": np.asarray(confident_thresholds).tolist(),
+            "label_quality_scores_kwargs": dict(self.cl.label_quality_scores_kwargs or {}),
             "find_issues_inputs": self._find_issues_inputs,
         }
 
@@ -15,12 +15,14 @@
 # along with cleanlab.  If not, see <https://www.gnu.org/licenses/>.
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, ClassVar, Dict, List
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, List, Tuple
 
+import numpy as np
 import pandas as pd
 
+from cleanlab.count import _get_confident_thresholds_multilabel
 from cleanlab.datalab.internal.issue_manager import IssueManager
-from cleanlab.internal.multilabel_utils import onehot2int
+from cleanlab.internal.multilabel_utils import int2onehot, onehot2int
 from cleanlab.multilabel_classification.filter import find_label_issues
 from cleanlab.multilabel_classification.rank import get_label_quality_scores
 
@@ -138,13 +140,81 @@ class MultilabelIssueManager(IssueManager):
         self.summary = self.make_summary(score=scores.mean())
 
         # Collect info about the label issues
-        self.info = self.collect_info(self.datalab.labels, predicted_labels)
+        confident_thresholds = _get_confident_thresholds_multilabel(
+            labels=self.datalab.labels, pred_probs=pred_probs
+        )
+        self.info = self.collect_info(
+            self.datalab.labels,
+            predicted_labels,
+            confident_thresholds=confident_thresholds,
+            label_quality_scores_kwargs=self._process_get_label_quality_scores_kwargs(**kwargs),
+        )
 
     def collect_info(
-        self, given_labels: List[List[int]], predicted_labels: List[List[int]]
+        self,
+        given_labels: List[List[int]],
+        predicted_labels: List[List[int]],
+        confident_thresholds: npt.NDArray,
+        label_quality_scores_kwargs: Dict[str, Any],
     ) -> Dict[str, Any]:
         issues_info = {
             "given_label": given_labels,
             "predicted_label": predicted_labels,
+            "confident_thresholds": confident_thresholds.tolist(),
+            "label_quality_scores_kwargs": label_quality_scores_kwargs,
+            "find_issues_inputs": {"pred_probs": True},
         }
         return issues_info
+
+    @staticmethod
+    def score_new_labels(
+        labels: List[List[int]], pred_probs: npt.NDArray, info: Dict[str, Any]
+    ) -> Tuple[npt.NDArray, npt.NDArray]:
+        """Scores the labels of new examples relative to the dataset that was checked with `pred_probs`.
+
+        For each class, a new example is considered to be confidently predicted (not) to belong
+        to the class if its predicted probability for that outcome reaches the per-class threshold
+        estimated on the original dataset, in the same one-vs-rest setting as
+        :py:func:`multilabel_classification.filter.find_label_issues <cleanlab.multilabel_classification.filter.find_label_issues>`.
+        An example is flagged if it is confidently predicted to disagree with its given label for any class.
+
+        Parameters
+        ----------
+        labels :
+            The given labels of the new examples, in the same ``List[List[int]]`` format as the original dataset.
+        pred_probs :
+            The predicted probabilities of the new examples.
+        info :
+            The info collected by this issue manager after checking the original dataset.
+
+        Returns
+        -------
+        scores :
+            The label quality score of each new example.
+        is_issue :
+            Whether each new example has a label issue.
+        """
+        confident_thresholds = np.asarray(info["confident_thresholds"])
+        num_classes = len(confident_thresholds)
+        pred_probs = np.asarray(pred_probs)
+        if pred_probs.ndim != 2 or pred_probs.shape[1] != num_classes:
+            raise ValueError(
+                f"pred_probs must have shape (N, {num_classes}), got {pred_probs.shape} instead."
+            )
+        scores = get_label_quality_scores(
+            labels=labels,
+            pred_probs=pred_probs,
+            **info.get("label_quality_scores_kwargs", {}),
+        )
+
+        # One-vs-rest outcomes whose predicted probability reaches their confident threshold
+        given_binary_labels = int2onehot(labels, K=num_classes).astype(bool)
+        confident_negative = 1 - pred_probs >= confident_thresholds[:, 0]
+        confident_positive = pred_probs >= confident_thresholds[:, 1]
+        # If both outcomes are confident, the more likely one is the confident label
+        confident_label = np.where(
+            confident_positive & confident_negative, pred_probs > 0.5, confident_positive
+        )
+        is_confident = confident_positive | confident_negative
+        is_issue = np.any(is_confident & (confident_label != given_binary_labels), axis=1)
+        return scores, is_issue
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Callable, ClassVar, Dict, Optional, Union, cast
-import itertools
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Dict, List, Optional, Union, cast
+from concurrent.futures import ThreadPoolExecutor
+import os
 
 from scipy.stats import gaussian_kde
 import numpy as np
@@ -76,6 +77,17 @@ class NonIIDIssueManager(IssueManager):
     num_permutations :
         The number of trials to run when performing permutation testing to determine whether
         the distribution of index-distances between neighbors in the dataset is IID or not.
+        Permutations are generated and evaluated a few at a time, so memory usage does not grow
+        with the number of permutations.
+
+    n_jobs :
+        Number of threads used to evaluate permutations concurrently.
+        If None or 1, permutations are evaluated one after the other. If -1, all CPUs are used.
+
+    early_stopping :
+        Whether to stop the permutation test once the p-value is clearly below
+        (by a factor of 10) or clearly above (by a factor of 10) the `significance_threshold`,
+        after at least 10 permutations have been evaluated.
 
     Note
     ----
@@ -108,6 +120,8 @@ class NonIIDIssueManager(IssueManager):
         num_permutations: int = 25,
         seed: Optional[int] = 0,
         significance_threshold: float = 0.05,
+        n_jobs: Optional[int] = None,
+        early_stopping: bool = False,
         **_,
     ):
         super().__init__(datalab)
@@ -118,8 +132,11 @@ class NonIIDIssueManager(IssueManager):
             "ks": simplified_kolmogorov_smirnov_test,
         }
         self.background_distribution = None
+        self._background_cdf: Optional[np.ndarray] = None
         self.seed = seed
         self.significance_threshold = significance_threshold
+        self.n_jobs = n_jobs
+        self.early_stopping = early_stopping
 
         # TODO: Temporary flag introduced to decide on storing knn graphs based on pred_probs.
         # Revisit and finalize the implementation.
@@ -227,6 +244,7 @@ class NonIIDIssueManager(IssueManager):
     def collect_info(self, knn_graph: csr_matrix) -> dict:
         issues_dict = {
             "p-value": self.p_value,
+            "num_permutations_evaluated": self.num_permutations_evaluated,
         }
 
         params_dict = {
@@ -269,35 +287,49 @@ class NonIIDIssueManager(IssueManager):
 
         if self.seed is not None:
             np.random.seed(self.seed)
-        perms = np.fromiter(
-            itertools.chain.from_iterable(
-                np.random.permutation(N) for i in range(num_permutations)
-            ),
-            dtype=int,
-        ).reshape(num_permutations, N)
-
-        neighbor_index_choices = self.neighbor_index_choices
-        neighbor_index_choices = neighbor_index_choices.reshape(1, *neighbor_index_choices.shape)
-        perm_neighbor_choices = perms[:, neighbor_index_choices].reshape(
-            num_permutations, *neighbor_index_choices.shape[1:]
-        )
-        neighbor_index_distances = np.abs(perms[..., None] - perm_neighbor_choices).reshape(
-            num_permutations, -1
-        )
-
-        statistics = []
-        for neighbor_index_dist in neighbor_index_distances:
-            stats = self._get_statistics(
-                neighbor_index_dist,
-            )
-            statistics.append(stats)
-
-        ks_stats = np.array([stats["ks"] for stats in statistics])
+        # Computed up front, as it is shared by all permutations
+        self._get_background_cdf()
+        num_workers = (os.cpu_count() or 1) if self.n_jobs == -1 else (self.n_jobs or 1)
+
+        def permuted_statistic(perm: np.ndarray) -> float:
+            neighbor_index_distances = np.abs(perm[:, None] - perm[self.neighbor_index_choices])
+            return self._get_statistics(neighbor_index_distances)["ks"]
+
+        # Only `num_workers` permutations are held in memory at a time
+        ks_stats: List[float] = []
+        executor = ThreadPoolExecutor(max_workers=num_workers) if num_workers > 1 else None
+        try:
+            while len(ks_stats) < num_permutations:
+                chunk_size = min(num_workers, num_permutations - len(ks_stats))
+                perms = [np.random.permutation(N) for _ in range(chunk_size)]
+                if executor is None:
+                    ks_stats.extend(map(permuted_statistic, perms))
+                else:
+                    ks_stats.extend(executor.map(permuted_statistic, perms))
+                if self.early_stopping and self._p_value_is_decided(ks_stats):
+                    break
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        self.num_permutations_evaluated = len(ks_stats)
+        return self._get_p_value(ks_stats)
+
+    def _get_p_value(self, ks_stats: List[float]) -> float:
         ks_stats_kde = gaussian_kde(ks_stats)
         p_value = ks_stats_kde.integrate_box(self.statistics["ks"], 100)
-
         return p_value
 
+    def _p_value_is_decided(self, ks_stats: List[float], min_permutations: int = 10) -> bool:
+        """Whether the p-value is far enough from the significance threshold that more
+        permutations would not change the outcome of the test."""
+        if len(ks_stats) < min_permutations or np.ptp(ks_stats) == 0:
+            return False
+        p_value = self._get_p_value(ks_stats)
+        return (
+            p_value < self.significance_threshold / 10 or p_value > self.significance_threshold * 10
+        )
+
     def _score_dataset(self) -> npt.NDArray[np.float64]:
         """This function computes a variant of the KS statistic for each
         datapoint. Rather than computing the maximum difference
@@ -423,6 +455,15 @@ class NonIIDIssueManager(IssueManager):
         kneighbors = knn_graph.indices.reshape(self.N, -1)
         return kneighbors
 
+    def _get_background_cdf(self) -> np.ndarray:
+        """CDF of the index distance between two examples drawn at random from the dataset."""
+        if self.background_distribution is None or self._background_cdf is None:
+            self.background_distribution = (self.N - np.arange(1, self.N)) / (
+                self.N * (self.N - 1) / 2
+            )
+            self._background_cdf = np.cumsum(self.background_distribution)
+        return cast(np.ndarray, self._background_cdf)
+
     def _get_statistics(
         self,
         neighbor_index_distances,
@@ -431,13 +472,7 @@ class NonIIDIssueManager(IssueManager):
         sorted_neighbors = np.sort(neighbor_index_distances)
         sorted_neighbors = np.hstack([sorted_neighbors, np.ones((1)) * (self.N - 1)]).astype(int)
 
-        if self.background_distribution is None:
-            self.background_distribution = (self.N - np.arange(1, self.N)) / (
-                self.N * (self.N - 1) / 2
-            )
-
-        background_distribution = cast(np.ndarray, self.background_distribution)
-        background_cdf = np.cumsum(background_distribution)
+        background_cdf = self._get_background_cdf()
 
         foreground_cdf = np.arange(sorted_neighbors.shape[0]) / (sorted_neighbors.shape[0] - 1)
 
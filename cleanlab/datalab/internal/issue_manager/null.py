@@ -1,7 +1,6 @@
 from __future__ import annotations
 
-from collections import Counter
-from typing import TYPE_CHECKING, Any, ClassVar, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, Iterator, List, Optional
 
 import numpy as np
 import pandas as pd
@@ -11,6 +10,9 @@ from cleanlab.datalab.internal.issue_manager import IssueManager
 if TYPE_CHECKING:  # pragma: no cover
     import numpy.typing as npt
 
+NULL_TRACKER_CHUNK_SIZE = 2**26
+"""Maximum number of entries of the null mask that are held in memory at once."""
+
 
 class NullIssueManager(IssueManager):
     """Manages issues related to null/missing values in the rows of features.
@@ -33,18 +35,56 @@ class NullIssueManager(IssueManager):
     }
 
     @staticmethod
+    def _null_tracker_chunks(
+        features: npt.NDArray[Any] | pd.DataFrame,
+    ) -> Iterator[tuple[int, int, npt.NDArray[np.bool_]]]:
+        """Yields the null mask of the features in chunks of consecutive columns, along with the
+        column range of each chunk.
+
+        Each chunk holds at most ``NULL_TRACKER_CHUNK_SIZE`` entries (but at least 8 columns),
+        so the full boolean mask of a large table never has to be held in memory at once.
+        DataFrames are checked column-wise with :py:meth:`pandas.DataFrame.isna`,
+        without converting them to an object array first.
+        """
+        num_rows, cols = features.shape
+        columns_per_chunk = max(NULL_TRACKER_CHUNK_SIZE // max(num_rows, 1) // 8, 1) * 8
+        for start in range(0, cols, columns_per_chunk):
+            stop = min(start + columns_per_chunk, cols)
+            if isinstance(features, pd.DataFrame):
+                chunk = features.iloc[:, start:stop].isna().to_numpy(dtype=bool)
+            else:
+                chunk = np.asarray(pd.isna(features[:, start:stop]), dtype=bool)
+            yield start, stop, chunk
+
+    @classmethod
     def _calculate_null_issues(
-        features: npt.NDArray[Any],
-    ) -> tuple[npt.NDArray[np.bool_], npt.NDArray[np.float64], npt.NDArray[np.bool_]]:
+        cls,
+        features: npt.NDArray[Any] | pd.DataFrame,
+    ) -> tuple[
+        npt.NDArray[np.bool_],
+        npt.NDArray[np.float64],
+        npt.NDArray[np.uint8],
+        npt.NDArray[np.float64],
+    ]:
         """Tracks the number of null values in each row of a feature array,
         computes quality scores based on the fraction of null values in each row,
-        and returns a boolean array indicating whether each row only has null values."""
-        cols = features.shape[1]
-        null_tracker = pd.isna(features)
-        non_null_count = cols - null_tracker.sum(axis=1)
+        and returns a boolean array indicating whether each row only has null values.
+
+        The null mask is returned bit-packed along the columns (see :py:func:`numpy.packbits`),
+        together with the fraction of null values in each column."""
+        num_rows, cols = features.shape
+        null_count = np.zeros(num_rows, dtype=np.int64)
+        null_tracker = np.zeros((num_rows, (cols + 7) // 8), dtype=np.uint8)
+        column_null_fraction = np.zeros(cols, dtype=np.float64)
+        for start, stop, chunk in cls._null_tracker_chunks(features):
+            null_count += chunk.sum(axis=1)
+            null_tracker[:, start // 8 : (stop + 7) // 8] = np.packbits(chunk, axis=1)
+            if num_rows > 0:
+                column_null_fraction[start:stop] = chunk.mean(axis=0)
+        non_null_count = cols - null_count
         scores = non_null_count / cols
         is_null_issue = non_null_count == 0
-        return is_null_issue, scores, null_tracker
+        return is_null_issue, scores, null_tracker, column_null_fraction
 
     def find_issues(
         self,
@@ -53,11 +93,10 @@ class NullIssueManager(IssueManager):
     ) -> None:
         if features is None:
             raise ValueError("features must be provided to check for null values.")
-        # Support features as a numpy array. Temporarily allow this issuecheck to convert a DataFrame to a numpy array.
-        if isinstance(features, pd.DataFrame):
-            features = features.to_numpy()
 
-        is_null_issue, scores, null_tracker = self._calculate_null_issues(features=features)
+        is_null_issue, scores, null_tracker, column_null_fraction = self._calculate_null_issues(
+            features=features
+        )
 
         self.issues = pd.DataFrame(
             {
@@ -67,11 +106,14 @@ class NullIssueManager(IssueManager):
         )
 
         self.summary = self.make_summary(score=scores.mean())
-        self.info = self.collect_info(null_tracker)
+        self.info = self.collect_info(
+            null_tracker, num_columns=features.shape[1], column_null_fraction=column_null_fraction
+        )
 
     @staticmethod
     def _most_common_issue(
         null_tracker: np.ndarray,
+        num_columns: int,
     ) -> dict[str, dict[str, str | int | list[int] | list[int | None]]]:
         """
         Identify and return the most common null value pattern across all rows
@@ -80,33 +122,39 @@ class NullIssueManager(IssueManager):
         Parameters
         ------------
         null_tracker : np.ndarray
-            A boolean array of the same shape as features, where True indicates null/missing entries.
+            A bit-packed array with one row per example, where the bits of each row
+            indicate which of its entries are null/missing (see :py:func:`numpy.packbits`).
+        num_columns : int
+            The number of feature columns encoded in each row of `null_tracker`.
 
         Returns
         --------
         Dict[str, Any]
             A dictionary containing the most common issue pattern and the count of rows with this pattern.
         """
-        # Convert the boolean null_tracker matrix into a list of strings.
         most_frequent_pattern = "no_null"
         rows_affected: List[int] = []
         occurrence_of_most_frequent_pattern = 0
-        if np.any(null_tracker, axis=None):
-            null_row_indices = np.where(np.any(null_tracker, axis=1))[0]
-            null_patterns_as_strings = [
-                "".join(map(str, null_tracker[i].astype(int).tolist())) for i in null_row_indices
-            ]
-
-            # Use Counter to efficiently count occurrences and find the most common pattern.
-            pattern_counter = Counter(null_patterns_as_strings)
-            (
-                most_frequent_pattern,
-                occurrence_of_most_frequent_pattern,
-            ) = pattern_counter.most_common(1)[0]
-            rows_affected = []
-            for idx, row in enumerate(null_patterns_as_strings):
-                if row == most_frequent_pattern:
-                    rows_affected.append(int(null_row_indices[idx]))
+        null_row_indices = np.flatnonzero(null_tracker.any(axis=1))
+        if null_row_indices.size > 0:
+            # View each packed row as a single opaque value, so that identical patterns
+            # can be counted with a single sort.
+            null_rows = np.ascontiguousarray(null_tracker[null_row_indices])
+            null_patterns = null_rows.view(np.dtype((np.void, null_rows.shape[1]))).ravel()
+            _, first_occurrence, pattern_ids, counts = np.unique(
+                null_patterns, return_index=True, return_inverse=True, return_counts=True
+            )
+
+            # Break ties in favor of the pattern that occurs first.
+            candidates = np.flatnonzero(counts == counts.max())
+            most_common_id = candidates[np.argmin(first_occurrence[candidates])]
+
+            pattern_bits = np.unpackbits(
+                null_rows[first_occurrence[most_common_id]], count=num_columns
+            )
+            most_frequent_pattern = "".join(map(str, pattern_bits.tolist()))
+            occurrence_of_most_frequent_pattern = int(counts[most_common_id])
+            rows_affected = null_row_indices[pattern_ids.ravel() == most_common_id].tolist()
         return {
             "most_common_issue": {
                 "pattern": most_frequent_pattern,
@@ -116,15 +164,15 @@ class NullIssueManager(IssueManager):
         }
 
     @staticmethod
-    def _column_impact(null_tracker: np.ndarray) -> Dict[str, List[float]]:
+    def _column_impact(column_null_fraction: np.ndarray) -> Dict[str, List[float]]:
         """
-        Calculate and return the impact of null values per column, represented as the proportion
+        Return the impact of null values per column, represented as the proportion
         of rows having null values in each column.
 
         Parameters
         ----------
-        null_tracker : np.ndarray
-            A boolean array of the same shape as features, where True indicates null/missing entries.
+        column_null_fraction : np.ndarray
+            The proportion of null/missing entries in each column.
 
         Returns
         -------
@@ -132,15 +180,15 @@ class NullIssueManager(IssueManager):
             A dictionary containing the impact per column, with values being a list
             where each element is the percentage of rows having null values in the corresponding column.
         """
-        # Calculate proportion of nulls in each column
-        proportion_of_nulls_per_column = null_tracker.mean(axis=0)
-
-        # Return result as a dictionary containing a list of proportions
-        return {"column_impact": proportion_of_nulls_per_column.tolist()}
+        return {"column_impact": column_null_fraction.tolist()}
 
-    def collect_info(self, null_tracker: np.ndarray) -> dict:
-        most_common_issue = self._most_common_issue(null_tracker=null_tracker)
-        column_impact = self._column_impact(null_tracker=null_tracker)
+    def collect_info(
+        self, null_tracker: np.ndarray, num_columns: int, column_null_fraction: np.ndarray
+    ) -> dict:
+        most_common_issue = self._most_common_issue(
+            null_tracker=null_tracker, num_columns=num_columns
+        )
+        column_impact = self._column_impact(column_null_fraction=column_null_fraction)
         average_null_score = {"average_null_score": self.issues[self.issue_score_key].mean()}
         issues_dict = {**average_null_score, **most_common_issue, **column_impact}
         info_dict: Dict[str, Any] = {**issues_dict}
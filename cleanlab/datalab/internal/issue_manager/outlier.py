@@ -195,6 +195,87 @@ class OutlierIssueManager(IssueManager):
 
         self.info = self.collect_info(issue_threshold=issue_threshold, knn_graph=knn_graph, knn=knn)
 
+    def update_issues(
+        self,
+        num_previous_examples: int,
+        features: Optional[npt.NDArray] = None,
+        pred_probs: Optional[np.ndarray] = None,
+        **kwargs,
+    ) -> None:
+        """Scores new examples appended to the dataset as outliers, relative to the previously audited examples.
+
+        If the previous call to :py:meth:`find_issues` used features, the new examples are scored by
+        their distances to their `k` nearest neighbors in the stored search index. Otherwise, they are
+        scored with the fitted :py:class:`OutOfDistribution <cleanlab.outlier.OutOfDistribution>` object.
+        The issue thresholds from the previous run are reused, and the scores of the previously audited
+        examples are left as they are.
+
+        Parameters
+        ----------
+        num_previous_examples :
+            The number of examples in the dataset before the new examples were appended.
+
+        features :
+            The features of the new examples only.
+
+        pred_probs :
+            The predicted probabilities for the new examples only.
+        """
+        previous_issues, info = self._get_previous_results(num_previous_examples)
+        issue_threshold = info["issue_threshold"]
+        knn = info.get("knn", None)
+        if knn is not None and features is not None:
+            scores, is_issue_column, distances, indices = self.score_new_features(features, info)
+            info.update(
+                {
+                    "nearest_neighbor": info["nearest_neighbor"] + indices[:, 0].tolist(),
+                    "distance_to_nearest_neighbor": info["distance_to_nearest_neighbor"]
+                    + distances[:, 0].tolist(),
+                }
+            )
+        elif info.get("find_issues_inputs", {}).get("pred_probs", False) and pred_probs is not None:
+            scores = info["ood"].score(pred_probs=pred_probs)
+            is_issue_column = scores < issue_threshold
+        else:
+            raise NotImplementedError(
+                "Outlier issues can only be updated with the same inputs used to find them, "
+                "and features require a stored search index."
+            )
+
+        new_issues = pd.DataFrame(
+            {f"is_{self.issue_name}_issue": is_issue_column, self.issue_score_key: scores}
+        )
+        self._set_updated_results(previous_issues, new_issues, info)
+        self.info["average_ood_score"] = self.issues[self.issue_score_key].mean()
+
+    @staticmethod
+    def score_new_features(
+        features: npt.NDArray, info: Dict[str, Any]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Scores examples that were not part of the original dataset, using the search index stored in
+        the `info` of a previous feature-based outlier check.
+
+        A single nearest neighbor query provides the distances used for both the outlier scores
+        and the issue decisions (``average distance > info["issue_threshold"]``).
+
+        Returns
+        -------
+        scores, is_issue, distances, indices :
+            The outlier score and issue flag of each example,
+            and the distances and indices of its nearest neighbors in the original dataset.
+        """
+        distances, indices = info["knn"].kneighbors(features, n_neighbors=info["k"])
+        avg_distances = distances.mean(axis=1)
+        scores = transform_distances_to_scores(
+            avg_distances, t=info["t"], scaling_factor=info["scaling_factor"]
+        )
+        metric = info["metric"]
+        if metric is not None:
+            metric = metric if isinstance(metric, str) else metric.__name__
+            scores = correct_precision_errors(scores, avg_distances, metric)
+        is_issue = avg_distances > info["issue_threshold"]
+        return scores, is_issue, distances, indices
+
     def _knn_graph_works(self, features, kwargs, statistics, k: int) -> bool:
         """Decide whether to skip the knn-based outlier detection and rely on pred_probs instead."""
         sufficient_knn_graph_available = knn_exists(kwargs, statistics, k)
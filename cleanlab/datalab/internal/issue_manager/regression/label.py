@@ -16,13 +16,18 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, ClassVar, Dict, Optional
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, Optional, Tuple
 import numpy as np
 import pandas as pd
 
+from cleanlab.internal.regression_utils import assert_valid_prediction_inputs
 from cleanlab.regression.learn import CleanLearning
 from cleanlab.datalab.internal.issue_manager import IssueManager
-from cleanlab.regression.rank import get_label_quality_scores
+from cleanlab.regression.rank import (
+    _get_residual_score_for_each_label,
+    _OutreScorer,
+    get_label_quality_scores,
+)
 
 if TYPE_CHECKING:  # pragma: no cover
     from cleanlab.datalab.datalab import Datalab
@@ -73,6 +78,8 @@ class RegressionLabelIssueManager(IssueManager):
         # This is a field for prioritizing features only when using a custom model
         self._uses_custom_model = "model" in (clean_learning_kwargs or {})
         self.threshold = threshold
+        self._find_issues_inputs: Dict[str, bool] = {"features": False, "predictions": False}
+        self._scoring_info: Dict[str, Any] = {}
 
     def find_issues(
         self,
@@ -101,6 +108,8 @@ class RegressionLabelIssueManager(IssueManager):
         # If features are provided and either a custom model is used or no predictions are provided
         use_features = features is not None and (self._uses_custom_model or predictions is None)
         labels = self.datalab.labels
+        self._find_issues_inputs = {"features": False, "predictions": False}
+        self._scoring_info = {}
         if not isinstance(labels, np.ndarray):
             error_msg = (
                 f"Expected labels to be a numpy array of shape (n_samples,) to use with RegressionLabelIssueManager, "
@@ -116,15 +125,17 @@ class RegressionLabelIssueManager(IssueManager):
                 **kwargs,  # function sanitizes kwargs
             )
             self.issues.rename(columns={"label_quality": self.issue_score_key}, inplace=True)
+            self._find_issues_inputs.update({"features": True})
 
         # Otherwise, if predictions are provided, process them
         else:
             assert predictions is not None  # mypy won't narrow the type for some reason
-            self.issues = find_issues_with_predictions(
+            self.issues, self._scoring_info = _find_issues_with_predictions(
                 predictions=predictions,
                 y=labels,
                 **{**kwargs, **{"threshold": self.threshold}},  # function sanitizes kwargs
             )
+            self._find_issues_inputs.update({"predictions": True})
 
         # Get a summarized dataframe of the label issues
         self.summary = self.make_summary(score=self.issues[self.issue_score_key].mean())
@@ -151,10 +162,54 @@ class RegressionLabelIssueManager(IssueManager):
             **issues_info,
             **health_summary_info,
             **cl_info,
+            **self._scoring_info,
+            "find_issues_inputs": self._find_issues_inputs,
         }
 
         return info_dict
 
+    @staticmethod
+    def score_new_labels(
+        labels: np.ndarray, predictions: np.ndarray, info: Dict[str, Any]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Scores the labels of new examples relative to the dataset that was checked with `predictions`.
+
+        The scores are computed with the same method as for the original dataset, standardizing
+        the labels and residuals with the statistics of the original dataset, and examples are
+        flagged with the same absolute threshold on the scores.
+
+        Parameters
+        ----------
+        labels :
+            The given labels of the new examples.
+        predictions :
+            The predicted labels of the new examples.
+        info :
+            The info collected by this issue manager after checking the original dataset with `predictions`.
+
+        Returns
+        -------
+        scores :
+            The label quality score of each new example.
+        is_issue :
+            Whether each new example has a label issue.
+        """
+        method = info.get("scoring_method")
+        if method is None:
+            raise ValueError(
+                "The label issues of the original dataset must have been found with `predictions` "
+                "to score new examples."
+            )
+        labels, predictions = assert_valid_prediction_inputs(
+            labels=labels, predictions=predictions, method=method
+        )
+        if method == "outre":
+            scores = info["outre_scorer"].score(labels, predictions)
+        else:
+            scores = _get_residual_score_for_each_label(labels, predictions)
+        is_issue = scores < info["issue_threshold"]
+        return scores, is_issue
+
 
 def find_issues_with_predictions(
     predictions: np.ndarray,
@@ -194,13 +249,33 @@ def find_issues_with_predictions(
         - predicted_label : float
             The predicted label. It is the same as the predictions parameter.
     """
-    _accepted_kwargs = ["method"]
-    _kwargs = {k: kwargs.get(k) for k in _accepted_kwargs}
-    _kwargs = {k: v for k, v in _kwargs.items() if v is not None}
-    quality_scores = get_label_quality_scores(labels=y, predictions=predictions, **_kwargs)
+    issues, _ = _find_issues_with_predictions(predictions, y, threshold, **kwargs)
+    return issues
+
+
+def _find_issues_with_predictions(
+    predictions: np.ndarray,
+    y: np.ndarray,
+    threshold: float,
+    **kwargs,
+) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    """Same as `find_issues_with_predictions`, but also returns the information needed to
+    score new examples consistently with this dataset (see `RegressionLabelIssueManager.score_new_labels`).
+    """
+    method = kwargs.get("method") or "outre"
+    outre_scorer = None
+    if method == "outre":
+        # Keep the fitted scorer, which holds the residual statistics of the dataset
+        outre_scorer = _OutreScorer()
+        quality_scores = outre_scorer.fit_score(
+            *assert_valid_prediction_inputs(labels=y, predictions=predictions, method=method)
+        )
+    else:
+        quality_scores = get_label_quality_scores(labels=y, predictions=predictions, method=method)
 
     median_score = np.median(quality_scores)
-    is_label_issue_mask = quality_scores < median_score * threshold
+    issue_threshold = float(median_score * threshold)
+    is_label_issue_mask = quality_scores < issue_threshold
 
     issues = pd.DataFrame(
         {
@@ -210,7 +285,12 @@ def find_issues_with_predictions(
             "predicted_label": predictions,
         }
     )
-    return issues
+    scoring_info = {
+        "scoring_method": method,
+        "issue_threshold": issue_threshold,
+        "outre_scorer": outre_scorer,
+    }
+    return issues, scoring_info
 
 
 def find_issues_with_features(
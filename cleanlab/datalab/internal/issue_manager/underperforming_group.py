@@ -22,6 +22,7 @@ import inspect
 import numpy as np
 import pandas as pd
 from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import connected_components
 from sklearn.cluster import DBSCAN
 
 from cleanlab.datalab.internal.issue_manager import IssueManager
@@ -35,6 +36,8 @@ if TYPE_CHECKING:  # pragma: no cover
 
 CLUSTERING_ALGO = "DBSCAN"
 CLUSTERING_PARAMS_DEFAULT = {"metric": "precomputed"}
+CONNECTED_COMPONENTS_ALGO = "connected_components"
+DBSCAN_EPS_DEFAULT = inspect.signature(DBSCAN).parameters["eps"].default
 
 
 class UnderperformingGroupIssueManager(IssueManager):
@@ -44,6 +47,12 @@ class UnderperformingGroupIssueManager(IssueManager):
     Note: The `min_cluster_samples` argument should not be confused with the
     `min_samples` argument of sklearn.cluster.DBSCAN.
 
+    Clustering is done with DBSCAN on the knn graph by default. For large datasets, set
+    ``clustering_algorithm="connected_components"`` to instead group examples that are connected by
+    edges of the knn graph no longer than ``clustering_kwargs["eps"]`` (default 0.5, as for DBSCAN),
+    which only takes time linear in the size of the knn graph. Examples that are not connected to any
+    other example are treated as outliers.
+
     Examples
     --------
     >>> from cleanlab import Datalab
@@ -82,6 +91,7 @@ class UnderperformingGroupIssueManager(IssueManager):
         k: int = 10,
         clustering_kwargs: Dict[str, Any] = {},
         min_cluster_samples: int = 5,
+        clustering_algorithm: str = CLUSTERING_ALGO,
         **_: Any,
     ):
         super().__init__(datalab)
@@ -90,6 +100,12 @@ class UnderperformingGroupIssueManager(IssueManager):
         self.k = k
         self.clustering_kwargs = clustering_kwargs
         self.min_cluster_samples = min_cluster_samples
+        if clustering_algorithm not in (CLUSTERING_ALGO, CONNECTED_COMPONENTS_ALGO):
+            raise ValueError(
+                f"clustering_algorithm must be one of {[CLUSTERING_ALGO, CONNECTED_COMPONENTS_ALGO]}, "
+                f"got {clustering_algorithm}."
+            )
+        self.clustering_algorithm = clustering_algorithm
 
     def find_issues(
         self,
@@ -154,6 +170,8 @@ class UnderperformingGroupIssueManager(IssueManager):
         Returns:
             cluster_ids (npt.NDArray[np.int_]): Cluster IDs for each datapoint.
         """
+        if self.clustering_algorithm == CONNECTED_COMPONENTS_ALGO:
+            return self._connected_components(knn_graph)
         DBSCAN_VALID_KEYS = inspect.signature(DBSCAN).parameters.keys()
         dbscan_params = {
             key: value
@@ -162,9 +180,28 @@ class UnderperformingGroupIssueManager(IssueManager):
         }
         dbscan_params["metric"] = "precomputed"
         clusterer = DBSCAN(**dbscan_params)
-        cluster_ids = clusterer.fit_predict(
-            knn_graph.copy()
-        )  # Copy to avoid modification by DBSCAN
+        # DBSCAN inserts the diagonal into the matrix it is given, which does not touch the arrays
+        # of knn_graph when it is given a new matrix object that shares them
+        knn_graph_view = csr_matrix(
+            (knn_graph.data, knn_graph.indices, knn_graph.indptr), shape=knn_graph.shape
+        )
+        cluster_ids = clusterer.fit_predict(knn_graph_view)
+        return cluster_ids
+
+    def _connected_components(self, knn_graph: csr_matrix) -> npt.NDArray[np.int_]:
+        """Cluster datapoints into the connected components of the knn graph, keeping only
+        the edges shorter than `eps`. Datapoints without such edges get the outlier label -1."""
+        eps = self.clustering_kwargs.get("eps", DBSCAN_EPS_DEFAULT)
+        mask = knn_graph.data <= eps
+        # Number of kept edges before each row
+        indptr = np.concatenate([[0], np.cumsum(mask)])[knn_graph.indptr]
+        graph = csr_matrix(
+            (np.ones(indptr[-1], dtype=bool), knn_graph.indices[mask], indptr),
+            shape=knn_graph.shape,
+        )
+        _, cluster_ids = connected_components(graph, directed=True, connection="weak")
+        cluster_sizes = np.bincount(cluster_ids)
+        cluster_ids[cluster_sizes[cluster_ids] == 1] = self.OUTLIER_CLUSTER_LABELS[0]
         return cluster_ids
 
     def filter_cluster_ids(self, cluster_ids: npt.NDArray[np.int_]) -> npt.NDArray[np.int_]:
@@ -179,18 +216,11 @@ class UnderperformingGroupIssueManager(IssueManager):
             removing outlier clusters and clusters with less than `self.min_cluster_samples`
             number of datapoints.
         """
-        unique_cluster_ids = np.array(
-            [label for label in set(cluster_ids) if label not in self.OUTLIER_CLUSTER_LABELS]
+        unique_cluster_ids, frequencies = np.unique(cluster_ids, return_counts=True)
+        keep = ~np.isin(unique_cluster_ids, self.OUTLIER_CLUSTER_LABELS) & (
+            frequencies >= self.min_cluster_samples
         )
-        frequencies = np.bincount(cluster_ids[~np.isin(cluster_ids, self.OUTLIER_CLUSTER_LABELS)])
-        unique_cluster_ids = np.array(
-            [
-                cluster_id
-                for cluster_id in unique_cluster_ids
-                if frequencies[cluster_id] >= self.min_cluster_samples
-            ]
-        )
-        return unique_cluster_ids
+        return unique_cluster_ids[keep]
 
     def get_worst_cluster(
         self,
@@ -210,19 +240,27 @@ class UnderperformingGroupIssueManager(IssueManager):
         Returns:
             Tuple[int, float]: (Underperforming Cluster ID, Cluster Quality Score)
         """
+        self_confidence = get_self_confidence_for_each_label(labels, pred_probs)
+        # Mean self-confidence of each cluster, in the order of unique_cluster_ids
+        unique_cluster_ids = np.asarray(unique_cluster_ids)
+        order = np.argsort(unique_cluster_ids, kind="stable")
+        positions = np.searchsorted(unique_cluster_ids[order], cluster_ids)
+        positions = np.minimum(positions, len(unique_cluster_ids) - 1)
+        in_cluster = unique_cluster_ids[order][positions] == cluster_ids
+        cluster_index = order[positions[in_cluster]]
+        cluster_sums = np.bincount(
+            cluster_index, weights=self_confidence[in_cluster], minlength=len(unique_cluster_ids)
+        )
+        cluster_sizes = np.bincount(cluster_index, minlength=len(unique_cluster_ids))
+        cluster_performances = cluster_sums / np.maximum(cluster_sizes, 1)
+
         worst_cluster_performance = 1  # Largest possible probability value
         worst_cluster_id = min(unique_cluster_ids) - 1
-        for cluster_id in unique_cluster_ids:
-            cluster_mask = cluster_ids == cluster_id
-            cur_cluster_ids = labels[cluster_mask]
-            cur_cluster_pred_probs = pred_probs[cluster_mask]
-            cluster_performance = get_self_confidence_for_each_label(
-                cur_cluster_ids, cur_cluster_pred_probs
-            ).mean()
-            if cluster_performance < worst_cluster_performance:
-                worst_cluster_performance = cluster_performance
-                worst_cluster_id = cluster_id
-        mean_performance = get_self_confidence_for_each_label(labels, pred_probs).mean()
+        worst_cluster_index = np.argmin(cluster_performances)
+        if cluster_performances[worst_cluster_index] < worst_cluster_performance:
+            worst_cluster_performance = cluster_performances[worst_cluster_index]
+            worst_cluster_id = unique_cluster_ids[worst_cluster_index]
+        mean_performance = self_confidence.mean()
         worst_cluster_ratio = min(worst_cluster_performance / mean_performance, 1.0)
         worst_cluster_id = (
             worst_cluster_id
@@ -324,9 +362,15 @@ class UnderperformingGroupIssueManager(IssueManager):
             }
         }
         if performed_clustering:
-            cluster_stats["clustering"].update(
-                {"algorithm": CLUSTERING_ALGO, "params": CLUSTERING_PARAMS_DEFAULT}
-            )
+            if self.clustering_algorithm == CONNECTED_COMPONENTS_ALGO:
+                params = {"eps": self.clustering_kwargs.get("eps", DBSCAN_EPS_DEFAULT)}
+                cluster_stats["clustering"].update(
+                    {"algorithm": CONNECTED_COMPONENTS_ALGO, "params": params}
+                )
+            else:
+                cluster_stats["clustering"].update(
+                    {"algorithm": CLUSTERING_ALGO, "params": CLUSTERING_PARAMS_DEFAULT}
+                )
 
         return cluster_stats
 
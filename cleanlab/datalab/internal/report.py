@@ -52,6 +52,10 @@ class Reporter:
         Whether to include the description of each issue type in the report. The description
         is included by default, but can be excluded by setting this parameter to ``False``.
 
+    show_profile :
+        Whether to include a table with the time and memory spent on each step of ``find_issues``
+        at the end of the report.
+
     Note
     ----
     This class is not intended to be used directly. Instead, use the
@@ -66,6 +70,7 @@ class Reporter:
         include_description: bool = True,
         show_summary_score: bool = False,
         show_all_issues: bool = False,
+        show_profile: bool = False,
         **kwargs,
     ):
         self.data_issues = data_issues
@@ -74,6 +79,7 @@ class Reporter:
         self.include_description = include_description
         self.show_summary_score = show_summary_score
         self.show_all_issues = show_all_issues
+        self.show_profile = show_profile
 
     def _get_empty_report(self) -> str:
         """This method is used to return a report when there are
@@ -156,8 +162,30 @@ class Reporter:
         ]
 
         report_str += "\n\n\n".join(issue_reports)
+        if self.show_profile:
+            report_str += self._write_profile()
         return report_str
 
+    def _write_profile(self) -> str:
+        profile = self.data_issues.get_info("statistics").get("profile", {})
+        if not profile:
+            return ""
+        profile_df = pd.DataFrame(
+            {
+                "step": list(profile.keys()),
+                "wall_time (s)": [step["wall_time"] for step in profile.values()],
+                "cpu_time (s)": [step["cpu_time"] for step in profile.values()],
+                "peak_memory (MB)": [
+                    None if step["peak_memory"] is None else step["peak_memory"] / 2**20
+                    for step in profile.values()
+                ],
+            }
+        )
+        return (
+            "\n\n\nHere is the time and memory spent on each step of `Datalab.find_issues()`:\n\n"
+            + profile_df.to_string(index=False, float_format="{:.3f}".format, na_rep="-")
+        )
+
     def _write_summary(self, summary: pd.DataFrame) -> str:
         statistics = self.data_issues.get_info("statistics")
         num_examples = statistics["num_examples"]
@@ -13,14 +13,36 @@
 #
 # You should have received a copy of the GNU Affero General Public License
 # along with cleanlab.  If not, see <https://www.gnu.org/licenses/>.
+"""
+Saving and loading of :py:class:`Datalab <cleanlab.datalab.datalab.Datalab>` objects.
+
+A saved Datalab is a folder with a versioned, columnar layout:
+
+- ``manifest.json``: format version, cleanlab version and an index of the stored `info`.
+  Small JSON-compatible values of `info` are stored inline.
+- ``issues.parquet`` and ``summary.parquet``: the issues and issue summary tables.
+- ``info/``: numeric arrays as ``.npy`` files (memory-mapped when loaded),
+  sparse matrices (e.g. knn graphs) and ragged lists of arrays as ``.npz`` files,
+  and any other Python objects (e.g. fitted search indices) as individual pickle files.
+- ``datalab.pkl``: the Datalab object without its issues and info.
+- ``data/``: the dataset, saved with :py:meth:`datasets.Dataset.save_to_disk`.
+
+On load, the issue summary is read right away, while the issues and info are only read
+when they are first accessed.
+Folders saved by earlier versions (a single pickle of the whole Datalab) can still be loaded.
+"""
 from __future__ import annotations
 
+import copy
+import json
 import os
 import pickle
 import warnings
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
+import numpy as np
 import pandas as pd
+from scipy.sparse import csr_matrix, load_npz, save_npz
 
 import cleanlab
 from cleanlab.datalab.internal.data import Data
@@ -32,22 +54,129 @@ if TYPE_CHECKING:  # pragma: no cover
 
 
 # Constants:
+FORMAT_VERSION = 2
+MANIFEST_FILENAME = "manifest.json"
 OBJECT_FILENAME = "datalab.pkl"
-ISSUES_FILENAME = "issues.csv"
-ISSUE_SUMMARY_FILENAME = "summary.csv"
-INFO_FILENAME = "info.pkl"
+ISSUES_FILENAME = "issues.parquet"
+ISSUE_SUMMARY_FILENAME = "summary.parquet"
+INFO_DIRNAME = "info"
 DATA_DIRNAME = "data"
+LEGACY_ISSUES_FILENAME = "issues.csv"
+LEGACY_ISSUE_SUMMARY_FILENAME = "summary.csv"
+
+
+def _is_memory_mapped_from(value: np.ndarray, directory: str) -> bool:
+    """Whether an array (or the array it is a view of) is memory-mapped from a file in `directory`."""
+    base: Any = value
+    while base is not None:
+        if isinstance(base, np.memmap) and base.filename is not None:
+            file_directory = os.path.dirname(os.path.realpath(base.filename))
+            return file_directory == os.path.realpath(directory)
+        base = getattr(base, "base", None)
+    return False
+
+
+def _save_info_value(info_dir: str, filename: str, value: Any) -> Dict[str, Any]:
+    """Save a single value of the info dictionary and return its entry in the manifest."""
+    if isinstance(value, csr_matrix):
+        save_npz(os.path.join(info_dir, f"{filename}.npz"), value, compressed=False)
+        return {"format": "csr", "file": f"{filename}.npz"}
+    if isinstance(value, np.ndarray) and value.dtype.kind in "biuf":
+        np.save(os.path.join(info_dir, f"{filename}.npy"), value)
+        return {"format": "npy", "file": f"{filename}.npy"}
+    if isinstance(value, list) and value:
+        if all(isinstance(v, np.ndarray) and v.ndim == 1 for v in value):
+            # Ragged list of arrays, e.g. near-duplicate sets
+            values = np.concatenate(value)
+            if values.dtype.kind in "biuf":
+                offsets = np.cumsum([0] + [len(v) for v in value])
+                np.savez(os.path.join(info_dir, f"{filename}.npz"), values=values, offsets=offsets)
+                return {"format": "ragged", "file": f"{filename}.npz"}
+        elif all(type(v) in (int, float, bool) for v in value):
+            array = np.asarray(value)
+            if array.dtype.kind in "biuf":
+                np.save(os.path.join(info_dir, f"{filename}.npy"), array)
+                return {"format": "list", "file": f"{filename}.npy"}
+    try:
+        if json.loads(json.dumps(value, allow_nan=False)) == value:
+            return {"format": "json", "value": value}
+    except (TypeError, ValueError):
+        pass
+    with open(os.path.join(info_dir, f"{filename}.pkl"), "wb") as f:
+        pickle.dump(value, f)
+    return {"format": "pickle", "file": f"{filename}.pkl"}
+
+
+def _load_info_value(info_dir: str, entry: Dict[str, Any]) -> Any:
+    """Load a single value of the info dictionary from its entry in the manifest."""
+    value_format = entry["format"]
+    if value_format == "json":
+        return entry["value"]
+    file = os.path.join(info_dir, entry["file"])
+    if value_format == "csr":
+        return csr_matrix(load_npz(file))
+    if value_format == "npy":
+        return np.load(file, mmap_mode="r")
+    if value_format == "list":
+        return np.load(file).tolist()
+    if value_format == "ragged":
+        with np.load(file) as arrays:
+            values, offsets = arrays["values"], arrays["offsets"]
+        return [values[start:end] for start, end in zip(offsets[:-1], offsets[1:])]
+    with open(file, "rb") as f:
+        return pickle.load(f)
+
+
+def _load_info(path: str, info_index: Dict[str, Dict[str, Dict[str, Any]]]) -> Dict[str, Any]:
+    info_dir = os.path.join(path, INFO_DIRNAME)
+    return {
+        issue_name: {key: _load_info_value(info_dir, entry) for key, entry in entries.items()}
+        for issue_name, entries in info_index.items()
+    }
+
+
+def _load_issues(path: str) -> pd.DataFrame:
+    return pd.read_parquet(os.path.join(path, ISSUES_FILENAME))
 
 
 class _Serializer:
     @staticmethod
-    def _save_data_issues(path: str, datalab: Datalab) -> None:
-        """Saves the issues to disk."""
+    def _save_data_issues(path: str, datalab: Datalab) -> Dict[str, Any]:
+        """Saves the issues, issue summary and info to disk.
+
+        Returns
+        -------
+        info_index :
+            Index of the saved info, to be stored in the manifest.
+        """
         issues_path = os.path.join(path, ISSUES_FILENAME)
-        datalab.data_issues.issues.to_csv(issues_path, index=False)
+        datalab.data_issues.issues.to_parquet(issues_path)
 
         issue_summary_path = os.path.join(path, ISSUE_SUMMARY_FILENAME)
-        datalab.data_issues.issue_summary.to_csv(issue_summary_path, index=False)
+        datalab.data_issues.issue_summary.to_parquet(issue_summary_path)
+
+        info_dir = os.path.join(path, INFO_DIRNAME)
+        os.makedirs(info_dir, exist_ok=True)
+        # Arrays loaded from the folder that is being overwritten are read into memory first,
+        # so that their files are not truncated while they are still read from.
+        info = {
+            issue_name: {
+                key: (
+                    np.array(value)
+                    if isinstance(value, np.ndarray) and _is_memory_mapped_from(value, info_dir)
+                    else value
+                )
+                for key, value in issue_info.items()
+            }
+            for issue_name, issue_info in datalab.data_issues.info.items()
+        }
+        info_index: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for i, (issue_name, issue_info) in enumerate(info.items()):
+            info_index[issue_name] = {
+                key: _save_info_value(info_dir, f"{i}_{j}", value)
+                for j, (key, value) in enumerate(issue_info.items())
+            }
+        return info_index
 
     @staticmethod
     def _save_data(path: str, datalab: Datalab) -> None:
@@ -89,16 +218,29 @@ class _Serializer:
                 raise FileExistsError("Please specify a new path or set force=True")
             print(f"WARNING: Existing files will be overwritten by newly saved files at: {path}")
 
-        # Save the datalab object to disk.
-        with open(os.path.join(path, OBJECT_FILENAME), "wb") as f:
-            pickle.dump(datalab, f)
+        # Save the issues, issue summary and info to disk.
+        info_index = cls._save_data_issues(path=path, datalab=datalab)
 
-        # Save the issues to disk. Use placeholder method for now.
-        cls._save_data_issues(path=path, datalab=datalab)
+        # Save the datalab object without the issues, issue summary and info.
+        data_issues = copy.copy(datalab.data_issues)
+        data_issues._lazy_attributes = {}
+        data_issues.issues = data_issues.issue_summary = data_issues.info = None
+        datalab_without_issues = copy.copy(datalab)
+        datalab_without_issues.data_issues = data_issues
+        with open(os.path.join(path, OBJECT_FILENAME), "wb") as f:
+            pickle.dump(datalab_without_issues, f)
 
         # Save the dataset to disk
         cls._save_data(path=path, datalab=datalab)
 
+        manifest = {
+            "format_version": FORMAT_VERSION,
+            "cleanlab_version": datalab.cleanlab_version,
+            "info": info_index,
+        }
+        with open(os.path.join(path, MANIFEST_FILENAME), "w") as f:
+            json.dump(manifest, f)
+
     @classmethod
     def deserialize(cls, path: str, data: Optional[Dataset] = None) -> Datalab:
         """Deserializes the datalab object from disk."""
@@ -106,22 +248,14 @@ class _Serializer:
         if not os.path.exists(path):
             raise ValueError(f"No folder found at specified path: {path}")
 
-        with open(os.path.join(path, OBJECT_FILENAME), "rb") as f:
-            datalab: Datalab = pickle.load(f)
-
-        cls._validate_version(datalab)
-
-        # Load the issues from disk.
-        issues_path = os.path.join(path, ISSUES_FILENAME)
-        if not hasattr(datalab.data_issues, "issues") and os.path.exists(issues_path):
-            datalab.data_issues.issues = pd.read_csv(issues_path)
-
-        issue_summary_path = os.path.join(path, ISSUE_SUMMARY_FILENAME)
-        if not hasattr(datalab.data_issues, "issue_summary") and os.path.exists(issue_summary_path):
-            datalab.data_issues.issue_summary = pd.read_csv(issue_summary_path)
+        manifest_path = os.path.join(path, MANIFEST_FILENAME)
+        if os.path.exists(manifest_path):
+            datalab = cls._deserialize_columnar(path, manifest_path)
+        else:
+            datalab = cls._deserialize_legacy(path)
 
         if data is not None:
-            if hash(data) != hash(datalab._data):
+            if Data._compute_fingerprint(data) != datalab._data.fingerprint:
                 raise ValueError(
                     "Data has been modified since Lab was saved. "
                     "Cannot load Lab with modified data."
@@ -133,6 +267,47 @@ class _Serializer:
                 )
 
             datalab._data = Data(data, datalab.task, datalab.label_name)
-            datalab.data = datalab._data._data
+
+        return datalab
+
+    @classmethod
+    def _deserialize_columnar(cls, path: str, manifest_path: str) -> Datalab:
+        """Loads a Datalab saved in the columnar format, the issues and info are loaded lazily."""
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+        if manifest["format_version"] > FORMAT_VERSION:
+            raise ValueError(
+                f"Saved Datalab uses format version {manifest['format_version']}, "
+                f"but this version of cleanlab only supports versions up to {FORMAT_VERSION}. "
+                "Please upgrade cleanlab to load it."
+            )
+
+        with open(os.path.join(path, OBJECT_FILENAME), "rb") as f:
+            datalab: Datalab = pickle.load(f)
+
+        cls._validate_version(datalab)
+
+        data_issues = datalab.data_issues
+        data_issues.issue_summary = pd.read_parquet(os.path.join(path, ISSUE_SUMMARY_FILENAME))
+        data_issues._load_lazily("issues", lambda: _load_issues(path))
+        data_issues._load_lazily("info", lambda: _load_info(path, manifest["info"]))
+        return datalab
+
+    @classmethod
+    def _deserialize_legacy(cls, path: str) -> Datalab:
+        """Loads a Datalab saved as a single pickle by earlier versions of cleanlab."""
+        with open(os.path.join(path, OBJECT_FILENAME), "rb") as f:
+            datalab: Datalab = pickle.load(f)
+
+        cls._validate_version(datalab)
+
+        # Load the issues from disk.
+        issues_path = os.path.join(path, LEGACY_ISSUES_FILENAME)
+        if not hasattr(datalab.data_issues, "issues") and os.path.exists(issues_path):
+            datalab.data_issues.issues = pd.read_csv(issues_path)
+
+        issue_summary_path = os.path.join(path, LEGACY_ISSUE_SUMMARY_FILENAME)
+        if not hasattr(datalab.data_issues, "issue_summary") and os.path.exists(issue_summary_path):
+            datalab.data_issues.issue_summary = pd.read_csv(issue_summary_path)
 
         return datalab
@@ -18,15 +18,25 @@ The experimental feature that construct a datalab instance with the statistic in
 """
 from __future__ import annotations
 
+import asyncio
+import time
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from collections import deque
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, List, Optional, Set, Tuple, Union
 from dataclasses import InitVar, dataclass
 
 import pandas as pd
 import numpy as np
+from sklearn.metrics import pairwise_distances
 
 from cleanlab.datalab.datalab import Datalab
+from cleanlab.datalab.internal.issue_manager.duplicate import _compute_scores_with_exp_transform
+from cleanlab.datalab.internal.issue_manager.multilabel.label import MultilabelIssueManager
+from cleanlab.datalab.internal.issue_manager.outlier import OutlierIssueManager
+from cleanlab.datalab.internal.issue_manager.regression.label import RegressionLabelIssueManager
+from cleanlab.datalab.internal.task import Task
 from cleanlab.experimental.label_issues_batched import LabelInspector
+from cleanlab.internal.multilabel_utils import onehot2int
 from cleanlab.rank import find_top_issues
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -50,33 +60,40 @@ class FindIssuesKwargs:
     ----------
     labels :
         A numpy array representing the labels.
+        For multilabel tasks, a list with the list of labels of each example.
     pred_probs :
         A numpy array representing the predicted probabilities.
+        For regression tasks, the predicted values.
     _label_map :
         An optional dictionary representing the label map.
+    _multi_label :
+        Whether the labels of each example are a list of labels (multilabel tasks).
     features :
         An optional numpy array representing the features.
     knn_graph :
         An optional scipy sparse matrix representing the k-nearest neighbors graph.
     """
 
-    labels: Optional[np.ndarray] = None
+    labels: Optional[Union[np.ndarray, List[List[Any]]]] = None
     pred_probs: Optional[np.ndarray] = None
     features: Optional[np.ndarray] = None
     _label_map: InitVar[Optional[Dict[int, str]]] = None
     knn_graph: InitVar[Optional[csr_matrix]] = None
+    _multi_label: InitVar[bool] = False
 
-    def __post_init__(self, _label_map, knn_graph):
+    def __post_init__(self, _label_map, knn_graph, _multi_label):
         """
         Performs post-initialization operations.
 
         Parameters
         ----------
         _label_map :
-            An optional dictionary representing the label map.
+            An optional dictionary representing the label map. Regression labels are not mapped.
         knn_graph :
             An optional scipy sparse matrix representing the k-nearest neighbors graph.
             If not None, then an UnimplementedFeatureError is raised, as the DataMonitor will only support labels, pred_probs and features for now.
+        _multi_label :
+            Whether the labels of each example are a list of labels, which are mapped individually.
 
         Raises
         ------
@@ -84,8 +101,11 @@ class FindIssuesKwargs:
             If any unimplemented keyword arguments are provided.
         """
         self._check_unimplemented_kwargs(knn_graph)
-        if self.labels is not None and _label_map is not None:
-            self.labels = np.vectorize(_label_map.get, otypes=[int])(self.labels)
+        if self.labels is not None and _label_map:
+            if _multi_label:
+                self.labels = [[_label_map[label] for label in labels] for labels in self.labels]
+            else:
+                self.labels = np.vectorize(_label_map.get, otypes=[int])(self.labels)
 
         def _adapt_to_singletons(self):
             # TODO: Implement this method to adapt the input to singletons.
@@ -112,15 +132,37 @@ class DataMonitor:
     ----------
     datalab :
         The Datalab object fitted to the original training dataset.
+        Classification, regression and multilabel tasks are supported.
+        For regression tasks, the predicted values of new examples are passed as `pred_probs`, as in Datalab.
+    max_rows :
+        Maximum number of the most recent examples whose issues are kept in :py:attr:`issues`.
+        If None, the issues of every example in the stream are kept.
+    max_age :
+        Maximum time (in seconds) for which the issues of an example are kept in :py:attr:`issues`,
+        counted from when its batch was passed to :py:meth:`find_issues`.
+        If None, issues are kept regardless of their age.
+    max_batch_size :
+        Maximum number of examples passed to :py:meth:`submit` that are checked together in one micro-batch.
+    max_batch_latency :
+        Maximum time (in seconds) that an example passed to :py:meth:`submit` waits for other examples
+        to fill up its micro-batch, before the micro-batch is checked.
+        Larger values (and larger `max_batch_size`) favor throughput, smaller values favor latency.
+
+    Note
+    ----
+    The retention policy only applies to the per-example :py:attr:`issues`.
+    The :py:attr:`issue_summary` is maintained incrementally and always covers every example in the stream.
     """
 
-    def __init__(self, datalab: Datalab):
-        if str(datalab.task) != "classification":
-            raise NotImplementedError(
-                f"Currently, only classification tasks are supported for DataMonitor."
-                f' The task of the provided Datalab instance is "{str(datalab.task)}", which is not supported by DataMonitor.'
-            )
-
+    def __init__(
+        self,
+        datalab: Datalab,
+        max_rows: Optional[int] = None,
+        max_age: Optional[float] = None,
+        max_batch_size: int = 64,
+        max_batch_latency: float = 0.005,
+    ):
+        self.task = datalab.task
         self.label_map = datalab._label_map
 
         self.info = datalab.get_info()
@@ -145,20 +187,36 @@ class DataMonitor:
             lambda n, i: self.info.get(n, {}).get("find_issues_inputs", {}).get(i, False)
         )
 
-        # Only consider label error detection if checked by Datalab, using pred_probs
+        # Only consider label error detection if checked by Datalab, using pred_probs (predictions for regression)
         label_issue_checked = "label" in issue_names_checked
-        pred_probs_checked_for_label = _check_issue_input("label", "pred_probs")
+        label_monitor_class, label_input = {
+            Task.CLASSIFICATION: (LabelIssueMonitor, "pred_probs"),
+            Task.REGRESSION: (RegressionLabelIssueMonitor, "predictions"),
+            Task.MULTILABEL: (MultilabelIssueMonitor, "pred_probs"),
+        }[self.task]
+        pred_probs_checked_for_label = _check_issue_input("label", label_input)
 
         if label_issue_checked and pred_probs_checked_for_label:
-            self.monitors["label"] = LabelIssueMonitor(self.info)
+            self.monitors["label"] = label_monitor_class(self.info)
 
-        # Only consider outlier detection if checked by Datalab, using features
+        # Only consider outlier detection if checked by Datalab, using features.
+        # Datalab stores the search index over those features, which is needed to score new examples.
         outliers_checked = "outlier" in issue_names_checked
-        features_checked_for_outlier = _check_issue_input("outlier", "features")
+        features_checked_for_outlier = _check_issue_input("outlier", "features") or (
+            self.info.get("outlier", {}).get("knn") is not None
+        )
 
         if outliers_checked and features_checked_for_outlier:
             self.monitors["outlier"] = OutlierIssueMonitor(self.info)
 
+        # Only consider near-duplicate detection if checked by Datalab, with a stored search index
+        near_duplicates_checked = "near_duplicate" in issue_names_checked
+        if (
+            near_duplicates_checked
+            and NearDuplicateIssueMonitor.reference_knn(self.info) is not None
+        ):
+            self.monitors["near_duplicate"] = NearDuplicateIssueMonitor(self.info)
+
         if not self.monitors:
             if issue_names_checked:
                 # No monitors were created, so we can't check for any issues.
@@ -166,26 +224,32 @@ class DataMonitor:
             # Datalab didn't check any issues with the expected inputs, so we can't check for any issues.
             error_msg = (
                 "No issue types checked by Datalab. DataMonitor requires at least one issue type to be checked."
-                " The following issue types are supported by DataMonitor: label, outlier."
+                " The following issue types are supported by DataMonitor: label, outlier, near_duplicate."
             )
             raise ValueError(error_msg)
 
-        # Set up dictionary of lists for efficiently constructing the issues DataFrame
+        # Set up the columns of the issues DataFrame
         issue_names = self.monitors.keys()
-
-        # This issue dictionary will collect the issues for the entire stream of data.
-        self.issues_dict: Dict[str, Union[List[bool], List[float]]] = {
-            col: []
+        columns = [
+            col
             for cols in zip(
                 [f"is_{name}_issue" for name in issue_names],
                 [f"{name}_score" for name in issue_names],
             )
             for col in cols
-        }
+        ]
+
+        # This history will collect the issues for the entire stream of data.
+        self.history = IssueHistory(columns, max_rows=max_rows, max_age=max_age)
+
+        # The micro-batcher is bound to an event loop, so it is created on the first call to submit().
+        self.max_batch_size = max_batch_size
+        self.max_batch_latency = max_batch_latency
+        self._batcher: Optional[MicroBatcher] = None
 
     @property
     def issues(self) -> pd.DataFrame:
-        return pd.DataFrame.from_dict(self.issues_dict)
+        return self.history.issues
 
     @property
     def issue_summary(self) -> pd.DataFrame:
@@ -197,10 +261,10 @@ class DataMonitor:
         issue_names = self.monitors.keys()
         issue_summary_dict["issue_type"] = list(issue_names)
         issue_summary_dict["num_issues"] = [
-            np.sum(self.issues_dict[f"is_{issue_name}_issue"]) for issue_name in issue_names
+            int(self.history.sum(f"is_{issue_name}_issue")) for issue_name in issue_names
         ]
         issue_summary_dict["score"] = [
-            float(np.mean(self.issues_dict[f"{issue_name}_score"])) for issue_name in issue_names
+            self.history.mean(f"{issue_name}_score") for issue_name in issue_names
         ]
         return pd.DataFrame.from_dict(issue_summary_dict)
 
@@ -211,6 +275,16 @@ class DataMonitor:
         pred_probs: Optional[np.ndarray] = None,
         features: Optional[np.ndarray] = None,
     ) -> None:
+        self._find_issues(labels=labels, pred_probs=pred_probs, features=features)
+
+    def _find_issues(
+        self,
+        *,
+        labels: Optional[np.ndarray] = None,
+        pred_probs: Optional[np.ndarray] = None,
+        features: Optional[np.ndarray] = None,
+    ) -> Dict[str, Union[List[float], List[bool], np.ndarray]]:
+        """Checks a batch of data for issues, appends them to the history and returns them."""
         # TODO: Simplifying User Input: Ensure that users can pass input in the simplest form possible.
         # See FindIssuesKwargs._adapt_to_singletons TODO for more details.
 
@@ -220,9 +294,10 @@ class DataMonitor:
             pred_probs=pred_probs,
             features=features,
             _label_map=str_to_int_map,
+            _multi_label=self.task.is_multilabel,
         )
         issues_dict: Dict[str, Union[List[float], List[bool], np.ndarray]] = {
-            k: [] for k in self.issues_dict.keys()
+            k: [] for k in self.history.columns
         }
 
         # Flag to track if any monitor has found issues
@@ -243,16 +318,88 @@ class DataMonitor:
         if display_results:
             self._display_batch_issues(issues_dict, labels=labels, pred_probs=pred_probs)
 
-        # Append the issues to the existing issues dictionary
-        for k, v in issues_dict.items():
-            self.issues_dict[k].extend(v)  # type: ignore[arg-type]
+        # Append the issues to the history of the stream
+        self.history.append(issues_dict)
+        return issues_dict
+
+    async def submit(self, example: Dict[str, Any]) -> Dict[str, Any]:
+        """Checks a single example for issues, together with other examples submitted concurrently.
+
+        Examples are coalesced into micro-batches of up to `max_batch_size` examples, or whichever
+        examples arrived within `max_batch_latency` seconds of the first one.
+        Each micro-batch is checked with :py:meth:`find_issues` in an executor, so the event loop is not blocked.
+
+        Parameters
+        ----------
+        example :
+            A dictionary with the inputs of a single example, among ``"label"``, ``"pred_probs"`` and ``"features"``.
+            All examples submitted to a monitor must provide the same inputs.
+
+        Returns
+        -------
+        issues :
+            The issues found for the example, with the same keys as the columns of :py:attr:`issues`.
+
+        Examples
+        --------
+        >>> results = await asyncio.gather(*(monitor.submit(example) for example in examples))  # doctest: +SKIP
+        """
+        loop = asyncio.get_running_loop()
+        if self._batcher is None or self._batcher.loop is not loop:
+            if self._batcher is not None:
+                self._batcher.close()
+            self._batcher = MicroBatcher(
+                self._find_issues_in_examples,
+                max_batch_size=self.max_batch_size,
+                max_batch_latency=self.max_batch_latency,
+            )
+        return await self._batcher.submit(example)
+
+    async def aclose(self) -> None:
+        """Stops the micro-batching of examples passed to :py:meth:`submit`.
+
+        Examples that are still waiting for their issues are cancelled.
+        This must be awaited in the event loop that :py:meth:`submit` was last called in.
+        """
+        if self._batcher is not None:
+            await self._batcher.aclose()
+            self._batcher = None
+
+    def _find_issues_in_examples(self, examples: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Checks a micro-batch of single examples for issues, returning the issues of each example."""
+        batch_kwargs = {
+            "labels": ("label", list if self.task.is_multilabel else np.asarray),
+            "pred_probs": ("pred_probs", np.stack),
+            "features": ("features", np.stack),
+        }
+        find_issues_kwargs = {
+            kwarg: stack([example[key] for example in examples])
+            for kwarg, (key, stack) in batch_kwargs.items()
+            if key in examples[0]
+        }
+        issues_dict = self._find_issues(**find_issues_kwargs)
+        columns = {col: np.asarray(values) for col, values in issues_dict.items()}
+        return [
+            {col: values[i].item() for col, values in columns.items()} for i in range(len(examples))
+        ]
+
+    def _suggested_labels(self, pred_probs: np.ndarray) -> List[Any]:
+        """The labels suggested by the model for a batch of examples, in the format of the given labels."""
+        if self.task.is_regression:
+            return list(pred_probs)
+        if self.task.is_multilabel:
+            return [
+                list(map(self.label_map.get, labels))
+                for labels in onehot2int(
+                    pred_probs > MultilabelIssueManager._PREDICTED_LABEL_THRESH
+                )
+            ]
+        return list(np.vectorize(self.label_map.get)(np.argmax(pred_probs, axis=1)))
 
     def _display_batch_issues(
         self, issues_dicts: Dict[str, Union[List[float], List[bool], np.ndarray]], **kwargs
     ) -> None:
-        start_index = len(
-            next(iter(self.issues_dict.values()))
-        )  # TODO: Abstract this into a method for checking how many examples have been processed/checked. E.g. __len__ or a property.
+        start_index = self.history.num_examples
         end_index = start_index + len(next(iter(issues_dicts.values())))
         index = np.arange(start_index, end_index)
 
@@ -281,10 +428,8 @@ class DataMonitor:
             col for col in df_issues.columns if (col.startswith("is_") and col.endswith("_issue"))
         ]
         if "is_label_issue" in is_issue_columns:
-            df_issues["given_label"] = kwargs["labels"]
-            df_issues["suggested_label"] = np.vectorize(self.label_map.get)(
-                np.argmax(kwargs["pred_probs"], axis=1)
-            )
+            df_issues["given_label"] = list(kwargs["labels"])
+            df_issues["suggested_label"] = self._suggested_labels(kwargs["pred_probs"])
 
         df_subset = df_issues.query(f"{' | '.join([f'{col} == True' for col in is_issue_columns])}")
 
@@ -299,6 +444,207 @@ class DataMonitor:
         )
 
 
+class IssueHistory:
+    """Stores the issues found in a stream of data, subject to a retention policy.
+
+    The per-example results are kept in memory as a queue of batches, from which the oldest
+    examples are evicted once they exceed `max_rows` or `max_age`.
+    The sum of every column is updated incrementally as batches are added,
+    so aggregates over the entire stream never revisit past examples.
+
+    Parameters
+    ----------
+    columns :
+        The names of the columns stored for each example.
+    max_rows :
+        Maximum number of the most recent examples to keep. If None, there is no limit.
+    max_age :
+        Maximum time (in seconds) for which an example is kept after its batch was added.
+        If None, there is no limit.
+    """
+
+    def __init__(
+        self,
+        columns: List[str],
+        max_rows: Optional[int] = None,
+        max_age: Optional[float] = None,
+    ):
+        if max_rows is not None and max_rows < 0:
+            raise ValueError(f"max_rows must be a non-negative integer, got {max_rows}.")
+        if max_age is not None and max_age <= 0:
+            raise ValueError(f"max_age must be a positive number of seconds, got {max_age}.")
+        self.columns = list(columns)
+        self.max_rows = max_rows
+        self.max_age = max_age
+
+        self.num_examples = 0
+        """Number of examples added to the history, including those that have been evicted."""
+
+        # Each batch is stored with the time it was added
+        self._batches: Deque[Tuple[float, Dict[str, np.ndarray]]] = deque()
+        self._num_retained = 0
+        self._sums: Dict[str, float] = {col: 0.0 for col in self.columns}
+        self._issues: Optional[pd.DataFrame] = None
+
+    def append(self, batch: Dict[str, Union[List[float], List[bool], np.ndarray]]) -> None:
+        """Adds the results for a batch of examples, then evicts examples according to the retention policy."""
+        arrays = {col: np.asarray(batch[col]) for col in self.columns}
+        num_examples_in_batch = len(arrays[self.columns[0]]) if self.columns else 0
+        for col, values in arrays.items():
+            self._sums[col] += values.sum()
+        self._batches.append((time.monotonic(), arrays))
+        self.num_examples += num_examples_in_batch
+        self._num_retained += num_examples_in_batch
+        self._issues = None
+        self._evict()
+
+    def _evict(self) -> None:
+        """Drops the oldest examples that are not covered by the retention policy."""
+        num_retained = self._num_retained
+        if self.max_age is not None:
+            now = time.monotonic()
+            while self._batches and now - self._batches[0][0] > self.max_age:
+                _, arrays = self._batches.popleft()
+                self._num_retained -= len(arrays[self.columns[0]])
+        if self.max_rows is not None:
+            while self._num_retained > self.max_rows:
+                timestamp, arrays = self._batches[0]
+                num_excess = self._num_retained - self.max_rows
+                batch_size = len(arrays[self.columns[0]])
+                if batch_size <= num_excess:
+                    self._batches.popleft()
+                    self._num_retained -= batch_size
+                else:
+                    # Copy the remaining part of the batch, so that the evicted part can be freed
+                    remaining = {col: values[num_excess:].copy() for col, values in arrays.items()}
+                    self._batches[0] = (timestamp, remaining)
+                    self._num_retained -= num_excess
+        if self._num_retained != num_retained:
+            self._issues = None
+
+    @property
+    def issues(self) -> pd.DataFrame:
+        """The retained examples, indexed by their position in the stream."""
+        self._evict()
+        if self._issues is None:
+            if self._batches:
+                data = {
+                    col: np.concatenate([arrays[col] for _, arrays in self._batches])
+                    for col in self.columns
+                }
+            else:
+                data = {col: [] for col in self.columns}
+            # Examples are always evicted from the start of the stream,
+            # so the retained examples are the last ones that were added.
+            index = pd.RangeIndex(self.num_examples - self._num_retained, self.num_examples)
+            self._issues = pd.DataFrame(data, index=index)
+        return self._issues
+
+    def sum(self, column: str) -> float:
+        """The sum of a column over every example in the stream, including evicted ones."""
+        return self._sums[column]
+
+    def mean(self, column: str) -> float:
+        """The mean of a column over every example in the stream, including evicted ones."""
+        if self.num_examples == 0:
+            return float("nan")
+        return float(self._sums[column] / self.num_examples)
+
+
+class MicroBatcher:
+    """Coalesces items submitted from coroutines into batches, which are processed in an executor.
+
+    A batch is processed once it holds `max_batch_size` items, or `max_batch_latency` seconds after
+    its first item was submitted, whichever comes first. Batches are processed one at a time,
+    in the order their items were submitted.
+
+    Parameters
+    ----------
+    process_batch :
+        A function that takes a list of items and returns a list with the result of each item.
+    max_batch_size :
+        Maximum number of items in a batch.
+    max_batch_latency :
+        Maximum time (in seconds) to wait for more items after the first item of a batch was submitted.
+    """
+
+    def __init__(
+        self,
+        process_batch: Callable[[List[Any]], List[Any]],
+        max_batch_size: int = 64,
+        max_batch_latency: float = 0.005,
+    ):
+        if max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be a positive integer, got {max_batch_size}.")
+        if max_batch_latency < 0:
+            raise ValueError(f"max_batch_latency must be non-negative, got {max_batch_latency}.")
+        self.process_batch = process_batch
+        self.max_batch_size = max_batch_size
+        self.max_batch_latency = max_batch_latency
+        self.loop = asyncio.get_running_loop()
+        self._queue: asyncio.Queue[Tuple[Any, asyncio.Future]] = asyncio.Queue()
+        self._pending: Set[asyncio.Future] = set()
+        self._worker = self.loop.create_task(self._process_batches())
+
+    async def submit(self, item: Any) -> Any:
+        """Adds an item to the next batch and waits for its result."""
+        future = self.loop.create_future()
+        self._pending.add(future)
+        future.add_done_callback(self._pending.discard)
+        await self._queue.put((item, future))
+        return await future
+
+    def close(self) -> None:
+        """Cancels the worker task (and the items waiting for their results), without waiting for it.
+
+        Unlike :py:meth:`aclose`, this can be called outside of the event loop of the batcher.
+        """
+        if not self._worker.done() and not self.loop.is_closed():
+            self.loop.call_soon_threadsafe(self._worker.cancel)
+
+    async def aclose(self) -> None:
+        """Cancels the worker task (and the items waiting for their results) and waits for it to finish."""
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+
+    async def _next_batch(self) -> List[Tuple[Any, asyncio.Future]]:
+        batch = [await self._queue.get()]
+        deadline = self.loop.time() + self.max_batch_latency
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - self.loop.time()
+            try:
+                if timeout > 0:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                else:
+                    batch.append(self._queue.get_nowait())
+            except (asyncio.TimeoutError, asyncio.QueueEmpty):
+                break
+        return batch
+
+    async def _process_batches(self) -> None:
+        try:
+            while True:
+                batch = await self._next_batch()
+                items = [item for item, _ in batch]
+                try:
+                    results = await self.loop.run_in_executor(None, self.process_batch, items)
+                except Exception as e:
+                    for _, future in batch:
+                        if not future.done():
+                            future.set_exception(e)
+                    continue
+                for (_, future), result in zip(batch, results):
+                    if not future.done():
+                        future.set_result(result)
+        finally:
+            # Items that will not be processed anymore
+            for future in list(self._pending):
+                future.cancel()
+
+
 class IssueMonitor(ABC):
     """Class for monitoring a batch of data for issues."""
 
@@ -395,6 +741,98 @@ class LabelIssueMonitor(IssueMonitor):
         }
 
 
+class RegressionLabelIssueMonitor(IssueMonitor):
+    """Class that monitors a batch of regression data for label issues.
+
+    The labels of new examples are scored with the residual statistics of the original dataset,
+    and flagged with the same absolute threshold, as in :py:meth:`RegressionLabelIssueManager.score_new_labels`.
+    """
+
+    def __init__(self, info: Info):
+        super().__init__(info)
+        label_info = info.get("label")
+        if label_info is None:
+            raise ValueError("The label information is missing in the info dictionary.")
+        if label_info.get("scoring_method") is None:
+            raise ValueError("The label scoring statistics are missing in the info dictionary.")
+
+    def find_issues(self, fi_kwargs: FindIssuesKwargs) -> None:
+        """
+        Finds label issues in the provided batch of regression data.
+
+        Parameters
+        ----------
+        fi_kwargs :
+            An object containing the keyword arguments for finding issues.
+            It should contain labels, and the predicted values as pred_probs.
+
+        Raises
+        ------
+        ValueError :
+            If either the labels or the predictions are not provided.
+        """
+        if fi_kwargs.labels is None or fi_kwargs.pred_probs is None:
+            raise ValueError(
+                "Both labels and predictions (as pred_probs) must be provided to find issues."
+            )
+
+        scores, is_issue_array = RegressionLabelIssueManager.score_new_labels(
+            fi_kwargs.labels, fi_kwargs.pred_probs, self.info["label"]
+        )
+        self._found_issues_in_batch = bool(np.any(is_issue_array))
+
+        # Update issues dictionary
+        self.issues_dict = {
+            "is_issue": is_issue_array,
+            "score": scores,
+        }
+
+
+class MultilabelIssueMonitor(IssueMonitor):
+    """Class that monitors a batch of multilabel data for label issues.
+
+    The labels of new examples are checked with the per-class confident thresholds
+    estimated on the original dataset, as in :py:meth:`MultilabelIssueManager.score_new_labels`.
+    """
+
+    def __init__(self, info: Info):
+        super().__init__(info)
+        label_info = info.get("label")
+        if label_info is None:
+            raise ValueError("The label information is missing in the info dictionary.")
+        if label_info.get("confident_thresholds") is None:
+            raise ValueError("The confident thresholds are missing in the info dictionary.")
+
+    def find_issues(self, fi_kwargs: FindIssuesKwargs) -> None:
+        """
+        Finds label issues in the provided batch of multilabel data.
+
+        Parameters
+        ----------
+        fi_kwargs :
+            An object containing the keyword arguments for finding issues.
+            It should contain labels and pred_probs.
+
+        Raises
+        ------
+        ValueError :
+            If either the labels or predicted probabilities are not provided.
+        """
+        if fi_kwargs.labels is None or fi_kwargs.pred_probs is None:
+            raise ValueError("Both labels and pred_probs must be provided to find issues.")
+
+        scores, is_issue_array = MultilabelIssueManager.score_new_labels(
+            fi_kwargs.labels, fi_kwargs.pred_probs, self.info["label"]
+        )
+        self._found_issues_in_batch = bool(np.any(is_issue_array))
+
+        # Update issues dictionary
+        self.issues_dict = {
+            "is_issue": is_issue_array,
+            "score": scores,
+        }
+
+
 class OutlierIssueMonitor(IssueMonitor):
     """Class that monitors a batch of data for outlier issues."""
 
@@ -405,13 +843,15 @@ class OutlierIssueMonitor(IssueMonitor):
             raise ValueError("The outlier information is missing in the info dictionary.")
 
         self.knn = outlier_info["knn"]
-        self.ood = outlier_info["ood"]
         self.issue_threshold: float = outlier_info["issue_threshold"]
 
     def find_issues(self, fi_kwargs: FindIssuesKwargs) -> None:
         """
         Finds outlier issues in the provided batch of features.
 
+        Both the outlier scores and the issue decisions are derived from the distances
+        found by a single nearest neighbor search, as in :py:meth:`OutlierIssueManager.update_issues`.
+
         Parameters
         ----------
         fi_kwargs :
@@ -426,20 +866,108 @@ class OutlierIssueMonitor(IssueMonitor):
         if fi_kwargs.features is None:
             raise ValueError("Features must be provided to find outlier issues.")
 
-        # Reset the flag indicating issues found in the current batch
-        self._found_issues_in_batch = False
-        scores = self.ood.score(features=fi_kwargs.features)
+        scores, is_issue_array, _, _ = OutlierIssueManager.score_new_features(
+            fi_kwargs.features, self.info["outlier"]
+        )
+        self._found_issues_in_batch = bool(np.any(is_issue_array))
 
-        distances, _ = self.knn.kneighbors(fi_kwargs.features, return_distance=True)
-        avg_distances = np.mean(distances, axis=1)
+        # Update issues dictionary
+        self.issues_dict = {
+            "is_issue": is_issue_array,
+            "score": scores,
+        }
 
-        # Determine which examples have outlier issues
-        is_issue_array = np.zeros(len(fi_kwargs.features), dtype=bool)
-        issue_indices = np.where(avg_distances > self.issue_threshold)[0]
-        num_issues_in_batch = len(issue_indices)
-        if num_issues_in_batch > 0:
-            self._found_issues_in_batch = True
-            is_issue_array[issue_indices] = True
+
+class NearDuplicateIssueMonitor(IssueMonitor):
+    """Class that monitors a batch of data for near-duplicate issues.
+
+    Each example is compared against the original dataset, using the search index fitted by Datalab,
+    and against the most recent examples of the stream (including the other examples in its batch).
+    As in :py:class:`NearDuplicateIssueManager`, an example is a near-duplicate if its nearest neighbor
+    lies closer than ``threshold * median_distance_to_nearest_neighbor``, where both values come from
+    the near-duplicate check on the original dataset.
+
+    Parameters
+    ----------
+    info :
+        The info of the Datalab instance that checked the original dataset for near-duplicates.
+    max_recent_examples :
+        Number of the most recent examples of the stream that new examples are compared against.
+    """
+
+    def __init__(self, info: Info, max_recent_examples: int = 1000):
+        super().__init__(info)
+        near_duplicate_info = info.get("near_duplicate")
+        if near_duplicate_info is None:
+            raise ValueError("The near_duplicate information is missing in the info dictionary.")
+
+        knn = self.reference_knn(info)
+        if knn is None:
+            raise ValueError(
+                "A search index over the original dataset is missing in the info dictionary."
+            )
+        self.knn = knn
+        self.median_nn_distance: float = near_duplicate_info["median_distance_to_nearest_neighbor"]
+        self.radius: float = near_duplicate_info["threshold"] * self.median_nn_distance
+        self.max_recent_examples = max_recent_examples
+        self._recent_features: Optional[np.ndarray] = None
+
+    @staticmethod
+    def reference_knn(info: Info) -> Optional[Any]:
+        """Returns the search index over the original dataset, stored by the near-duplicate check
+        or, failing that, by the outlier check."""
+        for issue_name in ["near_duplicate", "outlier"]:
+            knn = info.get(issue_name, {}).get("knn")
+            if knn is not None:
+                return knn
+        return None
+
+    def find_issues(self, fi_kwargs: FindIssuesKwargs) -> None:
+        """
+        Finds near-duplicate issues in the provided batch of features.
+
+        Parameters
+        ----------
+        fi_kwargs :
+            An object containing the keyword arguments for finding issues.
+            It should contain features.
+
+        Raises
+        ------
+        ValueError :
+            If `features` are not provided.
+        """
+        if fi_kwargs.features is None:
+            raise ValueError("Features must be provided to find near-duplicate issues.")
+        features = np.asarray(fi_kwargs.features)
+
+        # Distance to the nearest example of the original dataset
+        nn_distances, _ = self.knn.kneighbors(features, n_neighbors=1)
+        nn_distances = nn_distances[:, 0]
+
+        # Distance to the nearest recent example of the stream, or other example in this batch
+        if self._recent_features is None:
+            candidates = features
+        else:
+            candidates = np.vstack([self._recent_features, features])
+        num_recent = len(candidates) - len(features)
+        distances = pairwise_distances(
+            features,
+            candidates,
+            metric=self.knn.effective_metric_,
+            **self.knn.effective_metric_params_,
+        )
+        # Examples are not near-duplicates of themselves
+        distances[np.arange(len(features)), num_recent + np.arange(len(features))] = np.inf
+        if distances.shape[1] > 0:
+            nn_distances = np.minimum(nn_distances, distances.min(axis=1))
+        self._recent_features = candidates[max(len(candidates) - self.max_recent_examples, 0) :]
+
+        is_issue_array = nn_distances < self.radius
+        scores = _compute_scores_with_exp_transform(
+            nn_distances, temperature=1.0 / self.median_nn_distance
+        )
+        self._found_issues_in_batch = bool(np.any(is_issue_array))
 
         # Update issues dictionary
         self.issues_dict = {
@@ -18,10 +18,12 @@ Helper classes and functions used internally to compute label quality scores in
 """
 
 from enum import Enum
-from typing import Callable, Dict, Optional, Union
+from typing import Callable, Dict, Iterator, Optional, Union
 
 import numpy as np
-from sklearn.model_selection import cross_val_predict
+from scipy.sparse import csr_matrix, issparse
+from sklearn.model_selection import BaseCrossValidator, cross_val_predict
+from sklearn.utils import check_random_state
 
 from cleanlab.internal.label_quality_utils import _subtract_confident_thresholds
 from cleanlab.internal.multilabel_utils import _is_multilabel, stack_complement
@@ -609,21 +611,176 @@ def multilabel_py(y: np.ndarray) -> np.ndarray:
 # Cross-validation helpers
 
 
+class IterativeStratifiedKFold(BaseCrossValidator):
+    """K-fold cross-validator that stratifies each label of a multi-label dataset separately.
+
+    This is a vectorized variant of iterative stratification (Sechidis et al., 2011).
+    Labels are processed from rarest to most common. All not-yet-assigned examples that have the
+    current label are distributed across the folds at once, such that the number of examples with
+    that label is as balanced as possible among the folds. These examples are interleaved across the folds
+    in the order of their second rarest label. Examples without any label are finally
+    used to balance the sizes of the folds.
+
+    Unlike stratifying on the (up to ``2**K``) distinct class-assignment configurations,
+    the cost of this splitter scales linearly with the number of nonzero entries in the label matrix,
+    and it does not degenerate when almost every example has a unique configuration.
+
+    Pass an instance of this class as the ``cv`` argument of
+    :py:func:`get_cross_validated_multilabel_pred_probs <cleanlab.internal.multilabel_scorer.get_cross_validated_multilabel_pred_probs>`.
+
+    Parameters
+    ----------
+    n_splits :
+        Number of folds. Must be at least 2.
+
+    shuffle :
+        Whether to shuffle the examples that are assigned to the folds in each step.
+        If False, examples are assigned in the order they appear in the dataset.
+
+    random_state :
+        Controls the shuffling when ``shuffle=True``.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from cleanlab.internal.multilabel_scorer import IterativeStratifiedKFold
+    >>> labels = np.array([[1, 0], [1, 0], [0, 1], [0, 1], [1, 1], [0, 0]])
+    >>> cv = IterativeStratifiedKFold(n_splits=2)
+    >>> [test.tolist() for _, test in cv.split(labels, labels)]
+    [[1, 4, 5], [0, 2, 3]]
+    """
+
+    def __init__(self, n_splits: int = 5, *, shuffle: bool = False, random_state=None):
+        if n_splits < 2:
+            raise ValueError(f"n_splits must be at least 2, got {n_splits}")
+        if not shuffle and random_state is not None:
+            raise ValueError("Setting a random_state has no effect since shuffle is False.")
+        self.n_splits = n_splits
+        self.shuffle = shuffle
+        self.random_state = random_state
+
+    def get_n_splits(self, X=None, y=None, groups=None) -> int:
+        return self.n_splits
+
+    def _iter_test_indices(self, X=None, y=None, groups=None) -> Iterator[np.ndarray]:
+        if y is None:
+            raise ValueError("The multi-label matrix y must be provided to stratify the folds.")
+        fold_ids = self._assign_folds(y)
+        for fold in range(self.n_splits):
+            yield np.flatnonzero(fold_ids == fold)
+
+    def _assign_folds(self, y) -> np.ndarray:
+        """Returns the fold id of each example (row) in the (dense or sparse) binary label matrix `y`."""
+        y = csr_matrix(y) if issparse(y) else csr_matrix(np.asarray(y))
+        y.eliminate_zeros()
+        N, K = y.shape
+        if self.n_splits > N:
+            raise ValueError(
+                f"Cannot have number of splits n_splits={self.n_splits} greater than the number of samples: n_samples={N}."
+            )
+        y_csc = y.tocsc()
+
+        # Rank labels from rarest to most common. Processing labels in this order, the examples
+        # assigned together with a label are exactly the examples for which it is the rarest label.
+        label_ranks = np.empty(K, dtype=np.intp)
+        label_ranks[np.argsort(np.diff(y_csc.indptr), kind="stable")] = np.arange(K)
+        num_labels_per_row = np.diff(y.indptr)
+        rows = np.repeat(np.arange(N), num_labels_per_row)
+        nnz_ranks = label_ranks[y.indices]
+        sorted_ranks = np.append(nnz_ranks[np.lexsort((nnz_ranks, rows))], [K, K])
+        rarest = np.where(num_labels_per_row > 0, sorted_ranks[y.indptr[:-1]], K)
+        second_rarest = np.where(num_labels_per_row > 1, sorted_ranks[y.indptr[:-1] + 1], K)
+
+        # Examples sharing the same rarest label are ordered by their second rarest label,
+        # so that interleaving them across folds also stratifies the second label.
+        tiebreak = (
+            check_random_state(self.random_state).permutation(N) if self.shuffle else np.arange(N)
+        )
+        row_order = np.lexsort((tiebreak, second_rarest, rarest))
+        group_ranks, group_starts = np.unique(rarest[row_order], return_index=True)
+        group_ends = np.append(group_starts[1:], N)
+        rank_to_label = np.argsort(label_ranks)
+
+        fold_ids = np.full(N, -1, dtype=np.intp)
+        fold_sizes = np.zeros(self.n_splits, dtype=np.intp)
+        for rank, start, end in zip(group_ranks, group_starts, group_ends):
+            if rank < K:
+                k = rank_to_label[rank]
+                assigned_folds = fold_ids[y_csc.indices[y_csc.indptr[k] : y_csc.indptr[k + 1]]]
+                current_counts = np.bincount(
+                    assigned_folds[assigned_folds >= 0], minlength=self.n_splits
+                )
+            else:  # Examples without any label only balance the sizes of the folds
+                current_counts = fold_sizes.copy()
+            examples = row_order[start:end]
+            num_new = self._num_new_per_fold(current_counts, len(examples), fold_sizes)
+            fold_ids[examples] = self._interleave_folds(num_new)
+            fold_sizes += num_new
+        return fold_ids
+
+    def _num_new_per_fold(
+        self, current_counts: np.ndarray, m: int, fold_sizes: np.ndarray
+    ) -> np.ndarray:
+        """Splits `m` new examples among the folds so that `current_counts` become as even as possible.
+
+        Ties are broken in favor of the folds with fewer examples overall.
+        """
+        target = (current_counts.sum() + m) / self.n_splits
+        desired = np.maximum(target - current_counts, 0)
+        desired *= m / desired.sum()
+        num_new = np.floor(desired).astype(np.intp)
+        remainder = m - num_new.sum()
+        if remainder > 0:
+            order = np.lexsort((fold_sizes, -(desired - num_new)))
+            num_new[order[:remainder]] += 1
+        return num_new
+
+    @staticmethod
+    def _interleave_folds(num_new: np.ndarray) -> np.ndarray:
+        """Returns a sequence of fold ids where fold `f` occurs `num_new[f]` times, spread evenly across the sequence."""
+        folds = np.repeat(np.arange(len(num_new)), num_new)
+        positions = np.concatenate([(np.arange(n) + 0.5) / n for n in num_new if n > 0])
+        return folds[np.argsort(positions, kind="stable")]
+
+
+def _get_multilabel_ids(labels: np.ndarray) -> np.ndarray:
+    """Maps each distinct row (class-assignment configuration) of the label matrix to an integer id.
+
+    Binary labels are packed into bytes first, so that only a 1D array of fixed-size byte-strings needs to be sorted.
+    This gives the same ids as ``np.unique(labels, axis=0, return_inverse=True)``.
+    """
+    labels = np.asarray(labels)
+    if labels.dtype == bool or np.array_equal(labels, labels.astype(bool)):
+        packed = np.ascontiguousarray(np.packbits(labels.astype(bool), axis=1))
+        rows = packed.view(np.dtype((np.void, packed.shape[1]))).ravel()
+        _, multilabel_ids = np.unique(rows, return_inverse=True)
+    else:
+        _, multilabel_ids = np.unique(labels, axis=0, return_inverse=True)
+    return multilabel_ids.ravel()
+
+
 def _get_split_generator(labels, cv):
-    _, multilabel_ids = np.unique(labels, axis=0, return_inverse=True)
+    if isinstance(cv, IterativeStratifiedKFold):
+        return cv.split(X=labels, y=labels)
+    multilabel_ids = _get_multilabel_ids(labels)
     split_generator = cv.split(X=multilabel_ids, y=multilabel_ids)
     return split_generator
 
 
-def get_cross_validated_multilabel_pred_probs(X, labels: np.ndarray, *, clf, cv) -> np.ndarray:
+def get_cross_validated_multilabel_pred_probs(
+    X, labels: np.ndarray, *, clf, cv, n_jobs: Optional[int] = None
+) -> np.ndarray:
     """Get predicted probabilities for a multi-label classifier via cross-validation.
 
     Note
     ----
-    The labels are reformatted to a "multi-class" format internally to support a wider range of cross-validation strategies.
+    Unless ``cv`` is an :py:class:`IterativeStratifiedKFold <cleanlab.internal.multilabel_scorer.IterativeStratifiedKFold>`,
+    the labels are reformatted to a "multi-class" format internally to support a wider range of cross-validation strategies.
     If you have a multi-label dataset with `K` classes, the labels are reformatted to a "multi-class" format with up to `2**K` classes
     (i.e. the number of possible class-assignment configurations).
     It is unlikely that you'll all `2**K` configurations in your dataset.
+    For datasets with many classes, nearly every example may have a unique configuration,
+    so use ``IterativeStratifiedKFold`` to stratify each class separately instead.
 
     Parameters
     ----------
@@ -639,6 +796,10 @@ def get_cross_validated_multilabel_pred_probs(X, labels: np.ndarray, *, clf, cv)
     cv :
         A cross-validation splitter with a ``split`` method that returns a generator of train/test indices.
 
+    n_jobs :
+        Number of jobs used to train the classifier on the different folds in parallel.
+        ``None`` means 1, ``-1`` means using all processors. See :py:func:`sklearn.model_selection.cross_val_predict`.
+
     Returns
     -------
     pred_probs :
@@ -663,5 +824,7 @@ def get_cross_validated_multilabel_pred_probs(X, labels: np.ndarray, *, clf, cv)
     >>> get_cross_validated_multilabel_pred_probs(X, labels, clf=clf, cv=cv)
     """
     split_generator = _get_split_generator(labels, cv)
-    pred_probs = cross_val_predict(clf, X, labels, cv=split_generator, method="predict_proba")
+    pred_probs = cross_val_predict(
+        clf, X, labels, cv=split_generator, method="predict_proba", n_jobs=n_jobs
+    )
     return pred_probs
@@ -1,9 +1,11 @@
 from __future__ import annotations
+import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, TYPE_CHECKING, Tuple
 
 import numpy as np
+from joblib import effective_n_jobs
 from scipy.sparse import csr_matrix
-from scipy.linalg import circulant
 from sklearn.neighbors import NearestNeighbors
 
 if TYPE_CHECKING:
@@ -22,6 +24,20 @@ This should be the largest desired value of k for all desired issue types that r
 E.g. if near duplicates wants k=1 but outliers wants 10, then DEFAULT_K should be 10. This way, all issue types can rely on the same KNN graph.
 """
 
+KNN_GRAPH_CHUNK_SIZE = 2**16
+"""Number of examples whose nearest neighbors are searched at once
+when the KNN graph is written to memory-mapped files."""
+
+EXACT_DUPLICATE_CHUNK_SIZE = 2**22
+"""Maximum number of 64-bit words of the feature array that are hashed at once
+when searching for exact duplicates."""
+
+KNN_GRAPH_DISTANCES_FILE = "knn_graph_distances.npy"
+KNN_GRAPH_INDICES_FILE = "knn_graph_indices.npy"
+
+_MAX_INT32_INDEX = np.iinfo(np.int32).max
+"""Largest offset into the arrays of a memory-mapped KNN graph that can be stored as int32."""
+
 
 def features_to_knn(
     features: Optional[FeatureArray],
@@ -56,7 +72,7 @@ def features_to_knn(
     >>> features = np.random.rand(100, 10)
     >>> knn = features_to_knn(features)
     >>> knn
-    NearestNeighbors(metric='cosine', n_neighbors=10)
+    BlockedNearestNeighbors(metric='cosine', n_neighbors=10)
     """
     if features is None:
         raise ValueError("Both knn and features arguments cannot be None at the same time.")
@@ -145,6 +161,7 @@ def create_knn_graph_and_index(
     n_neighbors: Optional[int] = None,
     metric: Optional[Metric] = None,
     correct_exact_duplicates: bool = True,
+    memmap_dir: Optional[str] = None,
     **sklearn_knn_kwargs,
 ) -> Tuple[csr_matrix, NearestNeighbors]:
     """Calculate the KNN graph from the features if it is not provided in the kwargs.
@@ -159,6 +176,9 @@ def create_knn_graph_and_index(
         The distance metric to use for computing distances between points. If None, the metric is determined based on the feature array shape.
     correct_exact_duplicates :
         Whether to correct the KNN graph to ensure that exact duplicates have zero mutual distance, and they are correctly included in the KNN graph.
+    memmap_dir :
+        If provided, the KNN graph is built out-of-core and stored in memory-mapped files in this directory,
+        see :py:func:`construct_memmap_knn_graph_from_index`.
     **sklearn_knn_kwargs :
         Additional keyword arguments to be passed to the search index constructor.
 
@@ -189,10 +209,17 @@ def create_knn_graph_and_index(
            [0.33140006, 0.        , 0.        ],
            [0.76210367, 0.        , 0.        ]])
     >>> knn
-    NearestNeighbors(metric=<function euclidean at ...>, n_neighbors=1)  # For demonstration purposes only. The actual metric may vary.
+    BlockedNearestNeighbors(metric=<function euclidean at ...>, n_neighbors=1)  # For demonstration purposes only. The actual metric may vary.
     """
     # Construct NearestNeighbors object
     knn = features_to_knn(features, n_neighbors=n_neighbors, metric=metric, **sklearn_knn_kwargs)
+    if memmap_dir is not None:
+        assert features is not None
+        knn_graph = construct_memmap_knn_graph_from_index(
+            knn, features, memmap_dir, correct_exact_duplicates=correct_exact_duplicates
+        )
+        return knn_graph, knn
+
     # Build graph from NearestNeighbors object
     knn_graph = construct_knn_graph_from_index(knn)
 
@@ -203,6 +230,120 @@ def create_knn_graph_and_index(
     return knn_graph, knn
 
 
+def construct_memmap_knn_graph_from_index(
+    knn: NearestNeighbors,
+    features: FeatureArray,
+    directory: str,
+    *,
+    correct_exact_duplicates: bool = True,
+    chunk_size: Optional[int] = None,
+) -> csr_matrix:
+    """Construct the KNN graph of the features used to fit a search object, storing it in memory-mapped files.
+
+    Unlike :py:func:`construct_knn_graph_from_index`, the nearest neighbors of the examples are searched
+    in chunks, and written straight to disk. The distances are stored as float32 and the indices as
+    int32 (unless the graph has more than 2**31 - 1 entries), which halves the size of the graph.
+    The returned graph is a regular :py:class:`scipy.sparse.csr_matrix`, whose arrays are read-only
+    memory-mapped views of the files, so it can be passed as `knn_graph` to :py:meth:`Datalab.find_issues`.
+    It can be opened again later with :py:func:`load_memmap_knn_graph`.
+
+    Parameters
+    ----------
+    knn :
+        A k-nearest neighbors search object that has been fitted to `features`.
+    features :
+        The feature array used to fit `knn`, which may itself be memory-mapped.
+    directory :
+        The directory where the files of the graph are written. It is created if it does not exist.
+    correct_exact_duplicates :
+        Whether to correct the KNN graph to ensure that exact duplicates have zero mutual distance,
+        as in :py:func:`correct_knn_graph`.
+    chunk_size :
+        The number of examples whose nearest neighbors are searched at once.
+        Defaults to :py:data:`KNN_GRAPH_CHUNK_SIZE`.
+
+    Returns
+    -------
+    knn_graph :
+        A sparse, weighted adjacency matrix representing the KNN graph of the feature array.
+    """
+    N, k = features.shape[0], knn.n_neighbors
+    chunk_size = chunk_size or KNN_GRAPH_CHUNK_SIZE
+    index_dtype = _knn_graph_index_dtype(N, k)
+    os.makedirs(directory, exist_ok=True)
+    distances = np.lib.format.open_memmap(
+        os.path.join(directory, KNN_GRAPH_DISTANCES_FILE), mode="w+", dtype=np.float32, shape=(N, k)
+    )
+    indices = np.lib.format.open_memmap(
+        os.path.join(directory, KNN_GRAPH_INDICES_FILE), mode="w+", dtype=index_dtype, shape=(N, k)
+    )
+    for start in range(0, N, chunk_size):
+        stop = min(start + chunk_size, N)
+        distances[start:stop], indices[start:stop] = _self_kneighbors_of_chunk(
+            knn, features, start, stop
+        )
+
+    if correct_exact_duplicates:
+        correct_knn_distances_and_indices_with_exact_duplicate_sets_inplace(
+            distances=distances,
+            indices=indices,
+            exact_duplicate_sets=_compute_exact_duplicate_sets(features, n_jobs=knn.n_jobs),
+        )
+    distances.flush()
+    indices.flush()
+    del distances, indices
+    return load_memmap_knn_graph(directory)
+
+
+def load_memmap_knn_graph(directory: str) -> csr_matrix:
+    """Open a KNN graph stored by :py:func:`construct_memmap_knn_graph_from_index`, without reading it into memory.
+
+    Parameters
+    ----------
+    directory :
+        The directory where the files of the graph were written.
+
+    Returns
+    -------
+    knn_graph :
+        A sparse, weighted adjacency matrix whose arrays are read-only memory-mapped views of the files.
+    """
+    distances = np.load(os.path.join(directory, KNN_GRAPH_DISTANCES_FILE), mmap_mode="r")
+    indices = np.load(os.path.join(directory, KNN_GRAPH_INDICES_FILE), mmap_mode="r")
+    N, k = distances.shape
+    # The row offsets go up to N * k, and must have the same dtype as the indices
+    index_dtype = _knn_graph_index_dtype(N, k)
+    if indices.dtype != index_dtype:
+        # Written with int32 indices by an earlier version of cleanlab
+        indices = indices.astype(index_dtype)
+    indptr = np.arange(0, N * k + 1, k, dtype=index_dtype)
+    return csr_matrix(
+        (distances.reshape(-1), indices.reshape(-1), indptr), shape=(N, N), copy=False
+    )
+
+
+def _knn_graph_index_dtype(N: int, k: int) -> type:
+    """The integer dtype of the indices and row offsets of a KNN graph with `N * k` entries."""
+    return np.int32 if N * k <= _MAX_INT32_INDEX else np.int64
+
+
+def _self_kneighbors_of_chunk(
+    knn: NearestNeighbors, features: FeatureArray, start: int, stop: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Find the nearest neighbors of the examples ``features[start:stop]`` that were used to fit `knn`.
+
+    As with ``knn.kneighbors(X=None)``, each example is not considered its own neighbor.
+    """
+    k = knn.n_neighbors
+    distances, indices = knn.kneighbors(features[start:stop], n_neighbors=k + 1)
+    is_self = indices == np.arange(start, stop)[:, np.newaxis]
+    # An example may be missing from its own neighbors if it has many exact duplicates,
+    # then its farthest neighbor is dropped instead.
+    is_self[~is_self.any(axis=1), -1] = True
+    num_rows = stop - start
+    return distances[~is_self].reshape(num_rows, k), indices[~is_self].reshape(num_rows, k)
+
+
 def correct_knn_graph(features: FeatureArray, knn_graph: csr_matrix) -> csr_matrix:
     """
     Corrects a k-nearest neighbors (KNN) graph by handling exact duplicates in the feature array.
@@ -247,7 +388,9 @@ def correct_knn_graph(features: FeatureArray, knn_graph: csr_matrix) -> csr_matr
     )
 
 
-def _compute_exact_duplicate_sets(features: FeatureArray) -> List[np.ndarray]:
+def _compute_exact_duplicate_sets(
+    features: FeatureArray, n_jobs: Optional[int] = None
+) -> List[np.ndarray]:
     """
     Computes the sets of exact duplicate points in the feature array.
 
@@ -259,12 +402,15 @@ def _compute_exact_duplicate_sets(features: FeatureArray) -> List[np.ndarray]:
     ----------
     features : np.ndarray
         The input feature array, with shape (N, M), where N is the number of samples and M is the number of features.
+    n_jobs : int, optional
+        The number of threads used to hash the rows of the feature array.
 
     Returns
     -------
     exact_duplicate_sets
         A list of 1D arrays, where each array contains the indices of exact duplicate points in the dataset.
         Only sets with two or more duplicates are included in the list. If no exact duplicates are found, an empty list is returned.
+        The sets are ordered by their smallest index.
 
     Examples
     --------
@@ -274,20 +420,112 @@ def _compute_exact_duplicate_sets(features: FeatureArray) -> List[np.ndarray]:
 
     Notes
     -----
-    - This function uses `np.unique` to find unique feature vectors and their inverse indices.
+    - Rows are hashed into buckets (see :py:func:`_hash_rows`), and only the rows within a bucket are compared,
+      which avoids sorting the full feature array. The rows are hashed in parallel chunks.
+    - Rows are compared by value, so ``0.0`` and ``-0.0`` are equal, and rows containing NaN have no duplicates.
     - This function is intended to be used internally within this module.
     """
-    # Use np.unique to catch inverse indices of all unique feature sets
+    features = np.asarray(features)
+    if features.dtype.hasobject:
+        return _compute_exact_duplicate_sets_by_sorting(features, np.arange(len(features)))
+
+    num_rows = len(features)
+    words_per_row = max((features[:1].nbytes + 7) // 8, 1)
+    rows_per_chunk = max(EXACT_DUPLICATE_CHUNK_SIZE // words_per_row, 1)
+    chunk_starts = range(0, num_rows, rows_per_chunk)
+
+    def hash_chunk(start: int) -> Tuple[np.ndarray, np.ndarray]:
+        chunk = features[start : start + rows_per_chunk]
+        has_nan = np.zeros(len(chunk), dtype=bool)
+        if np.issubdtype(chunk.dtype, np.inexact):
+            has_nan = np.isnan(chunk).any(axis=1)
+            chunk = chunk + 0.0  # Turns -0.0 into 0.0, so that equal rows have equal bytes
+        return _hash_rows(chunk), has_nan
+
+    n_jobs = min(effective_n_jobs(n_jobs), len(chunk_starts))
+    if n_jobs > 1:
+        with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+            results = list(executor.map(hash_chunk, chunk_starts))
+    else:
+        results = [hash_chunk(start) for start in chunk_starts]
+    if not results:
+        return []
+    hashes = np.concatenate([h for h, _ in results])
+    candidates = np.flatnonzero(~np.concatenate([n for _, n in results]))
+
+    # Group the rows into buckets of equal hashes, keeping only the buckets with several rows
+    order = candidates[np.argsort(hashes[candidates], kind="stable")]
+    sorted_hashes = hashes[order]
+    is_bucket_start = np.r_[True, sorted_hashes[1:] != sorted_hashes[:-1]]
+    bucket_sizes = np.diff(np.r_[np.flatnonzero(is_bucket_start), len(order)])
+    bucket_ids = np.cumsum(is_bucket_start) - 1
+    order = order[bucket_sizes[bucket_ids] > 1]
+    if len(order) == 0:
+        return []
+    bucket_starts = np.flatnonzero(np.r_[True, hashes[order[1:]] != hashes[order[:-1]]])
+
+    # Verify that each row is equal to the first row of its bucket.
+    # Rows of buckets with hash collisions are grouped by sorting them instead.
+    first_rows = order[np.repeat(bucket_starts, np.diff(np.r_[bucket_starts, len(order)]))]
+    is_equal = np.empty(len(order), dtype=bool)
+    for start in range(0, len(order), rows_per_chunk):
+        stop = start + rows_per_chunk
+        is_equal[start:stop] = np.all(
+            features[order[start:stop]] == features[first_rows[start:stop]], axis=1
+        )
+    bucket_is_equal = np.logical_and.reduceat(is_equal, bucket_starts)
+    exact_duplicate_sets: List[np.ndarray] = []
+    for bucket, all_equal in zip(np.split(order, bucket_starts[1:]), bucket_is_equal):
+        if all_equal:
+            exact_duplicate_sets.append(bucket)
+        else:
+            exact_duplicate_sets.extend(
+                _compute_exact_duplicate_sets_by_sorting(features[bucket], bucket)
+            )
+    exact_duplicate_sets.sort(key=lambda duplicate_set: duplicate_set[0])
+    return exact_duplicate_sets
+
+
+def _compute_exact_duplicate_sets_by_sorting(
+    features: np.ndarray, row_indices: np.ndarray
+) -> List[np.ndarray]:
+    """Groups the rows of `features` that are exact duplicates, with :py:func:`numpy.unique`.
+
+    The returned sets hold the entries of `row_indices` that correspond to the duplicate rows.
+    """
     _, unique_inverse, unique_counts = np.unique(
         features, return_inverse=True, return_counts=True, axis=0
     )
-
-    # Collect different sets of exact duplicates in the dataset
-    exact_duplicate_sets = [
-        np.where(unique_inverse == u)[0] for u in set(unique_inverse) if unique_counts[u] > 1
+    unique_inverse = unique_inverse.reshape(-1)
+    return [
+        row_indices[np.where(unique_inverse == u)[0]] for u in np.flatnonzero(unique_counts > 1)
     ]
 
-    return exact_duplicate_sets
+
+def _hash_rows(rows: np.ndarray) -> np.ndarray:
+    """Computes a 64-bit hash of the bytes of each row of a 2D array.
+
+    Each 64-bit word of a row is combined with its position in the row, mixed with the
+    finalizer of the SplitMix64 generator, and the mixed words are summed (modulo 2**64).
+    Equal rows get equal hashes, while different rows rarely do.
+    """
+    rows = np.ascontiguousarray(rows)
+    row_bytes = rows.view(np.uint8).reshape(len(rows), -1)
+    if row_bytes.shape[1] % 8 != 0:
+        row_bytes = np.pad(row_bytes, ((0, 0), (0, -row_bytes.shape[1] % 8)))
+    words = row_bytes.view(np.uint64)
+    position_keys = _mix64(np.arange(1, words.shape[1] + 1, dtype=np.uint64))
+    return _mix64(words ^ position_keys).sum(axis=1, dtype=np.uint64)
+
+
+def _mix64(x: np.ndarray) -> np.ndarray:
+    """The finalizer of the SplitMix64 generator, applied to each entry of an array of uint64."""
+    x = x ^ (x >> np.uint64(30))
+    x *= np.uint64(0xBF58476D1CE4E5B9)
+    x ^= x >> np.uint64(27)
+    x *= np.uint64(0x94D049BB133111EB)
+    x ^= x >> np.uint64(31)
+    return x
 
 
 def correct_knn_distances_and_indices_with_exact_duplicate_sets_inplace(
@@ -352,46 +590,69 @@ def correct_knn_distances_and_indices_with_exact_duplicate_sets_inplace(
     """
 
     # Number of neighbors
-    k = distances.shape[1]
-
-    for duplicate_inds in exact_duplicate_sets:
+    N, k = distances.shape
+
+    # Duplicate sets of the same size are corrected together, stacked into a 2D array
+    set_sizes = np.fromiter(map(len, exact_duplicate_sets), dtype=np.intp)
+    if not np.any(set_sizes > 1):
+        return None
+    all_duplicate_inds = np.concatenate(exact_duplicate_sets)
+    set_offsets = np.cumsum(set_sizes) - set_sizes
+
+    # Label each point with the duplicate set it belongs to
+    set_ids = np.full(N, -1, dtype=np.intp)
+    set_ids[all_duplicate_inds] = np.repeat(np.arange(len(set_sizes)), set_sizes)
+
+    for num_same in np.unique(set_sizes[set_sizes > 1]).tolist():
+        # Each row holds the indices of one duplicate set
+        duplicate_sets = all_duplicate_inds[
+            set_offsets[set_sizes == num_same][:, np.newaxis] + np.arange(num_same)
+        ]
         # Determine the number of same points to include, respecting the limit of k
-        num_same = len(duplicate_inds)
         num_same_included = min(num_same - 1, k)  # ensure we do not exceed k neighbors
 
         sorted_first_k_duplicate_inds = _prepare_neighborhood_of_first_k_duplicates(
-            duplicate_inds, num_same_included
+            duplicate_sets, num_same_included
         )
 
         if num_same >= k + 1:
             # All nearest neighbors are exact duplicates
 
             # We only pass in the ciruclant matrix of nearest neighbors
-            indices[duplicate_inds[: k + 1]] = sorted_first_k_duplicate_inds
+            indices[duplicate_sets[:, : k + 1].ravel()] = sorted_first_k_duplicate_inds.reshape(
+                -1, k
+            )
             # But the rest will just take the k first duplicate ids
-            indices[duplicate_inds[k + 1 :]] = duplicate_inds[:k]
+            indices[duplicate_sets[:, k + 1 :]] = duplicate_sets[:, np.newaxis, :k]
 
             # Finally, set the distances between exact duplicates to zero
-            distances[duplicate_inds] = 0
+            distances[duplicate_sets.ravel()] = 0
         else:
             # Some of the nearest neighbors aren't exact duplicates, move those to the back
-
-            # Get indices and distances from knn that are not the same as i
-            different_point_mask = np.isin(indices[duplicate_inds], duplicate_inds, invert=True)
-
-            # Get the indices of the first m True values in each row of the mask
-            true_indices = np.argsort(~different_point_mask, axis=1)[:, :-num_same_included]
-
-            # Copy the values to the last m columns in dists
-            distances[duplicate_inds, -(k - num_same_included) :] = distances[
-                duplicate_inds, true_indices.T
-            ].T
-            indices[duplicate_inds, -(k - num_same_included) :] = indices[
-                duplicate_inds, true_indices.T
-            ].T
-
-            # We can pass the circulant matrix to a slice
-            indices[duplicate_inds, :num_same_included] = sorted_first_k_duplicate_inds
+            duplicate_inds = duplicate_sets.ravel()
+
+            # Find the neighbors that are exact duplicates of each point
+            same_point_mask = (
+                set_ids[indices[duplicate_inds]] == set_ids[duplicate_inds, np.newaxis]
+            )
+
+            # Get the columns of the first k - num_same_included different points in each row
+            different_columns = np.argsort(same_point_mask, axis=1, kind="stable")[
+                :, : k - num_same_included
+            ]
+
+            # Copy the values to the last columns
+            distances[duplicate_inds, num_same_included:] = np.take_along_axis(
+                distances[duplicate_inds], different_columns, axis=1
+            )
+            indices[duplicate_inds, num_same_included:] = np.take_along_axis(
+                indices[duplicate_inds], different_columns, axis=1
+            )
+
+            # The first columns hold the other points of the duplicate set
+            indices[duplicate_inds, :num_same_included] = sorted_first_k_duplicate_inds.reshape(
+                -1, num_same_included
+            )
 
             # Finally, set the distances between exact duplicates to zero
             distances[duplicate_inds, :num_same_included] = 0
@@ -399,18 +660,19 @@ def correct_knn_distances_and_indices_with_exact_duplicate_sets_inplace(
     return None
 
 
-def _prepare_neighborhood_of_first_k_duplicates(duplicate_inds, num_same_included):
+def _prepare_neighborhood_of_first_k_duplicates(duplicate_sets, num_same_included):
     """
     Prepare a matrix representing the neighborhoods of duplicate items.
 
     This function constructs a matrix where each row corresponds to an item
     and contains the indices of its nearest neighbors (excluding itself), up
-    to a specified number `k`.
+    to a specified number `k`. Several sets of duplicates of the same size
+    are handled at once, giving one matrix per set.
 
     Parameters:
     -----------
-    duplicate_inds : list
-        A list of indices that represent duplicate items.
+    duplicate_sets : np.ndarray
+        A 2D array where each row holds the indices of a set of duplicate items.
 
     num_same_included : int
         An integer `k` representing the number of neighbors to include for
@@ -419,13 +681,14 @@ def _prepare_neighborhood_of_first_k_duplicates(duplicate_inds, num_same_include
     Returns:
     --------
     np.ndarray
-        A matrix where each row contains the sorted indices of the nearest
+        A 3D array of shape ``(len(duplicate_sets), k + 1, k)``. For each set,
+        it holds a matrix where each row contains the sorted indices of the nearest
         neighbors for the corresponding item.
 
     Explanation:
     ------------
     1. Extract the Base for the Circulant Matrix:
-       - The function extracts the first `k+1` elements from `duplicate_inds`
+       - The function extracts the first `k+1` elements from each set of `duplicate_sets`
          to form the base of the circulant matrix. This approach ensures that
          even if the set of duplicate items is larger, we only need to consider
          the first `k` duplicates as the nearest neighbors, avoiding conflicts
@@ -482,10 +745,12 @@ def _prepare_neighborhood_of_first_k_duplicates(duplicate_inds, num_same_include
     `k+1` elements, the function avoids the need to construct a larger circulant
     matrix, simplifying the computation and ensuring no conflicts among the rest of the items.
     """
-    circulant_base = duplicate_inds[: num_same_included + 1]
-    circulant_matrix = circulant(circulant_base)
-    sliced_circulant_matrix = circulant_matrix[:, 1:]
-    sorted_first_k_duplicate_inds = np.sort(sliced_circulant_matrix, axis=1)
+    circulant_base = duplicate_sets[:, : num_same_included + 1]
+    # Same columns as scipy.linalg.circulant(circulant_base[g]), for all sets at once
+    base_size = num_same_included + 1
+    circulant_columns = (np.arange(base_size)[:, np.newaxis] - np.arange(base_size)) % base_size
+    sliced_circulant_matrix = circulant_base[:, circulant_columns[:, 1:]]
+    sorted_first_k_duplicate_inds = np.sort(sliced_circulant_matrix, axis=2)
     return sorted_first_k_duplicate_inds
 
 
@@ -1,13 +1,23 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Union
 
+import numpy as np
+from joblib import effective_n_jobs
+from scipy.sparse import csr_matrix, issparse
+from scipy.spatial.distance import euclidean
 from sklearn.neighbors import NearestNeighbors
+from sklearn.utils import check_array
 
 
 if TYPE_CHECKING:
 
     from cleanlab.typing import Metric
 
+KNN_BLOCK_SIZE = 2**22
+"""Maximum number of entries of the distance matrix that are computed at once
+by each thread of :py:class:`BlockedNearestNeighbors`."""
+
 
 def construct_knn(n_neighbors: int, metric: Metric, **knn_kwargs) -> NearestNeighbors:
     """
@@ -69,7 +79,565 @@ def construct_knn(n_neighbors: int, metric: Metric, **knn_kwargs) -> NearestNeig
     The `metric` argument should be a callable that takes two arguments (the two points) and returns the distance between them.
     The additional keyword arguments (`**knn_kwargs`) are passed directly to the underlying k-nearest neighbors search algorithm.
 
+    By default, a :py:class:`BlockedNearestNeighbors` object is returned, which searches dense numeric features
+    exactly with blocked matrix multiplications for the default metrics, and otherwise behaves like scikit-learn's
+    ``NearestNeighbors``.
+    Pass ``algorithm="ivf"`` to get an approximate :py:class:`IVFNearestNeighbors` index instead, which
+    also accepts its `n_clusters`, `n_probe`, `max_iter` and `random_state` keyword arguments.
+    """
+    if knn_kwargs.get("algorithm") == "ivf":
+        knn_kwargs.pop("algorithm")
+        return IVFNearestNeighbors(n_neighbors=n_neighbors, metric=metric, **knn_kwargs)
+    knn = BlockedNearestNeighbors(n_neighbors=n_neighbors, metric=metric, **knn_kwargs)
+
+    return knn
+
+
+class BlockedNearestNeighbors(NearestNeighbors):
+    """Exact k-nearest neighbors search for dense numeric features, based on blocked matrix multiplications.
+
+    This is a drop-in replacement for :py:class:`sklearn.neighbors.NearestNeighbors`, with the same parameters.
+    For cosine and euclidean distances (including the ``euclidean`` function from scipy),
+    whenever scikit-learn would fall back to a brute-force search, neighbors are found by:
+
+    1. Computing the distances between blocks of query points and blocks of indexed points
+       with float32 matrix multiplications, which run multi-threaded in BLAS.
+       Euclidean features are centered on the mean of the indexed points first, so that
+       a large offset of the features does not cost any precision.
+    2. Keeping a few more than the k closest candidates of each query point with
+       :py:func:`numpy.argpartition`, so that the full distance matrix is never held in memory.
+    3. Recomputing the distances to the candidates exactly in float64, and sorting them.
+    4. Checking, with a bound of the float32 rounding errors, that no other point can be closer
+       than the k-th neighbor found. Query points for which this cannot be guaranteed are searched
+       again with float64 matrix multiplications.
+
+    Blocks of query points are processed in parallel by `n_jobs` threads.
+    All other metrics, parameters and sparse features are handled by scikit-learn.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from cleanlab.internal.neighbor.search import BlockedNearestNeighbors
+    >>> features = np.array([[0.0, 1.0], [0.0, 2.0], [1.0, 0.0]])
+    >>> knn = BlockedNearestNeighbors(n_neighbors=1, metric="cosine").fit(features)
+    >>> knn.kneighbors()
+    (array([[0.],
+           [0.],
+           [1.]]), array([[1],
+           [0],
+           [0]]))
     """
-    sklearn_knn = NearestNeighbors(n_neighbors=n_neighbors, metric=metric, **knn_kwargs)
 
-    return sklearn_knn
+    def fit(self, X, y=None) -> "BlockedNearestNeighbors":
+        super().fit(X, y)
+        self._blocked_metric = self._get_blocked_metric()
+        self._blocked_center: Optional[np.ndarray] = None
+        if self._blocked_metric == "euclidean":
+            self._blocked_center = np.mean(self._fit_X, axis=0, dtype=np.float64)
+        self._blocked_fit_X: Optional[np.ndarray] = None
+        self._blocked_sq_norms: Optional[np.ndarray] = None
+        self._blocked_fit_X64: Optional[np.ndarray] = None
+        self._blocked_sq_norms64: Optional[np.ndarray] = None
+        return self
+
+    def _get_blocked_metric(self) -> Optional[str]:
+        """The metric computed with blocked matrix multiplications, if supported for the fitted data."""
+        if (
+            (self._fit_method != "brute" and self.metric is not euclidean)
+            or self.metric_params
+            or issparse(self._fit_X)
+            or not np.issubdtype(np.asarray(self._fit_X).dtype, np.number)
+        ):
+            return None
+        if self.metric is euclidean or self.metric == "euclidean":
+            return "euclidean"
+        if self.metric == "cosine":
+            return "cosine"
+        return None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The copies of the data are rebuilt when needed, instead of being pickled
+        state = super().__getstate__()
+        for key in [
+            "_blocked_fit_X",
+            "_blocked_sq_norms",
+            "_blocked_fit_X64",
+            "_blocked_sq_norms64",
+        ]:
+            state[key] = None
+        return state
+
+    def _prepare_blocked_features(
+        self, X: np.ndarray, dtype: type = np.float32
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Casts features to `dtype`, normalized for cosine distances and centered for euclidean distances,
+        along with their squared norms (which are 1 for cosine distances)."""
+        X_prepared = np.empty(X.shape, dtype=dtype)
+        sq_norms = np.ones(X.shape[0], dtype=dtype)
+        rows_per_chunk = max(KNN_BLOCK_SIZE // max(X.shape[1], 1), 1)
+        for start in range(0, X.shape[0], rows_per_chunk):
+            chunk = np.array(X[start : start + rows_per_chunk], dtype=np.float64)
+            chunk_sq_norms = np.einsum("ij,ij->i", chunk, chunk)
+            if self._blocked_metric == "cosine":
+                norms = np.sqrt(chunk_sq_norms)
+                norms[norms == 0] = 1
+                chunk /= norms[:, np.newaxis]
+            else:
+                chunk -= self._blocked_center
+                sq_norms[start : start + rows_per_chunk] = np.einsum("ij,ij->i", chunk, chunk)
+            X_prepared[start : start + rows_per_chunk] = chunk
+        return X_prepared, sq_norms
+
+    def kneighbors(
+        self,
+        X=None,
+        n_neighbors: Optional[int] = None,
+        return_distance: bool = True,
+    ) -> Union[Tuple[np.ndarray, np.ndarray], np.ndarray]:
+        if getattr(self, "_blocked_metric", None) is None or (X is not None and issparse(X)):
+            return super().kneighbors(X, n_neighbors=n_neighbors, return_distance=return_distance)
+
+        if n_neighbors is None:
+            n_neighbors = self.n_neighbors
+        query_is_train = X is None
+        X_query = self._fit_X if query_is_train else check_array(X)
+        if X_query.ndim != 2 or X_query.shape[1] != self.n_features_in_:
+            raise ValueError(
+                f"X has {X_query.shape[-1]} features, but {self.__class__.__name__} "
+                f"is expecting {self.n_features_in_} features as input."
+            )
+        n_samples_fit = self.n_samples_fit_
+        if n_neighbors > n_samples_fit - query_is_train:
+            raise ValueError(
+                "Expected n_neighbors < n_samples_fit, but "
+                f"n_neighbors = {n_neighbors}, n_samples_fit = {n_samples_fit}, "
+                f"n_samples = {X_query.shape[0]}"
+                if query_is_train
+                else "Expected n_neighbors <= n_samples_fit, but "
+                f"n_neighbors = {n_neighbors}, n_samples_fit = {n_samples_fit}, "
+                f"n_samples = {X_query.shape[0]}"
+            )
+
+        if self._blocked_fit_X is None:
+            self._blocked_fit_X, self._blocked_sq_norms = self._prepare_blocked_features(
+                self._fit_X
+            )
+        if query_is_train:
+            Q32 = self._blocked_fit_X
+        else:
+            Q32, _ = self._prepare_blocked_features(X_query)
+
+        self_indices = np.arange(n_samples_fit) if query_is_train else None
+        distances, indices = self._search(X_query, Q32, n_neighbors, self_indices)
+        if return_distance:
+            return distances, indices
+        return indices
+
+    def _search(
+        self,
+        X_query: np.ndarray,
+        Q32: np.ndarray,
+        k: int,
+        self_indices: Optional[np.ndarray] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Finds the k nearest neighbors of the query points, given as-is and as prepared float32 features.
+
+        If `self_indices` is given, it holds the index of each query point among the indexed points,
+        which is excluded from its own neighbors.
+        """
+        num_queries = X_query.shape[0]
+        rows_per_block = int(np.clip(KNN_BLOCK_SIZE // max(self.n_samples_fit_, 1), 64, 1024))
+        row_starts = range(0, num_queries, rows_per_block)
+        # A few extra candidates leave room for the rounding errors of the float32 search
+        num_available = self.n_samples_fit_ - (self_indices is not None)
+        num_candidates = min(k + max(k, 8), num_available)
+        max_norm = np.sqrt(np.max(self._blocked_sq_norms, initial=0))
+
+        def search_block(start: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+            stop = min(start + rows_per_block, num_queries)
+            values, candidates = self._kneighbors_block(
+                Q32[start:stop],
+                num_candidates,
+                self_indices=None if self_indices is None else self_indices[start:stop],
+            )
+            distances, indices = self._refine_block(X_query[start:stop], candidates)
+            distances, indices = distances[:, :k], indices[:, :k]
+            if num_candidates == num_available:
+                certified = np.ones(stop - start, dtype=bool)
+            else:
+                certified = self._is_certified(
+                    X_query[start:stop], Q32[start:stop], values, distances, max_norm
+                )
+            return distances, indices, certified
+
+        n_jobs = min(effective_n_jobs(self.n_jobs), len(row_starts))
+        if n_jobs > 1:
+            with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+                results = list(executor.map(search_block, row_starts))
+        else:
+            results = [search_block(start) for start in row_starts]
+
+        if not results:
+            return np.empty((0, k), dtype=np.float64), np.empty((0, k), dtype=np.intp)
+        distances = np.concatenate([d for d, _, _ in results])
+        indices = np.concatenate([i for _, i, _ in results])
+
+        # Search again in float64 for the query points whose neighbors are not certainly exact
+        uncertain = np.flatnonzero(~np.concatenate([c for _, _, c in results]))
+        if len(uncertain):
+            if self._blocked_fit_X64 is None:
+                self._blocked_fit_X64, self._blocked_sq_norms64 = self._prepare_blocked_features(
+                    self._fit_X, dtype=np.float64
+                )
+            for start in range(0, len(uncertain), rows_per_block):
+                rows = uncertain[start : start + rows_per_block]
+                Q64, _ = self._prepare_blocked_features(X_query[rows], dtype=np.float64)
+                _, candidates = self._kneighbors_block(
+                    Q64,
+                    k,
+                    self_indices=None if self_indices is None else self_indices[rows],
+                    fit_X=self._blocked_fit_X64,
+                    fit_sq_norms=self._blocked_sq_norms64,
+                )
+                distances[rows], indices[rows] = self._refine_block(X_query[rows], candidates)
+        return distances, indices
+
+    def _kneighbors_block(
+        self,
+        Q: np.ndarray,
+        k: int,
+        self_indices: Optional[np.ndarray] = None,
+        fit_X: Optional[np.ndarray] = None,
+        fit_sq_norms: Optional[np.ndarray] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Finds the (unordered) k nearest neighbors of a block of prepared query points.
+
+        The indexed points are processed in blocks, keeping the k closest candidates seen so far.
+        If `self_indices` is given, each query point is excluded from its own neighbors.
+        The prepared indexed points default to the float32 ones.
+
+        Returns the squared distances to the candidates, up to the squared norm of each query point,
+        along with their indices.
+        """
+        if fit_X is None:
+            fit_X, fit_sq_norms = self._blocked_fit_X, self._blocked_sq_norms
+        num_rows = Q.shape[0]
+        n_samples_fit = fit_X.shape[0]
+        cols_per_block = max(KNN_BLOCK_SIZE // max(num_rows, 1), k + 1)
+        rows = np.arange(num_rows)
+
+        best_distances = np.empty((num_rows, 0), dtype=fit_X.dtype)
+        best_indices = np.empty((num_rows, 0), dtype=np.intp)
+        for col_start in range(0, n_samples_fit, cols_per_block):
+            col_stop = min(col_start + cols_per_block, n_samples_fit)
+            # Squared euclidean distances (between normalized points for cosine),
+            # up to the squared norms of the query points, which don't affect the ranking.
+            block = Q @ fit_X[col_start:col_stop].T
+            block *= -2
+            block += fit_sq_norms[col_start:col_stop]
+            if self_indices is not None:
+                self_cols = self_indices - col_start
+                in_block = (self_cols >= 0) & (self_cols < col_stop - col_start)
+                block[rows[in_block], self_cols[in_block]] = np.inf
+
+            top_k = _argsmallest_k(block, k)
+            candidate_distances = np.concatenate(
+                [best_distances, np.take_along_axis(block, top_k, axis=1)], axis=1
+            )
+            candidate_indices = np.concatenate([best_indices, top_k + col_start], axis=1)
+            if candidate_distances.shape[1] > k:
+                top_k = _argsmallest_k(candidate_distances, k)
+                candidate_distances = np.take_along_axis(candidate_distances, top_k, axis=1)
+                candidate_indices = np.take_along_axis(candidate_indices, top_k, axis=1)
+            best_distances, best_indices = candidate_distances, candidate_indices
+        return best_distances, best_indices
+
+    def _is_certified(
+        self,
+        X_query: np.ndarray,
+        Q32: np.ndarray,
+        candidate_values: np.ndarray,
+        distances: np.ndarray,
+        max_norm: float,
+    ) -> np.ndarray:
+        """Checks which query points are guaranteed to have found their exact k nearest neighbors.
+
+        `candidate_values` are the float32 values used to select the candidates of each query point
+        (see :py:meth:`_kneighbors_block`), `distances` the exact, sorted distances to its k nearest
+        candidates, and `max_norm` the largest norm of the prepared indexed points.
+        Every point that is not a candidate has a float32 value at least as large as the largest value
+        of the candidates. Up to the rounding errors of the float32 computations, which are bounded from
+        the norms of the points, this value must not be smaller than the value of the k-th neighbor found.
+        """
+        kth_distances = distances[:, -1]
+        if self._blocked_metric == "cosine":
+            kth_values = 2 * kth_distances - 1
+        else:
+            centered_query = np.asarray(X_query, dtype=np.float64) - self._blocked_center
+            kth_values = kth_distances**2 - np.einsum("ij,ij->i", centered_query, centered_query)
+
+        # Error bound of float32 inner products of length d, of the norms and of the casts to float32
+        eps = np.finfo(np.float32).eps
+        query_norms = np.sqrt(np.einsum("ij,ij->i", Q32, Q32, dtype=np.float64))
+        error_bounds = (Q32.shape[1] + 8) * eps * (query_norms + max_norm) ** 2
+        return candidate_values.max(axis=1) - error_bounds >= kth_values
+
+    def _refine_block(
+        self, X_query: np.ndarray, indices: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Computes the exact (float64) distances to the selected neighbors, and sorts them."""
+        query = np.asarray(X_query, dtype=np.float64)[:, np.newaxis, :]
+        neighbors = np.asarray(self._fit_X[indices], dtype=np.float64)
+        if self._blocked_metric == "cosine":
+            query_norms = np.linalg.norm(query, axis=2)
+            neighbor_norms = np.linalg.norm(neighbors, axis=2)
+            query_norms[query_norms == 0] = 1
+            neighbor_norms[neighbor_norms == 0] = 1
+            similarities = np.einsum(
+                "ijk,ijk->ij", np.broadcast_to(query, neighbors.shape), neighbors
+            )
+            distances = np.clip(1 - similarities / (query_norms * neighbor_norms), 0, 2)
+        else:
+            differences = neighbors - query
+            distances = np.sqrt(np.einsum("ijk,ijk->ij", differences, differences))
+        # Sort by distance, breaking ties by index
+        order = np.lexsort((indices, distances), axis=1)
+        return np.take_along_axis(distances, order, axis=1), np.take_along_axis(
+            indices, order, axis=1
+        )
+
+
+class IVFNearestNeighbors(BlockedNearestNeighbors):
+    """Approximate k-nearest neighbors search with an inverted file (IVF) index.
+
+    The indexed points are partitioned into `n_clusters` clusters with k-means (spherical k-means for
+    cosine distances). Each query point is only compared against the points of its `n_probe` closest
+    clusters, so a search costs roughly ``n_probe / n_clusters`` of an exact search.
+    Larger values of `n_probe` trade speed for recall; with ``n_probe >= n_clusters``, the search is exact.
+
+    The search is approximate only in which neighbors are found: the distances to the returned neighbors
+    are exact, as in :py:class:`BlockedNearestNeighbors`. Query points for which fewer than `n_neighbors`
+    candidates are found in their probed clusters are searched exactly.
+    The index is only used for the metrics supported by :py:class:`BlockedNearestNeighbors`, otherwise
+    neighbors are found exactly by scikit-learn.
+
+    Parameters
+    ----------
+    n_clusters :
+        Number of clusters of the index. If None, the square root of the number of indexed points is used.
+    n_probe :
+        Number of clusters searched for each query point.
+    max_iter :
+        Number of k-means iterations used to fit the cluster centroids.
+    random_state :
+        Seed of the random sampling of points used to fit the cluster centroids.
+
+    See :py:class:`sklearn.neighbors.NearestNeighbors` for the other parameters.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from cleanlab.internal.neighbor.search import IVFNearestNeighbors
+    >>> features = np.random.default_rng(0).normal(size=(10000, 32))
+    >>> knn = IVFNearestNeighbors(n_neighbors=10, metric="cosine", n_probe=8).fit(features)
+    >>> distances, indices = knn.kneighbors()
+    >>> indices.shape
+    (10000, 10)
+    """
+
+    def __init__(
+        self,
+        *,
+        n_neighbors: int = 5,
+        radius: float = 1.0,
+        algorithm: str = "auto",
+        leaf_size: int = 30,
+        metric: Metric = "minkowski",
+        p: float = 2,
+        metric_params: Optional[Dict[str, Any]] = None,
+        n_jobs: Optional[int] = None,
+        n_clusters: Optional[int] = None,
+        n_probe: int = 8,
+        max_iter: int = 10,
+        random_state: Optional[int] = 0,
+    ):
+        super().__init__(
+            n_neighbors=n_neighbors,
+            radius=radius,
+            algorithm=algorithm,
+            leaf_size=leaf_size,
+            metric=metric,
+            p=p,
+            metric_params=metric_params,
+            n_jobs=n_jobs,
+        )
+        self.n_clusters = n_clusters
+        self.n_probe = n_probe
+        self.max_iter = max_iter
+        self.random_state = random_state
+
+    def fit(self, X, y=None) -> "IVFNearestNeighbors":
+        super().fit(X, y)
+        self.cluster_centers_: Optional[np.ndarray] = None
+        if self._blocked_metric is None:
+            return self
+
+        self._blocked_fit_X, self._blocked_sq_norms = self._prepare_blocked_features(self._fit_X)
+        N = self.n_samples_fit_
+        n_clusters = self.n_clusters or int(np.sqrt(N))
+        n_clusters = int(np.clip(n_clusters, 1, N))
+        self.cluster_centers_ = self._fit_centroids(self._blocked_fit_X, n_clusters)
+
+        # Inverted lists: the points of each cluster are stored contiguously
+        labels = self._assign_clusters(self._blocked_fit_X)
+        self._list_points = np.argsort(labels, kind="stable")
+        self._list_offsets = np.concatenate(
+            [[0], np.cumsum(np.bincount(labels, minlength=n_clusters))]
+        )
+        return self
+
+    def _fit_centroids(self, X32: np.ndarray, n_clusters: int) -> np.ndarray:
+        """Runs k-means (on a sample of at most 256 points per cluster) and returns the centroids."""
+        rng = np.random.default_rng(self.random_state)
+        N = X32.shape[0]
+        sample = X32[np.sort(rng.choice(N, size=min(N, 256 * n_clusters), replace=False))]
+        centroids = sample[rng.choice(len(sample), size=n_clusters, replace=False)].copy()
+        for _ in range(self.max_iter):
+            labels = self._assign_clusters(sample, centroids)
+            counts = np.bincount(labels, minlength=n_clusters)
+            # Sum the points of each cluster with a sparse one-hot matrix product
+            one_hot = csr_matrix(
+                (np.ones(len(labels), dtype=np.float32), (labels, np.arange(len(labels)))),
+                shape=(n_clusters, len(labels)),
+            )
+            sums = np.asarray(one_hot @ sample)
+            non_empty = counts > 0
+            centroids[non_empty] = sums[non_empty] / counts[non_empty, np.newaxis]
+            # Empty clusters are restarted from random points
+            num_empty = int(np.sum(~non_empty))
+            if num_empty:
+                centroids[~non_empty] = sample[rng.choice(len(sample), size=num_empty)]
+            if self._blocked_metric == "cosine":
+                norms = np.linalg.norm(centroids, axis=1)
+                norms[norms == 0] = 1
+                centroids /= norms[:, np.newaxis]
+        return centroids
+
+    def _closest_clusters(
+        self, X32: np.ndarray, num_closest: int, centroids: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Returns the indices of the (unordered) closest cluster centroids of each point."""
+        if centroids is None:
+            centroids = self.cluster_centers_
+        centroid_sq_norms = np.einsum("ij,ij->i", centroids, centroids)
+        rows_per_block = max(KNN_BLOCK_SIZE // len(centroids), 1)
+        closest = np.empty((X32.shape[0], num_closest), dtype=np.intp)
+        for start in range(0, X32.shape[0], rows_per_block):
+            block = X32[start : start + rows_per_block] @ centroids.T
+            block *= -2
+            block += centroid_sq_norms
+            closest[start : start + rows_per_block] = _argsmallest_k(block, num_closest)
+        return closest
+
+    def _assign_clusters(
+        self, X32: np.ndarray, centroids: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Returns the index of the closest cluster centroid of each point."""
+        return self._closest_clusters(X32, 1, centroids)[:, 0]
+
+    def _search(
+        self,
+        X_query: np.ndarray,
+        Q32: np.ndarray,
+        k: int,
+        self_indices: Optional[np.ndarray] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        n_clusters = len(self.cluster_centers_)
+        if self.n_probe >= n_clusters:
+            return super()._search(X_query, Q32, k, self_indices)
+
+        num_queries = Q32.shape[0]
+        probes = self._closest_clusters(Q32, self.n_probe)
+
+        # Visit the clusters one at a time, along with all query points that probe them
+        probing_queries = np.argsort(probes.ravel(), kind="stable") // self.n_probe
+        probe_offsets = np.concatenate(
+            [[0], np.cumsum(np.bincount(probes.ravel(), minlength=n_clusters))]
+        )
+        position_in_list = np.empty(self.n_samples_fit_, dtype=np.intp)
+        position_in_list[self._list_points] = np.arange(self.n_samples_fit_)
+
+        best_distances = np.full((num_queries, k), np.inf, dtype=np.float32)
+        best_indices = np.full((num_queries, k), -1, dtype=np.intp)
+        for cluster in range(n_clusters):
+            list_start, list_stop = self._list_offsets[cluster], self._list_offsets[cluster + 1]
+            queries = probing_queries[probe_offsets[cluster] : probe_offsets[cluster + 1]]
+            if list_start == list_stop or len(queries) == 0:
+                continue
+            points = self._list_points[list_start:list_stop]
+            X32 = self._blocked_fit_X[points]
+            sq_norms = self._blocked_sq_norms[points]
+            rows_per_block = max(KNN_BLOCK_SIZE // len(points), 1)
+            for start in range(0, len(queries), rows_per_block):
+                rows = queries[start : start + rows_per_block]
+                block = Q32[rows] @ X32.T
+                block *= -2
+                block += sq_norms
+                if self_indices is not None:
+                    self_cols = position_in_list[self_indices[rows]] - list_start
+                    in_list = (self_cols >= 0) & (self_cols < len(points))
+                    block[np.flatnonzero(in_list), self_cols[in_list]] = np.inf
+
+                top_k = _argsmallest_k(block, min(k, len(points)))
+                candidate_distances = np.concatenate(
+                    [best_distances[rows], np.take_along_axis(block, top_k, axis=1)], axis=1
+                )
+                candidate_indices = np.concatenate([best_indices[rows], points[top_k]], axis=1)
+                top_k = _argsmallest_k(candidate_distances, k)
+                best_distances[rows] = np.take_along_axis(candidate_distances, top_k, axis=1)
+                best_indices[rows] = np.take_along_axis(candidate_indices, top_k, axis=1)
+
+        # Refine the distances in chunks, to bound the memory used for the float64 neighbors
+        rows_per_block = max(KNN_BLOCK_SIZE // (k * X_query.shape[1] or 1), 1)
+        distances = np.empty((num_queries, k), dtype=np.float64)
+        indices = np.empty((num_queries, k), dtype=np.intp)
+        complete = np.isfinite(best_distances).all(axis=1)
+        for start in range(0, num_queries, rows_per_block):
+            rows = np.arange(start, min(start + rows_per_block, num_queries))
+            rows = rows[complete[rows]]
+            distances[rows], indices[rows] = self._refine_block(X_query[rows], best_indices[rows])
+
+        # Too few candidates were found in the probed clusters of some query points
+        incomplete = np.flatnonzero(~complete)
+        if len(incomplete):
+            distances[incomplete], indices[incomplete] = super()._search(
+                X_query[incomplete],
+                Q32[incomplete],
+                k,
+                None if self_indices is None else self_indices[incomplete],
+            )
+        return distances, indices
+
+
+def _argsmallest_k(values: np.ndarray, k: int) -> np.ndarray:
+    """Returns the column indices of the (unordered) k smallest values in each row of a 2D array.
+
+    For wide arrays, a strided subset of the columns is partitioned first. The k-th smallest value of
+    each row in that subset bounds the k-th smallest value of the whole row, so only the few values below
+    that bound have to be sorted, instead of partitioning every row in full.
+    """
+    num_rows, num_cols = values.shape
+    if num_cols <= k:
+        return np.broadcast_to(np.arange(num_cols), values.shape)
+    stride = num_cols // max(int(2 * np.sqrt(k * num_cols)), k + 1)
+    if stride < 4:
+        return np.argpartition(values, k - 1, axis=1)[:, :k]
+
+    # Upper bound of the k-th smallest value in each row, from every stride-th column.
+    bounds = np.partition(values[:, ::stride], k - 1, axis=1)[:, k - 1]
+    candidate_rows, candidate_cols = np.nonzero(values <= bounds[:, np.newaxis])
+
+    # Each row has at least k candidates, sort them by row, then by value.
+    order = np.lexsort((values[candidate_rows, candidate_cols], candidate_rows))
+    row_starts = np.searchsorted(candidate_rows[order], np.arange(num_rows))
+    return candidate_cols[order][row_starts[:, np.newaxis] + np.arange(k)]
@@ -173,18 +173,70 @@ def _get_outre_score_for_each_label(
         Contains one score (between 0 and 1) per example.
         Lower scores indicate more likely mislabled examples.
     """
-    residual = predictions - labels
-    labels = (labels - labels.mean()) / (labels.std() + TINY_VALUE)
-    residual = residual_scale * ((residual - residual.mean()) / (residual.std() + TINY_VALUE))
+    scorer = _OutreScorer(
+        residual_scale=residual_scale,
+        frac_neighbors=frac_neighbors,
+        neighbor_metric=neighbor_metric,
+    )
+    return scorer.fit_score(labels, predictions)
 
-    # 2D features by combining labels and residual
-    features = np.array([labels, residual]).T
 
-    neighbors = int(np.ceil(frac_neighbors * labels.shape[0]))
-    # Use provided metric or select a decent implementation of the euclidean metric for knn search
-    neighbor_metric = neighbor_metric or decide_euclidean_metric(features)
-    knn = features_to_knn(features, n_neighbors=neighbors, metric=neighbor_metric)
-    ood = OutOfDistribution(params={"knn": knn})
+class _OutreScorer:
+    """Computes OUTRE based label-quality scores, remembering the dataset they were fit on.
 
-    label_quality_scores = ood.score(features=features)
-    return label_quality_scores
+    The statistics used to standardize the labels and residuals of the dataset, and the
+    ``OutOfDistribution`` estimator fit on the resulting 2D points, are kept, so that
+    new examples can be scored against the original dataset with :py:meth:`score`.
+
+    See `~cleanlab.regression.rank._get_outre_score_for_each_label` for a description of the parameters.
+    """
+
+    def __init__(
+        self,
+        *,
+        residual_scale: float = 5,
+        frac_neighbors: float = 0.5,
+        neighbor_metric: Optional[Union[str, Callable]] = None,
+    ):
+        self.residual_scale = residual_scale
+        self.frac_neighbors = frac_neighbors
+        self.neighbor_metric = neighbor_metric
+        self.label_mean: float = 0.0
+        self.label_std: float = 1.0
+        self.residual_mean: float = 0.0
+        self.residual_std: float = 1.0
+        self.ood: Optional[OutOfDistribution] = None
+
+    def _to_features(self, labels: np.ndarray, predictions: np.ndarray) -> np.ndarray:
+        """Combines the standardized labels and residuals into 2D features."""
+        residual = predictions - labels
+        labels = (labels - self.label_mean) / (self.label_std + TINY_VALUE)
+        residual = self.residual_scale * (
+            (residual - self.residual_mean) / (self.residual_std + TINY_VALUE)
+        )
+        return np.array([labels, residual]).T
+
+    def fit_score(self, labels: np.ndarray, predictions: np.ndarray) -> np.ndarray:
+        """Fits the scorer on a dataset and returns the label-quality scores of its examples."""
+        residual = predictions - labels
+        self.label_mean, self.label_std = labels.mean(), labels.std()
+        self.residual_mean, self.residual_std = residual.mean(), residual.std()
+
+        # 2D features by combining labels and residual
+        features = self._to_features(labels, predictions)
+
+        neighbors = int(np.ceil(self.frac_neighbors * labels.shape[0]))
+        # Use provided metric or select a decent implementation of the euclidean metric for knn search
+        neighbor_metric = self.neighbor_metric or decide_euclidean_metric(features)
+        knn = features_to_knn(features, n_neighbors=neighbors, metric=neighbor_metric)
+        self.ood = OutOfDistribution(params={"knn": knn})
+
+        label_quality_scores = self.ood.score(features=features)
+        return label_quality_scores
+
+    def score(self, labels: np.ndarray, predictions: np.ndarray) -> np.ndarray:
+        """Returns label-quality scores of new examples, relative to the dataset the scorer was fit on."""
+        if self.ood is None:
+            raise ValueError("The scorer needs to be fit on a dataset first. Call `fit_score()`.")
+        features = self._to_features(labels, predictions)
+        return self.ood.score(features=features)
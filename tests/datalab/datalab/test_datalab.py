@@ -17,6 +17,7 @@
 
 import contextlib
 import io
+import json
 import os
 import pickle
 import timeit
@@ -419,8 +420,10 @@ class TestDatalab:
         lab.save(tmp_path, force=True)
         assert tmp_path.exists(), "Save directory was not created"
         assert (tmp_path / "data").is_dir(), "Data directory was not saved"
-        assert (tmp_path / "issues.csv").exists(), "Issues file was not saved"
-        assert (tmp_path / "summary.csv").exists(), "Issue summary file was not saved"
+        assert (tmp_path / "issues.parquet").exists(), "Issues file was not saved"
+        assert (tmp_path / "summary.parquet").exists(), "Issue summary file was not saved"
+        assert (tmp_path / "info").is_dir(), "Info directory was not saved"
+        assert (tmp_path / "manifest.json").exists(), "Manifest file was not saved"
         assert (tmp_path / "datalab.pkl").exists(), "Datalab file was not saved"
 
         # Mock the issues dataframe
@@ -441,8 +444,8 @@ class TestDatalab:
         )
         monkeypatch.setattr(lab, "issue_summary", mock_issue_summary)
         lab.save(tmp_path, force=True)
-        assert (tmp_path / "issues.csv").exists(), "Issues file was not saved"
-        assert (tmp_path / "summary.csv").exists(), "Issue summary file was not saved"
+        assert (tmp_path / "issues.parquet").exists(), "Issues file was not saved"
+        assert (tmp_path / "summary.parquet").exists(), "Issue summary file was not saved"
 
         # Save works in an arbitrary directory, that should be created if it doesn't exist
         new_dir = tmp_path / "subdir"
@@ -508,6 +511,94 @@ class TestDatalab:
             )
             assert expected_error_msg == str(excinfo.value)
 
+    def test_save_and_load_found_issues(self, tmp_path):
+        """Test that the results of `find_issues` survive a round trip to disk,
+        including the knn graph and the near-duplicate sets."""
+        np.random.seed(SEED)
+        features = np.random.rand(40, 5)
+        features[1] = features[0]
+        labels = np.random.randint(0, 2, 40)
+        lab = Datalab(data={"features": features, "label": labels}, label_name="label")
+        lab.find_issues(features=features, issue_types={"outlier": {}, "near_duplicate": {}})
+        lab.save(tmp_path, force=True)
+
+        loaded_lab = Datalab.load(tmp_path)
+        pd.testing.assert_frame_equal(loaded_lab.issue_summary, lab.issue_summary)
+        pd.testing.assert_frame_equal(loaded_lab.issues, lab.issues)
+
+        knn_graph = lab.info["statistics"]["weighted_knn_graph"]
+        loaded_knn_graph = loaded_lab.info["statistics"]["weighted_knn_graph"]
+        assert isinstance(loaded_knn_graph, csr_matrix)
+        assert (loaded_knn_graph != knn_graph).nnz == 0
+
+        near_duplicate_sets = lab.get_info("near_duplicate")["near_duplicate_sets"]
+        loaded_sets = loaded_lab.get_info("near_duplicate")["near_duplicate_sets"]
+        assert len(loaded_sets) == len(near_duplicate_sets)
+        for loaded_set, near_duplicate_set in zip(loaded_sets, near_duplicate_sets):
+            np.testing.assert_array_equal(loaded_set, near_duplicate_set)
+
+        outlier_info = lab.get_info("outlier")
+        loaded_outlier_info = loaded_lab.get_info("outlier")
+        assert loaded_outlier_info["nearest_neighbor"] == outlier_info["nearest_neighbor"]
+        assert loaded_outlier_info["k"] == outlier_info["k"]
+        np.testing.assert_array_equal(
+            loaded_outlier_info["knn"].kneighbors(features[:3])[1],
+            outlier_info["knn"].kneighbors(features[:3])[1],
+        )
+
+        # A loaded Datalab can be saved again
+        loaded_lab.save(tmp_path / "resaved")
+        resaved_lab = Datalab.load(tmp_path / "resaved")
+        pd.testing.assert_frame_equal(resaved_lab.issues, lab.issues)
+
+    def test_save_loaded_lab_to_same_path(self, lab, tmp_path):
+        """Arrays that are memory-mapped from the saved folder survive overwriting that folder."""
+        lab.find_issues(issue_types={"class_imbalance": {}})
+        scores = np.random.RandomState(SEED).rand(100_000)
+        lab.info["class_imbalance"]["scores"] = scores
+        lab.save(tmp_path, force=True)
+
+        loaded_lab = Datalab.load(tmp_path)
+        assert isinstance(loaded_lab.info["class_imbalance"]["scores"], np.memmap)
+        # Shift the files that the info values are saved to
+        loaded_lab.info["class_imbalance"] = {
+            "new": scores[::-1],
+            **loaded_lab.info["class_imbalance"],
+        }
+        loaded_lab.save(tmp_path, force=True)
+
+        resaved_lab = Datalab.load(tmp_path)
+        np.testing.assert_array_equal(resaved_lab.info["class_imbalance"]["scores"], scores)
+        np.testing.assert_array_equal(resaved_lab.info["class_imbalance"]["new"], scores[::-1])
+
+    def test_load_is_lazy(self, lab, tmp_path):
+        lab.find_issues(issue_types={"class_imbalance": {}})
+        lab.save(tmp_path, force=True)
+        loaded_lab = Datalab.load(tmp_path)
+        data_issues = loaded_lab.data_issues
+        assert set(data_issues._lazy_attributes) == {"issues", "info"}
+
+        loaded_lab.get_issue_summary()
+        assert set(data_issues._lazy_attributes) == {"issues", "info"}
+
+        loaded_lab.issues
+        assert set(data_issues._lazy_attributes) == {"info"}
+
+        # Pickling loads the remaining attributes
+        unpickled_lab = pickle.loads(pickle.dumps(loaded_lab))
+        assert not data_issues._lazy_attributes
+        pd.testing.assert_frame_equal(unpickled_lab.issues, lab.issues)
+        assert unpickled_lab.info.keys() == lab.info.keys()
+
+    def test_load_newer_format_version(self, lab, tmp_path):
+        lab.save(tmp_path, force=True)
+        manifest_path = tmp_path / "manifest.json"
+        manifest = json.loads(manifest_path.read_text())
+        manifest["format_version"] += 1
+        manifest_path.write_text(json.dumps(manifest))
+        with pytest.raises(ValueError, match="upgrade cleanlab"):
+            Datalab.load(tmp_path)
+
     @pytest.mark.parametrize("list_possible_issue_types", [["erroneous_issue_type"]], indirect=True)
     def test_failed_issue_managers(self, lab, monkeypatch, list_possible_issue_types):
         """Test that a failed issue manager will not be added to the Datalab instance after
@@ -2148,3 +2239,154 @@ class TestDatalabGetIssuesMethod:
 
         # Make sure code works for get_issues while no issues are found
         assert not lab.get_issues("label").empty
+
+
+class TestDatalabUpdate:
+    N, M, K = 200, 20, 3
+
+    @pytest.fixture
+    def data(self):
+        np.random.seed(SEED)
+        N, M, K = self.N, self.M, self.K
+        X = np.random.rand(N + M, 4)
+        X[N + 1] = X[3]  # Exact duplicate of a previous example
+        X[N + 2] = X[N + 5]  # Exact duplicates among the new examples
+        y = np.random.randint(0, K, size=N + M)
+        pred_probs = np.random.dirichlet(np.ones(K), size=N + M)
+        return {"X": X, "y": y, "pred_probs": pred_probs}
+
+    @pytest.fixture
+    def lab(self, data):
+        N = self.N
+        lab = Datalab(data={"y": data["y"][:N]}, label_name="y")
+        lab.find_issues(
+            features=data["X"][:N],
+            pred_probs=data["pred_probs"][:N],
+            issue_types={
+                "label": {},
+                "outlier": {},
+                "near_duplicate": {},
+                "class_imbalance": {},
+                "non_iid": {},
+            },
+        )
+        return lab
+
+    def test_update(self, lab, data):
+        N, M = self.N, self.M
+        lab.update({"y": data["y"][N:]}, features=data["X"][N:], pred_probs=data["pred_probs"][N:])
+
+        assert len(lab.data) == len(lab.issues) == N + M
+        assert lab.get_info("statistics")["num_examples"] == N + M
+        assert lab.stale_issue_types == ["non_iid"]
+        assert lab.issues["is_non_iid_issue"].iloc[N:].isna().all()
+        updated_issue_types = ["label", "outlier", "near_duplicate", "class_imbalance"]
+        for issue_type in updated_issue_types:
+            assert lab.issues[f"{issue_type}_score"].notna().all()
+
+        # Near-duplicates are inserted into the sets of previous and new examples
+        near_duplicate_sets = lab.get_info("near_duplicate")["near_duplicate_sets"]
+        assert N + 1 in near_duplicate_sets[3] and 3 in near_duplicate_sets[N + 1]
+        assert N + 5 in near_duplicate_sets[N + 2] and N + 2 in near_duplicate_sets[N + 5]
+        assert lab.get_issues("near_duplicate")["near_duplicate_score"][[3, N + 1]].tolist() == [
+            0,
+            0,
+        ]
+
+        # Results match an audit of the full dataset for the incrementally updated issue types
+        full_lab = Datalab(data={"y": data["y"]}, label_name="y")
+        full_lab.find_issues(
+            features=data["X"],
+            pred_probs=data["pred_probs"],
+            issue_types={issue_type: {} for issue_type in updated_issue_types},
+        )
+        pd.testing.assert_frame_equal(
+            lab.get_issues("class_imbalance"), full_lab.get_issues("class_imbalance")
+        )
+        # The radius for near-duplicates is kept from the previous audit, the nearest neighbors are exact
+        np.testing.assert_allclose(
+            lab.get_info("near_duplicate")["distance_to_nearest_neighbor"],
+            full_lab.get_info("near_duplicate")["distance_to_nearest_neighbor"],
+        )
+        np.testing.assert_allclose(
+            lab.get_issues("label")["label_score"], full_lab.get_issues("label")["label_score"]
+        )
+
+    def test_update_label_issues_with_find_issues_kwargs(self, data):
+        N = self.N
+        label_quality_scores_kwargs = {"method": "normalized_margin"}
+        lab = Datalab(data={"y": data["y"][:N]}, label_name="y")
+        lab.find_issues(
+            pred_probs=data["pred_probs"][:N],
+            issue_types={
+                "label": {
+                    "clean_learning_kwargs": {
+                        "label_quality_scores_kwargs": label_quality_scores_kwargs
+                    }
+                }
+            },
+        )
+        lab.update({"y": data["y"][N:]}, pred_probs=data["pred_probs"][N:])
+
+        # The new examples are scored with the kwargs given to find_issues
+        full_lab = Datalab(data={"y": data["y"]}, label_name="y")
+        full_lab.find_issues(
+            pred_probs=data["pred_probs"],
+            issue_types={
+                "label": {
+                    "clean_learning_kwargs": {
+                        "label_quality_scores_kwargs": label_quality_scores_kwargs
+                    }
+                }
+            },
+        )
+        np.testing.assert_allclose(
+            lab.get_issues("label")["label_score"], full_lab.get_issues("label")["label_score"]
+        )
+
+        # Finding issues again on the full dataset makes them up to date
+        lab.find_issues(features=data["X"], issue_types={"non_iid": {}})
+        assert lab.stale_issue_types == []
+        assert lab.issues["is_non_iid_issue"].notna().all()
+
+    def test_update_near_duplicates_twice(self, lab, data):
+        N, M = self.N, self.M
+        knn = lab.get_info("near_duplicate")["knn"]
+        split = N + 4
+        lab.update({"y": data["y"][N:split]}, features=data["X"][N:split])
+        lab.update({"y": data["y"][split:]}, features=data["X"][split:])
+
+        # The stored index is not refit, the new examples are indexed in separate blocks
+        info = lab.get_info("near_duplicate")
+        assert info["knn"] is knn and knn.n_samples_fit_ == N
+        assert [block.n_samples_fit_ for block in info["appended_knn"]] == [4, M - 4]
+
+        full_lab = Datalab(data={"y": data["y"]}, label_name="y")
+        full_lab.find_issues(features=data["X"], issue_types={"near_duplicate": {}})
+        full_info = full_lab.get_info("near_duplicate")
+        np.testing.assert_allclose(
+            info["distance_to_nearest_neighbor"], full_info["distance_to_nearest_neighbor"]
+        )
+        near_duplicate_sets = info["near_duplicate_sets"]
+        assert N + 1 in near_duplicate_sets[3] and 3 in near_duplicate_sets[N + 1]
+        # N + 2 and N + 5 were appended by different updates
+        assert N + 5 in near_duplicate_sets[N + 2] and N + 2 in near_duplicate_sets[N + 5]
+
+    def test_update_without_inputs_marks_issues_stale(self, lab, data):
+        N = self.N
+        lab.update({"y": data["y"][N:]})
+        assert lab.stale_issue_types == ["label", "outlier", "near_duplicate", "non_iid"]
+        assert lab.issues["class_imbalance_score"].notna().all()
+
+    def test_update_errors(self, data):
+        N = self.N
+        lab = Datalab(data={"y": data["y"][:N]}, label_name="y")
+        with pytest.raises(ValueError, match="find_issues"):
+            lab.update({"y": data["y"][N:]})
+
+        lab.find_issues(issue_types={"class_imbalance": {}})
+        with pytest.raises(ValueError, match="one row per new example"):
+            lab.update({"y": data["y"][N:]}, features=data["X"][N : N + 1])
+        with pytest.raises(ValueError, match="classes"):
+            lab.update({"y": np.full(self.M, self.K)})
+        assert len(lab.data) == N
@@ -159,6 +159,55 @@ class TestNearDuplicateIssueManager:
             all_issues_have_non_empty_near_duplicate_sets
         ), "Issue examples should have near duplicate sets"
 
+    @given(
+        knn_graph=knn_graph_strategy(num_samples=st.integers(10, 30), k_neighbors=st.integers(2, 5))
+    )
+    @settings(deadline=800, suppress_health_check=[HealthCheck.too_slow])
+    def test_neighbors_within_radius_matches_pairwise_symmetrization(self, knn_graph):
+        N = knn_graph.shape[0]
+        radius = np.median(knn_graph.data)
+        near_duplicate_sets = NearDuplicateIssueManager._neighbors_within_radius(
+            knn_graph, threshold=1.0, median=radius
+        )
+
+        # Add each neighbor within the radius to the sets of both examples
+        expected_sets = [set() for _ in range(N)]
+        distances = knn_graph.data.reshape(N, -1)
+        indices = knn_graph.indices.reshape(N, -1)
+        for i in range(N):
+            for j in indices[i][distances[i] < radius]:
+                expected_sets[i].add(j)
+                expected_sets[j].add(i)
+
+        assert len(near_duplicate_sets) == N
+        for near_duplicate_set, expected_set in zip(near_duplicate_sets, expected_sets):
+            np.testing.assert_array_equal(near_duplicate_set, sorted(expected_set))
+
+    def test_cluster_ids(self):
+        # Two chains of near duplicates: 0 - 1 - 2, 4 - 5 and an isolated example 3
+        near_duplicate_sets = [
+            np.array([1]),
+            np.array([0, 2]),
+            np.array([1]),
+            np.array([], dtype=int),
+            np.array([5]),
+            np.array([4]),
+        ]
+        cluster_ids = NearDuplicateIssueManager._cluster_ids(near_duplicate_sets)
+        np.testing.assert_array_equal(cluster_ids, [0, 0, 0, -1, 1, 1])
+
+        features = np.array([[0.0, 0.0], [0.0, 0.0], [5.0, 5.0], [10.0, 0.0], [10.0, 0.0]])
+        features = np.vstack([features, np.random.RandomState(SEED).rand(20, 2) * 20 + 20])
+        lab = Datalab(data={"X": list(range(len(features)))})
+        lab.find_issues(
+            features=features, issue_types={"near_duplicate": {"compute_cluster_ids": True}}
+        )
+        issues = lab.get_issues("near_duplicate")
+        np.testing.assert_array_equal(issues["near_duplicate_cluster_id"][:5], [0, 0, -1, 1, 1])
+        assert (
+            (issues["near_duplicate_cluster_id"] >= 0) == issues["is_near_duplicate_issue"]
+        ).all()
+
 
 def build_issue_manager(
     draw, num_samples_strategy, k_neighbors_strategy, with_issues=False, threshold=None
@@ -4,6 +4,8 @@ from scipy.sparse import csr_matrix
 from sklearn.neighbors import NearestNeighbors
 from cleanlab.datalab.internal.issue_manager.knn_graph_helpers import (
     _process_knn_graph_from_inputs as _test_fn_1,  # Rename for testing purposes
+    knn_graph_with_k_neighbors,
+    knn_index_with_k_neighbors,
     num_neighbors_in_knn_graph as _get_num_neighbors,
     set_knn_graph as _test_fn_2,  # Rename for testing purposes
 )
@@ -288,3 +290,44 @@ class TestSetKNNGraph:
         assert result_knn == None
         assert result_metric == "euclidean"
         np.testing.assert_array_equal(result_graph.toarray(), small_knn_graph.toarray())
+
+
+class TestKNeighborsSlicing:
+
+    @pytest.fixture
+    def knn_graph_and_index(self):
+        return _make_knn(np.random.random((20, 3)), n_neighbors=6, metric="euclidean")
+
+    def test_knn_graph_with_k_neighbors(self, knn_graph_and_index):
+        knn_graph, knn = knn_graph_and_index
+        # No slicing needed
+        assert knn_graph_with_k_neighbors(knn_graph, 6) is knn_graph
+        assert knn_graph_with_k_neighbors(knn_graph, 8) is knn_graph
+
+        sliced_graph = knn_graph_with_k_neighbors(knn_graph, 2)
+        assert sliced_graph.shape == knn_graph.shape
+        assert _get_num_neighbors(sliced_graph) == 2
+        np.testing.assert_array_equal(
+            sliced_graph.data.reshape(20, -1), knn_graph.data.reshape(20, -1)[:, :2]
+        )
+        np.testing.assert_array_equal(
+            sliced_graph.indices.reshape(20, -1), knn_graph.indices.reshape(20, -1)[:, :2]
+        )
+        expected_graph, _ = _make_knn(knn._fit_X, n_neighbors=2, metric="euclidean")
+        np.testing.assert_array_equal(sliced_graph.toarray(), expected_graph.toarray())
+
+    def test_knn_index_with_k_neighbors(self, knn_graph_and_index):
+        _, knn = knn_graph_and_index
+        assert knn_index_with_k_neighbors(knn, 6) is knn
+        knn_2 = knn_index_with_k_neighbors(knn, 2)
+        assert knn_2.n_neighbors == 2 and knn.n_neighbors == 6
+        assert knn_2._fit_X is knn._fit_X
+        distances, _ = knn_2.kneighbors(knn._fit_X[:3])
+        assert distances.shape == (3, 2)
+
+    def test_set_knn_graph_returns_provided_knn(self, knn_graph_and_index):
+        knn_graph, knn = knn_graph_and_index
+        _, _, result_knn = _test_fn_2(
+            None, {"knn_graph": knn_graph, "knn": knn}, metric="euclidean", k=6, statistics={}
+        )
+        assert result_knn is knn
@@ -50,6 +50,40 @@ class TestLabelIssueManager:
     def test_find_issues_with_kwargs(self, pred_probs, issue_manager):
         issue_manager.find_issues(pred_probs=pred_probs, thresholds=[0.2, 0.3, 0.1])
 
+    def test_pred_probs_from_knn_graph(self, large_lab):
+        """Test that pred_probs from a knn graph match the out-of-sample neighbor vote on the features."""
+        from sklearn.neighbors import NearestNeighbors
+
+        features = large_lab.data["features"]
+        labels = large_lab.labels
+        k = 5
+        knn_graph = (
+            NearestNeighbors(n_neighbors=2 * k).fit(features).kneighbors_graph(mode="distance")
+        )
+        issue_manager = LabelIssueManager(datalab=large_lab, k=k)
+        pred_probs = issue_manager._pred_probs_from_knn_graph(knn_graph, labels)
+
+        from_features = LabelIssueManager(datalab=large_lab, k=k)
+        from_features.find_issues(features=features)
+        expected_pred_probs = from_features.health_summary_parameters["pred_probs"]
+        np.testing.assert_allclose(pred_probs, expected_pred_probs)
+
+        issue_manager.find_issues(knn_graph=knn_graph)
+        np.testing.assert_allclose(
+            issue_manager.health_summary_parameters["pred_probs"], expected_pred_probs
+        )
+
+    def test_pred_probs_from_small_knn_graph_warns(self, large_lab):
+        """Test that a knn graph with fewer than k neighbors per example is reported."""
+        from sklearn.neighbors import NearestNeighbors
+
+        features = large_lab.data["features"]
+        knn_graph = NearestNeighbors(n_neighbors=3).fit(features).kneighbors_graph(mode="distance")
+        issue_manager = LabelIssueManager(datalab=large_lab, k=5)
+        with pytest.warns(UserWarning, match="only has 3 neighbors"):
+            pred_probs = issue_manager._pred_probs_from_knn_graph(knn_graph, large_lab.labels)
+        np.testing.assert_allclose(pred_probs.sum(axis=1), 1)
+
     def test_init_with_clean_learning_kwargs(self, lab, issue_manager):
         """Test that the init method can provide kwargs to the CleanLearning constructor."""
         new_issue_manager = LabelIssueManager(
@@ -337,3 +337,27 @@ class TestNonIIDIssueManager:
             assert p_value == p_value2
         else:
             assert p_value != p_value2
+
+    def test_permutation_test_in_parallel(self, lab):
+        np.random.seed(SEED)
+        embeddings = np.random.rand(500, 2)
+        p_values = []
+        for n_jobs in [None, 4]:
+            issue_manager = NonIIDIssueManager(
+                datalab=lab, metric="euclidean", k=10, num_permutations=10, n_jobs=n_jobs
+            )
+            issue_manager.find_issues(features=embeddings)
+            assert issue_manager.info["num_permutations_evaluated"] == 10
+            p_values.append(issue_manager.info["p-value"])
+        # Permutations are drawn in the same order, regardless of n_jobs
+        assert p_values[0] == p_values[1]
+
+    def test_permutation_test_early_stopping(self, lab):
+        # Sorted features are clearly not IID
+        embeddings = np.sort(np.random.RandomState(SEED).rand(500, 1), axis=0)
+        issue_manager = NonIIDIssueManager(
+            datalab=lab, metric="euclidean", k=10, num_permutations=100, early_stopping=True
+        )
+        issue_manager.find_issues(features=embeddings)
+        assert issue_manager.info["num_permutations_evaluated"] == 10
+        assert issue_manager.info["p-value"] < issue_manager.significance_threshold
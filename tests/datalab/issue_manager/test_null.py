@@ -1,3 +1,5 @@
+from collections import Counter
+
 import numpy as np
 import pandas as pd
 import pytest
@@ -5,6 +7,7 @@ from hypothesis import HealthCheck, given, settings
 from hypothesis.extra.numpy import array_shapes, arrays
 from hypothesis.strategies import floats, just
 
+from cleanlab.datalab.internal.issue_manager import null as null_module
 from cleanlab.datalab.internal.issue_manager.null import NullIssueManager
 
 SEED = 42
@@ -194,3 +197,54 @@ class TestNullIssueManager:
         # 2. The rows that are marked as is_null_issue should ONLY be those rows which are 100% null values.
         all_rows_are_null = np.all(np.isnan(embeddings), axis=1)
         assert np.all(issues_sort["is_null_issue"] == all_rows_are_null)
+
+    @settings(
+        suppress_health_check=[HealthCheck.function_scoped_fixture],
+        deadline=None,
+    )
+    @given(
+        null_mask=arrays(
+            dtype=bool, shape=array_shapes(min_dims=2, max_dims=2, min_side=1, max_side=20)
+        )
+    )
+    def test_most_common_issue_matches_counter(self, issue_manager, null_mask):
+        features = np.where(null_mask, np.nan, 1.0)
+        issue_manager.find_issues(features=features)
+        most_common_issue = issue_manager.info["most_common_issue"]
+
+        # Reference: count the string representation of each row with a null value
+        null_patterns = ["".join(map(str, row.astype(int))) for row in null_mask if row.any()]
+        if not null_patterns:
+            assert most_common_issue == {"pattern": "no_null", "rows_affected": [], "count": 0}
+            return
+        pattern, count = Counter(null_patterns).most_common(1)[0]
+        rows_affected = [
+            i for i, row in enumerate(null_mask) if "".join(map(str, row.astype(int))) == pattern
+        ]
+        assert most_common_issue == {
+            "pattern": pattern,
+            "rows_affected": rows_affected,
+            "count": count,
+        }
+
+    def test_wide_dataframe_is_processed_in_chunks(self, issue_manager, monkeypatch):
+        np.random.seed(SEED)
+        null_mask = np.random.rand(50, 37) < 0.3
+        null_mask[[3, 17, 42]] = null_mask[0]
+        features = pd.DataFrame(np.where(null_mask, np.nan, 1.0)).astype(
+            {i: object for i in range(0, 37, 3)}
+        )
+        issue_manager.find_issues(features=features)
+        expected_info = issue_manager.info
+
+        # Only hold 8 columns of the null mask in memory at once
+        monkeypatch.setattr(null_module, "NULL_TRACKER_CHUNK_SIZE", 8)
+        issue_manager.find_issues(features=features)
+        info = issue_manager.info
+
+        assert info == expected_info
+        assert info["most_common_issue"]["rows_affected"] == [0, 3, 17, 42]
+        np.testing.assert_allclose(info["column_impact"], null_mask.mean(axis=0))
+        np.testing.assert_allclose(
+            issue_manager.issues[issue_manager.issue_score_key], 1 - null_mask.mean(axis=1)
+        )
@@ -7,6 +7,7 @@ from cleanlab.datalab.internal.issue_manager.underperforming_group import (
     UnderperformingGroupIssueManager,
 )
 from sklearn.datasets import make_blobs, load_iris
+from sklearn.neighbors import NearestNeighbors
 
 SEED = 42
 
@@ -224,6 +225,58 @@ class TestUnderperformingGroupIssueManager:
         nnz_after_clustering = knn_graph.nnz
         assert nnz_before_clustering == nnz_after_clustering
 
+    def test_knn_graph_unchanged_by_clustering(self, issue_manager, make_data):
+        data = make_data()
+        knn_graph = NearestNeighbors(n_neighbors=10).fit(data["features"])
+        knn_graph = knn_graph.kneighbors_graph(mode="distance")
+        knn_graph_copy = knn_graph.copy()
+        issue_manager.perform_clustering(knn_graph)
+        assert (knn_graph != knn_graph_copy).nnz == 0
+        np.testing.assert_array_equal(knn_graph.indptr, knn_graph_copy.indptr)
+
+    def test_get_worst_cluster(self, issue_manager):
+        np.random.seed(SEED)
+        N, K = 200, 3
+        labels = np.random.randint(0, K, N)
+        pred_probs = np.random.dirichlet(np.ones(K), N)
+        cluster_ids = np.random.choice([-1, 2, 5, 7, 11], N)
+        unique_cluster_ids = np.array([7, 2, 11, 5])
+
+        self_confidence = pred_probs[np.arange(N), labels]
+        performances = [self_confidence[cluster_ids == c].mean() for c in unique_cluster_ids]
+        expected_ratio = min(min(performances) / self_confidence.mean(), 1.0)
+
+        issue_manager.threshold = 1.0
+        worst_cluster_id, worst_cluster_ratio = issue_manager.get_worst_cluster(
+            cluster_ids, unique_cluster_ids, labels, pred_probs
+        )
+        assert worst_cluster_id == unique_cluster_ids[np.argmin(performances)]
+        assert worst_cluster_ratio == pytest.approx(expected_ratio)
+
+    def test_connected_components_clustering(self, lab, make_data, monkeypatch):
+        data = make_data(noisy=True)
+        features, pred_probs, labels = data["features"], data["pred_probs"], data["labels"]
+        monkeypatch.setattr(lab._labels, "labels", labels)
+        issue_manager = UnderperformingGroupIssueManager(
+            datalab=lab,
+            threshold=0.2,
+            clustering_kwargs={"eps": 2},
+            clustering_algorithm="connected_components",
+        )
+        issue_manager.find_issues(features=features, pred_probs=pred_probs)
+        clustering_info = issue_manager.info["clustering"]
+        assert clustering_info["algorithm"] == "connected_components"
+        assert clustering_info["params"] == {"eps": 2}
+        assert clustering_info["stats"]["n_clusters"] == 4
+
+        # The well-separated blobs are found as clusters, the blob with swapped predictions is flagged
+        is_issue = issue_manager.issues["is_underperforming_group_issue"]
+        assert np.all(labels[is_issue] == 0)
+        assert is_issue.sum() > 0.9 * np.sum(labels == 0)
+
+        with pytest.raises(ValueError, match="clustering_algorithm"):
+            UnderperformingGroupIssueManager(datalab=lab, clustering_algorithm="kmeans")
+
     def test_report(self, issue_manager, make_data):
         data = make_data()
         features, pred_probs = data["features"], data["pred_probs"]
@@ -2,8 +2,11 @@ import tempfile
 from unittest.mock import patch
 import pytest
 from cleanlab.datalab.internal.data import Data, DataFormatError, DatasetLoadError
+import datasets
 from datasets import Dataset, ClassLabel
 import numpy as np
+import pandas as pd
+import pyarrow as pa
 import hypothesis.strategies as st
 from hypothesis import given, assume, settings, HealthCheck
 
@@ -146,6 +149,44 @@ class TestData:
         data = Data(data=dataset, task=Task.CLASSIFICATION, label_name="label")
         assert isinstance(data._data, Dataset)
 
+    def test_init_data_from_dataframe_converts_columns_lazily(self):
+        df = pd.DataFrame(
+            {
+                "text": ["a", "b", "c"],
+                "X": [0.1, 0.2, 0.3],
+                "image": [1, 2, 3],
+                "label": ["x", "y", "x"],
+            }
+        )
+        data = Data(data=df, task=Task.CLASSIFICATION, label_name="label", columns=["image"])
+        # Columns added to the DataFrame after construction are not part of the dataset
+        df["extra"] = [0, 0, 0]
+        assert data._data.column_names == ["label", "image"]
+        assert len(data) == 3
+        assert data.labels.label_map == {0: "x", 1: "y"}
+        np.testing.assert_array_equal(data.labels.labels, [0, 1, 0])
+
+        dataset = data.dataset
+        assert dataset.column_names == ["text", "X", "image", "label"]
+        assert dataset == data.dataset == data._data
+        assert data == Data(
+            data=Dataset.from_pandas(df.drop(columns="extra")),
+            task=Task.CLASSIFICATION,
+            label_name="label",
+        )
+
+    def test_init_data_from_arrow_table(self, monkeypatch):
+        def fail(*args, **kwargs):
+            raise AssertionError("The contents of the table should not be hashed")
+
+        monkeypatch.setattr(datasets.arrow_dataset, "generate_fingerprint", fail)
+        table = pa.table({"X": [0.1, 0.2, 0.3], "label": [0, 1, 0]})
+        data = Data(data=table, task=Task.CLASSIFICATION, label_name="label")
+        # The columns share memory with the table
+        column = data.dataset.data.table.column("X").chunk(0)
+        assert column.buffers()[1].address == table.column("X").chunk(0).buffers()[1].address
+        np.testing.assert_array_equal(data.labels.labels, [0, 1, 0])
+
     def test_init_raises_format_error(self):
         data = np.random.rand(10, 2)
         with pytest.raises(DataFormatError) as excinfo:
@@ -165,13 +206,36 @@ class TestData:
         expected_error_substring = "Failed to load dataset from <class 'dict'>.\n"
         assert expected_error_substring in str(excinfo.value)
 
-    def test_not_equal_to_copy_or_non_data(self):
+    def test_equality_is_based_on_contents(self):
         dataset = {"X": [0, 1, 2], "label": [0, 1, 2]}
         data = Data(data=dataset, task=Task.CLASSIFICATION, label_name="label")
-        data_copy = Data(data=dataset, task=Task.CLASSIFICATION, label_name="label")
-        assert data != data_copy
+        data_copy = Data(data=dict(dataset), task=Task.CLASSIFICATION, label_name="label")
+        assert data == data_copy
+        assert hash(data) == hash(data_copy)
+
+        modified_data = Data(
+            data={"X": [0, 1, 3], "label": [0, 1, 2]}, task=Task.CLASSIFICATION, label_name="label"
+        )
+        assert data != modified_data
         assert data != dataset
 
+    def test_fingerprint(self, dataset_and_label_name):
+        dataset, label_name = dataset_and_label_name
+        data = Data(data=dataset, task=Task.CLASSIFICATION, label_name=label_name)
+        # Computed lazily, from the fingerprint tracked by the datasets library
+        assert data._fingerprint is None
+        assert data.fingerprint == dataset._fingerprint
+        assert data.fingerprint != Data._compute_fingerprint(dataset.shuffle(seed=0))
+
+        # Datasets without a fingerprint are only equal to themselves
+        dataset_without_fingerprint = Dataset.from_dict(dataset.to_dict())
+        dataset_without_fingerprint._fingerprint = None
+        fingerprint = Data._compute_fingerprint(dataset_without_fingerprint)
+        assert fingerprint == Data._compute_fingerprint(dataset_without_fingerprint)
+        dataset_copy = Dataset.from_dict(dataset.to_dict())
+        dataset_copy._fingerprint = None
+        assert Data._compute_fingerprint(dataset_copy) != fingerprint
+
     def test_load_dataset_from_string(self, monkeypatch):
         # Test with non-existent file
         with pytest.raises(DatasetLoadError):
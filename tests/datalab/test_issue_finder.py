@@ -1,9 +1,14 @@
+import tracemalloc
+
 import numpy as np
 import pytest
 
 from cleanlab import Datalab
 from cleanlab.datalab.internal.issue_finder import IssueFinder
+from cleanlab.datalab.internal.issue_manager import knn_graph_helpers as knn_graph_helpers_module
+from cleanlab.datalab.internal.issue_manager.knn_graph_helpers import num_neighbors_in_knn_graph
 from cleanlab.datalab.internal.task import Task
+from cleanlab.internal.neighbor.metric import decide_default_metric, decide_euclidean_metric
 
 
 class TestIssueFinder:
@@ -173,6 +178,189 @@ class TestIssueFinder:
 
         assert not data_issues.issues.empty
 
+    def test_find_issues_builds_shared_knn_graph_once(self, issue_finder, lab, monkeypatch):
+        N = len(lab.data)
+        X = np.random.rand(N, 2)
+        issue_types = {
+            "outlier": {"k": 3},
+            "near_duplicate": {"k": 5},
+            "non_iid": {"k": 4},
+            "data_valuation": {"k": 5},
+        }
+
+        from cleanlab.datalab.internal import issue_finder as issue_finder_module
+        from cleanlab.internal.neighbor import knn_graph as knn_graph_module
+
+        create_knn_graph_calls = []
+
+        def create_knn_graph_spy(*args, **kwargs):
+            create_knn_graph_calls.append(kwargs.get("n_neighbors"))
+            return knn_graph_module.create_knn_graph_and_index(*args, **kwargs)
+
+        monkeypatch.setattr(issue_finder_module, "create_knn_graph_and_index", create_knn_graph_spy)
+        monkeypatch.setattr(
+            knn_graph_helpers_module, "create_knn_graph_and_index", create_knn_graph_spy
+        )
+        issue_finder.find_issues(features=X, issue_types=issue_types)
+
+        # A single graph is built with the largest k, all issue managers reuse it
+        assert create_knn_graph_calls == [5]
+        statistics = lab.get_info("statistics")
+        assert num_neighbors_in_knn_graph(statistics["weighted_knn_graph"]) == 5
+        summary = lab.get_issue_summary()
+        assert set(summary["issue_type"]) == set(issue_types)
+
+        # Each issue manager only considers its own k nearest neighbors
+        outlier_info = lab.get_info("outlier")
+        assert outlier_info["knn"].n_neighbors == 3
+        assert outlier_info["knn"]._fit_X is not None
+        for key in ["nearest_neighbor", "distance_to_nearest_neighbor"]:
+            assert outlier_info[key] == lab.get_info("near_duplicate")[key]
+
+        # Running again with a smaller k reuses the stored graph
+        issue_finder.find_issues(features=X, issue_types={"outlier": {"k": 2}})
+        assert create_knn_graph_calls == [5]
+
+    def test_label_issues_from_features_reuse_shared_knn_graph(
+        self, issue_finder, lab, monkeypatch
+    ):
+        from cleanlab.datalab.internal import issue_finder as issue_finder_module
+        from cleanlab.datalab.internal.issue_manager import label as label_module
+        from cleanlab.internal.neighbor import knn_graph as knn_graph_module
+
+        class KNeighborsClassifierSpy(label_module.KNeighborsClassifier):
+            def fit(self, *args, **kwargs):
+                raise AssertionError("The neighbors should be taken from the shared knn graph")
+
+        create_knn_graph_calls = []
+
+        def create_knn_graph_spy(*args, **kwargs):
+            create_knn_graph_calls.append(kwargs.get("metric"))
+            return knn_graph_module.create_knn_graph_and_index(*args, **kwargs)
+
+        monkeypatch.setattr(label_module, "KNeighborsClassifier", KNeighborsClassifierSpy)
+        monkeypatch.setattr(issue_finder_module, "create_knn_graph_and_index", create_knn_graph_spy)
+        monkeypatch.setattr(
+            knn_graph_helpers_module, "create_knn_graph_and_index", create_knn_graph_spy
+        )
+        # The default metric for these features is cosine
+        X = np.random.rand(len(lab.data), 5)
+        issue_finder.find_issues(features=X)
+
+        # The shared graph is built once, with the euclidean metric of the label issue manager
+        euclidean_metric = decide_euclidean_metric(X)
+        assert create_knn_graph_calls == [euclidean_metric]
+        assert {"label", "outlier", "near_duplicate"} <= set(lab.get_issue_summary()["issue_type"])
+        assert lab.get_info("statistics")["knn_metric"] == euclidean_metric
+        assert lab.get_info("outlier")["metric"] == euclidean_metric
+
+    def test_find_issues_with_different_metrics(self, issue_finder, lab):
+        N = len(lab.data)
+        X = np.random.rand(N, 2)
+        issue_types = {
+            "outlier": {"k": 3, "metric": "manhattan"},
+            "near_duplicate": {"k": 5},
+        }
+        issue_finder.find_issues(features=X, issue_types=issue_types)
+        assert lab.get_info("outlier")["metric"] == "manhattan"
+        assert lab.get_info("near_duplicate")["metric"] == decide_default_metric(X)
+
+    def test_find_issues_in_parallel(self, lab):
+        N = len(lab.data)
+        K = lab.get_info("statistics")["num_classes"]
+        X = np.random.rand(N, 2)
+        pred_probs = np.random.rand(N, K)
+        pred_probs = pred_probs / pred_probs.sum(axis=1, keepdims=True)
+        issue_types = {
+            "label": {},
+            "outlier": {"k": 3, "metric": "manhattan"},
+            "near_duplicate": {},
+            "class_imbalance": {},
+            "null": {},
+        }
+
+        results = []
+        for n_jobs in [None, 4]:
+            lab = Datalab(data={"y": lab.labels}, label_name="y")
+            issue_finder = IssueFinder(datalab=lab, task=self.task, verbosity=0)
+            issue_finder.find_issues(
+                features=X, pred_probs=pred_probs, issue_types=issue_types, n_jobs=n_jobs
+            )
+            results.append(lab)
+
+        sequential_lab, parallel_lab = results
+        # Results are collected in the same order, regardless of n_jobs
+        assert list(parallel_lab.issues.columns) == list(sequential_lab.issues.columns)
+        assert parallel_lab.issues.equals(sequential_lab.issues)
+        assert parallel_lab.get_issue_summary().equals(sequential_lab.get_issue_summary())
+
+    @pytest.mark.parametrize("n_jobs", [None, 4])
+    def test_find_issues_records_profile(self, lab, n_jobs):
+        N = len(lab.data)
+        X = np.random.rand(N, 5)
+        issue_finder = IssueFinder(datalab=lab, task=self.task, verbosity=0)
+        tracemalloc.start()
+        try:
+            issue_finder.find_issues(
+                features=X,
+                issue_types={"outlier": {}, "near_duplicate": {}, "null": {}},
+                n_jobs=n_jobs,
+            )
+        finally:
+            tracemalloc.stop()
+        profile = lab.get_info("statistics")["profile"]
+        assert set(profile) == {"knn_graph", "outlier", "near_duplicate", "null"}
+        for step in profile.values():
+            assert step["wall_time"] >= 0 and step["cpu_time"] >= 0
+        assert profile["knn_graph"]["input_sizes"] == {"features": (N, 5)}
+        assert profile["null"]["input_sizes"] == {"features": (N, 5)}
+        assert profile["outlier"]["input_sizes"]["knn_graph"] == (N, N)
+        assert profile["knn_graph"]["peak_memory"] > 0
+        # Memory is only traced for issue managers that do not run concurrently
+        assert (profile["null"]["peak_memory"] is None) == (n_jobs == 4)
+
+        # Later runs replace the profile, memory is not traced unless tracemalloc is started
+        issue_finder.find_issues(issue_types={"class_imbalance": {}})
+        profile = lab.get_info("statistics")["profile"]
+        assert set(profile) == {"class_imbalance"}
+        assert profile["class_imbalance"]["peak_memory"] is None
+
+    @pytest.mark.parametrize("n_jobs", [0, -2, 1.5])
+    def test_find_issues_with_invalid_n_jobs(self, issue_finder, lab, n_jobs):
+        X = np.random.rand(len(lab.data), 2)
+        with pytest.raises(ValueError, match="n_jobs"):
+            issue_finder.find_issues(features=X, issue_types={"outlier": {}}, n_jobs=n_jobs)
+        # Nothing is computed before the arguments are validated
+        assert "weighted_knn_graph" not in lab.get_info("statistics")
+
+    def test_find_issues_in_parallel_prints_in_order(self, issue_finder, lab, capsys, monkeypatch):
+        from cleanlab.datalab.internal.issue_manager.null import NullIssueManager
+
+        def fail(*args, **kwargs):
+            raise ValueError("null failed")
+
+        monkeypatch.setattr(NullIssueManager, "find_issues", fail)
+        X = np.random.rand(len(lab.data), 2)
+        issue_types = {"class_imbalance": {}, "null": {}, "outlier": {"k": 3}}
+        issue_finder.find_issues(features=X, issue_types=issue_types, n_jobs=4)
+        lines = [line for line in capsys.readouterr().out.splitlines() if line]
+        # The messages of each issue manager are printed together, in the order of the issue types
+        assert lines[:4] == [
+            "Finding class_imbalance issues ...",
+            "Finding null issues ...",
+            "Error in null: null failed",
+            "Finding outlier issues ...",
+        ]
+
+    def test_find_issues_in_parallel_with_failing_manager(self, issue_finder, lab, capsys):
+        N = len(lab.data)
+        X = np.random.rand(N, 2)
+        issue_types = {"near_duplicate": {"k": 3}, "class_imbalance": {}, "null": {}}
+        issue_finder.find_issues(features=X[:, :1].astype(str), issue_types=issue_types, n_jobs=2)
+        captured = capsys.readouterr()
+        assert "Error in near_duplicate" in captured.out
+        assert set(lab.get_issue_summary()["issue_type"]) == {"class_imbalance", "null"}
+
     def test_validate_issue_types_dict(self, issue_finder, monkeypatch):
         issue_types = {
             "issue_type_1": {f"arg_{i}": f"value_{i}" for i in range(1, 3)},
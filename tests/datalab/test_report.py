@@ -235,3 +235,14 @@ class TestReporter:
 
         reporter.show_summary_score = False
         assert reporter._write_summary(self.summary) == expected_output
+
+    def test_profile(self, lab, data_issues):
+        reporter = Reporter(data_issues=data_issues, task=Task.CLASSIFICATION, show_all_issues=True)
+        assert "time and memory" not in reporter.get_report(num_examples=3)
+
+        reporter.show_profile = True
+        report = reporter.get_report(num_examples=3)
+        profile_section = report.split("Here is the time and memory spent")[-1]
+        for step in ["knn_graph", "label", "outlier", "near_duplicate"]:
+            assert step in profile_section
+        assert "peak_memory (MB)" in profile_section
@@ -14,6 +14,7 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with cleanlab.  If not, see <https://www.gnu.org/licenses/>.
 
+import asyncio
 from itertools import islice
 
 import numpy as np
@@ -23,7 +24,8 @@ from sklearn.model_selection import train_test_split, cross_val_predict
 from sklearn.linear_model import LogisticRegression
 
 from cleanlab.datalab.datalab import Datalab
-from cleanlab.experimental.datalab.data_monitor import DataMonitor
+from cleanlab.experimental.datalab import data_monitor as data_monitor_module
+from cleanlab.experimental.datalab.data_monitor import DataMonitor, FindIssuesKwargs
 from cleanlab.benchmarking.noise_generation import (
     generate_noise_matrix_from_trace,
     generate_noisy_labels,
@@ -203,10 +205,6 @@ class TestDataMonitorReuseStatisticInfo(SetupClass):
         ) / len(lab_results)
         assert similarity >= 0.90
 
-    @pytest.mark.xfail(
-        reason="This test is expected to fail due to a simplified API of the outlier issue manager in Datalab. See pull request https://github.com/cleanlab/cleanlab/pull/1155 for more details.",
-        strict=True,
-    )
     def test_default_issue_types(self, datalab, data, pred_probs_test):
         """Test that the DataMonitor checks for the correct types of issues by default."""
         # TODO: Run this test with features as well
@@ -329,10 +327,6 @@ class TestDataMonitorInit(SetupClass):
         )
         assert corr > 0.9
 
-    @pytest.mark.xfail(
-        reason="This test is expected to fail due to a simplified API of the outlier issue manager in Datalab. See pull request https://github.com/cleanlab/cleanlab/pull/1155 for more details.",
-        strict=True,
-    )
     def test_outlier_detection(self, datalab, data):
         monitor = DataMonitor(datalab=datalab)
         assert isinstance(monitor, DataMonitor)
@@ -436,10 +430,6 @@ class TestDataMonitorInit(SetupClass):
         # All the "test" examples should been checked
         assert len(issues) == len(features)
 
-    @pytest.mark.xfail(
-        reason="This test is expected to fail due to a simplified API of the outlier issue manager in Datalab. See pull request https://github.com/cleanlab/cleanlab/pull/1155 for more details.",
-        strict=True,
-    )
     def test_only_on_features(self, data):
         train_dataset = {"X_train": data["X_train"]}
         lab = Datalab(data=train_dataset, task="classification")
@@ -459,10 +449,322 @@ class TestDataMonitorInit(SetupClass):
 
         issues = monitor.issues
 
-        # Only the "outlier" monitor is configured
-        assert set(["outlier"]) == set(monitor.monitors.keys())
+        # Only the feature-based monitors are configured
+        assert set(["outlier", "near_duplicate"]) == set(monitor.monitors.keys())
 
-        # Only outlier issues should have been checked
-        assert set(issues.columns) == set(["is_outlier_issue", "outlier_score"])
+        # Only outlier and near-duplicate issues should have been checked
+        assert set(issues.columns) == set(
+            ["is_outlier_issue", "outlier_score", "is_near_duplicate_issue", "near_duplicate_score"]
+        )
         # All the "test" examples should been checked
         assert len(issues) == len(features)
+
+
+class TestDataMonitorRetention(SetupClass):
+    """The retention policy bounds the examples kept in `monitor.issues`,
+    while the issue summary still covers the entire stream."""
+
+    @pytest.fixture
+    def batches(self, data, pred_probs_test):
+        return [
+            {
+                "labels": data["noisy_labels_test"][start : start + 7],
+                "pred_probs": pred_probs_test[start : start + 7],
+                "features": data["X_test"][start : start + 7],
+            }
+            for start in range(0, 70, 7)
+        ]
+
+    def test_max_rows(self, datalab, batches):
+        monitor = DataMonitor(datalab=datalab)
+        bounded_monitor = DataMonitor(datalab=datalab, max_rows=10)
+        for batch in batches:
+            monitor.find_issues(**batch)
+            bounded_monitor.find_issues(**batch)
+            assert len(bounded_monitor.issues) == min(monitor.history.num_examples, 10)
+
+        pd.testing.assert_frame_equal(
+            bounded_monitor.issues, monitor.issues.iloc[-10:], check_index_type=False
+        )
+        assert bounded_monitor.issues.index.tolist() == list(range(60, 70))
+        pd.testing.assert_frame_equal(bounded_monitor.issue_summary, monitor.issue_summary)
+
+    def test_max_age(self, datalab, batches, monkeypatch):
+        now = 0.0
+        monkeypatch.setattr(data_monitor_module.time, "monotonic", lambda: now)
+        monitor = DataMonitor(datalab=datalab)
+        bounded_monitor = DataMonitor(datalab=datalab, max_age=2.5)
+        for batch in batches:
+            monitor.find_issues(**batch)
+            bounded_monitor.find_issues(**batch)
+            now += 1.0
+
+        # Only the batches added at time 8 and 9 are at most 2.5 seconds old at time 10
+        assert bounded_monitor.issues.index.tolist() == list(range(56, 70))
+        pd.testing.assert_frame_equal(bounded_monitor.issue_summary, monitor.issue_summary)
+
+        now += 10.0
+        assert bounded_monitor.issues.empty
+        pd.testing.assert_frame_equal(bounded_monitor.issue_summary, monitor.issue_summary)
+
+    @pytest.mark.parametrize("kwargs", [{"max_rows": -1}, {"max_age": 0}])
+    def test_invalid_retention_policy(self, datalab, kwargs):
+        with pytest.raises(ValueError):
+            DataMonitor(datalab=datalab, **kwargs)
+
+
+class TestDataMonitorSubmit(SetupClass):
+    """Examples submitted concurrently are checked together in micro-batches."""
+
+    @pytest.fixture
+    def examples(self, data, pred_probs_test):
+        return [
+            {"label": label, "pred_probs": p, "features": f}
+            for label, p, f in zip(
+                data["noisy_labels_test"][:40], pred_probs_test[:40], data["X_test"][:40]
+            )
+        ]
+
+    @staticmethod
+    def _submit_all(monitor, examples):
+        async def submit_all():
+            return await asyncio.gather(*(monitor.submit(example) for example in examples))
+
+        return asyncio.run(submit_all())
+
+    def test_submit(self, datalab, examples, monkeypatch):
+        monitor = DataMonitor(datalab=datalab, max_batch_size=16, max_batch_latency=1.0)
+        batch_sizes = []
+        find_issues = monitor._find_issues
+
+        def record_batch_size(**kwargs):
+            batch_sizes.append(len(kwargs["labels"]))
+            return find_issues(**kwargs)
+
+        monkeypatch.setattr(monitor, "_find_issues", record_batch_size)
+        results = self._submit_all(monitor, examples)
+
+        assert batch_sizes == [16, 16, 8]
+        assert pd.DataFrame(results).equals(monitor.issues)
+
+        # The scores don't depend on how the examples are batched
+        reference_monitor = DataMonitor(datalab=datalab)
+        reference_monitor.find_issues(
+            labels=np.array([example["label"] for example in examples]),
+            pred_probs=np.stack([example["pred_probs"] for example in examples]),
+            features=np.stack([example["features"] for example in examples]),
+        )
+        for score_column in ["label_score", "outlier_score"]:
+            np.testing.assert_allclose(
+                monitor.issues[score_column], reference_monitor.issues[score_column]
+            )
+
+    def test_submit_without_batching(self, datalab, examples):
+        monitor = DataMonitor(datalab=datalab, max_batch_size=1)
+        results = self._submit_all(monitor, examples[:5])
+        assert pd.DataFrame(results).equals(monitor.issues)
+
+    def test_submit_propagates_errors(self, datalab, examples):
+        monitor = DataMonitor(datalab=datalab)
+        examples = [{"label": example["label"]} for example in examples[:3]]
+        with pytest.raises(ValueError, match="pred_probs must be provided"):
+            self._submit_all(monitor, examples)
+
+    def test_aclose(self, datalab, examples):
+        monitor = DataMonitor(datalab=datalab)
+
+        async def submit_and_close():
+            result = await monitor.submit(examples[0])
+            worker = monitor._batcher._worker
+            await monitor.aclose()
+            return result, worker
+
+        result, worker = asyncio.run(submit_and_close())
+        assert worker.cancelled()
+        assert monitor._batcher is None
+        assert result == monitor.issues.iloc[0].to_dict()
+
+    def test_batcher_of_previous_loop_is_closed(self, datalab, examples):
+        monitor = DataMonitor(datalab=datalab)
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(monitor.submit(examples[0]))
+            previous_worker = monitor._batcher._worker
+            asyncio.run(monitor.submit(examples[1]))
+            # The cancellation is scheduled in the previous loop
+            loop.run_until_complete(asyncio.sleep(0))
+            assert previous_worker.cancelled()
+        finally:
+            loop.close()
+        assert len(monitor.issues) == 2
+
+
+class TestMicroBatcher:
+    def test_aclose_cancels_pending_items(self):
+        async def main():
+            batcher = data_monitor_module.MicroBatcher(lambda items: items, max_batch_latency=10)
+            submitted = asyncio.ensure_future(batcher.submit(1))
+            await asyncio.sleep(0.01)
+            await batcher.aclose()
+            return submitted, batcher._worker
+
+        submitted, worker = asyncio.run(main())
+        assert worker.cancelled()
+        assert submitted.cancelled()
+
+
+class TestNearDuplicateIssueMonitor(SetupClass):
+    @pytest.fixture
+    def datalab(self, pred_probs_train, data):
+        dataset = {"labels": data["noisy_labels_train"]}
+        lab = Datalab(data=dataset, label_name="labels")
+        lab.find_issues(features=data["X_train"], issue_types={"near_duplicate": {}})
+        return lab
+
+    def test_near_duplicates(self, datalab, data):
+        monitor = DataMonitor(datalab=datalab)
+        assert set(monitor.monitors.keys()) == {"near_duplicate"}
+        near_duplicate_monitor = monitor.monitors["near_duplicate"]
+        radius = near_duplicate_monitor.radius
+
+        features = np.array(
+            [
+                data["X_train"][0],  # Exact duplicate of the original dataset
+                [20.0, 20.0],
+                [20.0, 20.0 + radius / 2],  # Near-duplicate of the previous example
+                [-20.0, -20.0],
+            ]
+        )
+        monitor.find_issues(features=features)
+        np.testing.assert_array_equal(
+            monitor.issues["is_near_duplicate_issue"], [True, True, True, False]
+        )
+        assert monitor.issues["near_duplicate_score"][0] == pytest.approx(0.0)
+
+        # Later batches are compared against recent examples of the stream
+        monitor.find_issues(features=np.array([[-20.0, -20.0 + radius / 2], [40.0, 40.0]]))
+        np.testing.assert_array_equal(
+            monitor.issues["is_near_duplicate_issue"].iloc[4:], [True, False]
+        )
+
+    def test_same_threshold_as_datalab(self, datalab, data):
+        """New examples are near-duplicates if the nearest example of the original dataset is within
+        the radius used by Datalab."""
+        info = datalab.get_info("near_duplicate")
+        radius = info["threshold"] * info["median_distance_to_nearest_neighbor"]
+        near_duplicate_monitor = DataMonitor(datalab=datalab).monitors["near_duplicate"]
+        near_duplicate_monitor.max_recent_examples = 0
+
+        features = data["X_test"]
+        expected_is_issue = []
+        for f in features:
+            distances = np.linalg.norm(data["X_train"] - f, axis=1)
+            expected_is_issue.append(distances.min() < radius)
+
+        for f, expected in zip(features, expected_is_issue):
+            near_duplicate_monitor.find_issues(FindIssuesKwargs(features=f[np.newaxis, :]))
+            assert near_duplicate_monitor.issues_dict["is_issue"][0] == expected
+        assert any(expected_is_issue) and not all(expected_is_issue)
+
+
+class TestRegressionLabelIssueMonitor:
+    @pytest.fixture
+    def data(self):
+        np.random.seed(SEED)
+        X = np.random.rand(500, 2) * 5
+        y = X.sum(axis=1) + np.random.normal(scale=0.1, size=len(X))
+        predictions = X.sum(axis=1)
+        # Corrupt a few labels
+        y[:10] += 5
+        return {"y": y, "predictions": predictions}
+
+    @pytest.mark.parametrize("method", ["outre", "residual"])
+    def test_find_issues(self, data, method):
+        lab = Datalab(data={"y": data["y"]}, label_name="y", task="regression")
+        lab.find_issues(pred_probs=data["predictions"], issue_types={"label": {"method": method}})
+        monitor = DataMonitor(datalab=lab)
+        assert set(monitor.monitors.keys()) == {"label"}
+
+        # Predicted values of regression models are passed as pred_probs, as in Datalab
+        labels = np.array([1.0, 2.0, 3.0, 10.0])
+        predictions = np.array([1.0, 2.05, 2.95, 3.0])
+        monitor.find_issues(labels=labels, pred_probs=predictions)
+        np.testing.assert_array_equal(monitor.issues["is_label_issue"], [False, False, False, True])
+        assert monitor.issues["label_score"].iloc[3] < monitor.issues["label_score"].iloc[0]
+
+        # The residual scores of the original dataset are reproduced exactly
+        if method == "residual":
+            monitor.find_issues(labels=data["y"], pred_probs=data["predictions"])
+            issues = lab.get_issues("label")
+            np.testing.assert_allclose(
+                monitor.issues["label_score"].iloc[4:], issues["label_score"]
+            )
+            np.testing.assert_array_equal(
+                monitor.issues["is_label_issue"].iloc[4:], issues["is_label_issue"]
+            )
+
+    def test_outre_scorer_matches_get_label_quality_scores(self, data):
+        from cleanlab.regression.rank import _OutreScorer, get_label_quality_scores
+
+        scorer = _OutreScorer()
+        scores = scorer.fit_score(data["y"], data["predictions"])
+        np.testing.assert_array_equal(
+            scores, get_label_quality_scores(data["y"], data["predictions"])
+        )
+        new_scores = scorer.score(data["y"][:20], data["predictions"][:20])
+        assert new_scores[:10].max() < new_scores[10:].min()
+
+
+class TestMultilabelIssueMonitor:
+    @pytest.fixture
+    def datalab(self):
+        np.random.seed(SEED)
+        labels = [["a"] if i % 3 == 0 else ["b", "c"] if i % 3 == 1 else ["c"] for i in range(300)]
+        pred_probs = np.full((300, 3), 0.1)
+        for i, label in enumerate(labels):
+            pred_probs[i, ["abc".index(c) for c in label]] = 0.9
+        pred_probs = np.clip(pred_probs + np.random.normal(scale=0.05, size=pred_probs.shape), 0, 1)
+        lab = Datalab(data={"labels": labels}, label_name="labels", task="multilabel")
+        lab.find_issues(pred_probs=pred_probs, issue_types={"label": {}})
+        return lab, labels, pred_probs
+
+    def test_find_issues(self, datalab):
+        lab, labels, pred_probs = datalab
+        monitor = DataMonitor(datalab=lab)
+        assert set(monitor.monitors.keys()) == {"label"}
+
+        monitor.find_issues(
+            labels=[["a"], ["b", "c"], ["a", "b"], ["c"]],
+            pred_probs=np.array(
+                [
+                    [0.9, 0.1, 0.1],
+                    [0.1, 0.9, 0.9],
+                    [0.98, 0.02, 0.02],  # Confidently missing class b
+                    [0.98, 0.02, 0.98],  # Confidently has class a
+                ]
+            ),
+        )
+        np.testing.assert_array_equal(monitor.issues["is_label_issue"], [False, False, True, True])
+
+        # Scores are computed as for the original dataset
+        monitor.find_issues(labels=labels, pred_probs=pred_probs)
+        np.testing.assert_allclose(
+            monitor.issues["label_score"].iloc[4:], lab.get_issues("label")["label_score"]
+        )
+
+    def test_submit(self, datalab):
+        lab, labels, pred_probs = datalab
+        monitor = DataMonitor(datalab=lab)
+
+        async def submit_all():
+            return await asyncio.gather(
+                *(
+                    monitor.submit({"label": label, "pred_probs": p})
+                    for label, p in zip(labels[:5], pred_probs[:5])
+                )
+            )
+
+        results = asyncio.run(submit_all())
+        assert [r["label_score"] for r in results] == pytest.approx(
+            lab.get_issues("label")["label_score"].iloc[:5].tolist()
+        )
@@ -5,15 +5,20 @@ from hypothesis.extra.numpy import arrays
 import pytest
 import numpy as np
 from sklearn.neighbors import NearestNeighbors
+from scipy.linalg import circulant
 from scipy.sparse import csr_matrix
 
 
 from cleanlab.internal.neighbor import features_to_knn
+from cleanlab.internal.neighbor import knn_graph as knn_graph_module
 from cleanlab.internal.neighbor.knn_graph import (
     correct_knn_distances_and_indices,
+    correct_knn_distances_and_indices_with_exact_duplicate_sets_inplace,
     correct_knn_graph,
     construct_knn_graph_from_index,
+    construct_memmap_knn_graph_from_index,
     create_knn_graph_and_index,
+    load_memmap_knn_graph,
 )
 
 
@@ -459,3 +464,178 @@ def test_construct_knn_then_correct_knn_graph_does_the_same_work():
     )
     # knn_graph_from_index does not have correction
     assert not np.all(knn_graph_from_index.toarray() == knn_graph.toarray())
+
+
+class TestMemmapKNNGraph:
+    @pytest.fixture
+    def features(self):
+        features = np.random.default_rng(0).random((500, 8))
+        features[10:40] = features[10]  # More exact duplicates than neighbors
+        features[100] = features[200]
+        return features
+
+    @pytest.mark.parametrize("metric", ["cosine", "euclidean"])
+    @pytest.mark.parametrize("correct_exact_duplicates", [True, False])
+    def test_matches_in_memory_graph(self, features, metric, correct_exact_duplicates, tmp_path):
+        knn_graph, _ = create_knn_graph_and_index(
+            features,
+            n_neighbors=5,
+            metric=metric,
+            correct_exact_duplicates=correct_exact_duplicates,
+        )
+        memmap_knn_graph, knn = create_knn_graph_and_index(
+            features,
+            n_neighbors=5,
+            metric=metric,
+            correct_exact_duplicates=correct_exact_duplicates,
+            memmap_dir=str(tmp_path),
+        )
+        assert isinstance(knn, NearestNeighbors)
+        assert memmap_knn_graph.shape == knn_graph.shape
+        assert memmap_knn_graph.dtype == np.float32
+        assert memmap_knn_graph.indices.dtype == np.int32
+        assert not memmap_knn_graph.data.flags.owndata
+        assert not memmap_knn_graph.data.flags.writeable
+
+        np.testing.assert_allclose(memmap_knn_graph.data, knn_graph.data, atol=1e-6)
+        non_duplicates = np.ones(len(features), dtype=bool)
+        non_duplicates[10:40] = False  # Neighbors among many duplicates are arbitrary
+        np.testing.assert_array_equal(
+            memmap_knn_graph.indices.reshape(-1, 5)[non_duplicates],
+            knn_graph.indices.reshape(-1, 5)[non_duplicates],
+        )
+
+    def test_chunks(self, features, tmp_path):
+        knn = features_to_knn(features, n_neighbors=5, metric="euclidean")
+        knn_graph = construct_knn_graph_from_index(knn, correction_features=features)
+        memmap_knn_graph = construct_memmap_knn_graph_from_index(
+            knn, features, str(tmp_path), chunk_size=7
+        )
+        distances = memmap_knn_graph.data.reshape(-1, 5)
+        indices = memmap_knn_graph.indices.reshape(-1, 5)
+        assert not np.any(indices == np.arange(len(features))[:, np.newaxis])
+        assert np.all(distances[10:40] == 0) and np.all(
+            (indices[10:40] >= 10) & (indices[10:40] < 40)
+        )
+        assert indices[100, 0] == 200 and indices[200, 0] == 100
+        np.testing.assert_allclose(memmap_knn_graph.toarray(), knn_graph.toarray(), atol=1e-6)
+
+        # The graph can be opened again from its files
+        reloaded_knn_graph = load_memmap_knn_graph(str(tmp_path))
+        assert (reloaded_knn_graph != memmap_knn_graph).nnz == 0
+
+    def test_int64_indices_for_large_graphs(self, features, tmp_path, monkeypatch):
+        knn = features_to_knn(features, n_neighbors=5, metric="euclidean")
+        knn_graph = construct_knn_graph_from_index(knn, correction_features=features)
+        # The row offsets of the graph (up to N * k) no longer fit in the index dtype
+        monkeypatch.setattr(knn_graph_module, "_MAX_INT32_INDEX", len(features) * 5 - 1)
+        memmap_knn_graph = construct_memmap_knn_graph_from_index(knn, features, str(tmp_path))
+        indices_file = tmp_path / knn_graph_module.KNN_GRAPH_INDICES_FILE
+        assert np.load(indices_file, mmap_mode="r").dtype == np.int64
+        np.testing.assert_array_equal(
+            memmap_knn_graph.indptr, np.arange(0, len(features) * 5 + 1, 5)
+        )
+        np.testing.assert_allclose(memmap_knn_graph.toarray(), knn_graph.toarray(), atol=1e-6)
+
+        # Graphs written with int32 indices are read with int64 row offsets
+        np.save(indices_file, np.load(indices_file).astype(np.int32))
+        reloaded_knn_graph = load_memmap_knn_graph(str(tmp_path))
+        assert (reloaded_knn_graph != memmap_knn_graph).nnz == 0
+
+
+class TestComputeExactDuplicateSets:
+    @staticmethod
+    def expected_duplicate_sets(features):
+        _, unique_inverse, unique_counts = np.unique(
+            features, return_inverse=True, return_counts=True, axis=0
+        )
+        return sorted(
+            np.where(unique_inverse.reshape(-1) == u)[0].tolist()
+            for u in np.flatnonzero(unique_counts > 1)
+        )
+
+    @given(
+        features=arrays(
+            dtype=st.sampled_from([np.float64, np.float32, np.int64, np.int8, np.uint8]),
+            shape=st.tuples(st.integers(0, 60), st.integers(1, 5)),
+            elements=st.integers(0, 2),
+        )
+    )
+    def test_matches_sorting(self, features):
+        duplicate_sets = knn_graph_module._compute_exact_duplicate_sets(features)
+        assert [s.tolist() for s in duplicate_sets] == self.expected_duplicate_sets(features)
+
+    def test_signed_zeros_and_nans(self):
+        features = np.array([[0.0, 1.0], [-0.0, 1.0], [np.nan, 1.0], [np.nan, 1.0], [2.0, 3.0]])
+        duplicate_sets = knn_graph_module._compute_exact_duplicate_sets(features)
+        assert [s.tolist() for s in duplicate_sets] == [[0, 1]]
+
+    def test_hash_collisions_and_chunks(self, monkeypatch):
+        features = np.random.default_rng(0).integers(0, 3, size=(300, 3)).astype(np.float32)
+        expected_duplicate_sets = self.expected_duplicate_sets(features)
+
+        monkeypatch.setattr(knn_graph_module, "EXACT_DUPLICATE_CHUNK_SIZE", 16)
+        duplicate_sets = knn_graph_module._compute_exact_duplicate_sets(features, n_jobs=2)
+        assert [s.tolist() for s in duplicate_sets] == expected_duplicate_sets
+
+        # All rows fall into the same bucket
+        monkeypatch.setattr(
+            knn_graph_module, "_hash_rows", lambda rows: np.zeros(len(rows), dtype=np.uint64)
+        )
+        duplicate_sets = knn_graph_module._compute_exact_duplicate_sets(features)
+        assert [s.tolist() for s in duplicate_sets] == expected_duplicate_sets
+
+
+def correct_knn_distances_and_indices_one_set_at_a_time(distances, indices, exact_duplicate_sets):
+    """Reference implementation that corrects each set of exact duplicates separately."""
+    k = distances.shape[1]
+    for duplicate_inds in exact_duplicate_sets:
+        num_same = len(duplicate_inds)
+        num_same_included = min(num_same - 1, k)
+        sorted_first_k_duplicate_inds = np.sort(
+            circulant(duplicate_inds[: num_same_included + 1])[:, 1:], axis=1
+        )
+        if num_same >= k + 1:
+            indices[duplicate_inds[: k + 1]] = sorted_first_k_duplicate_inds
+            indices[duplicate_inds[k + 1 :]] = duplicate_inds[:k]
+            distances[duplicate_inds] = 0
+        else:
+            different_point_mask = np.isin(indices[duplicate_inds], duplicate_inds, invert=True)
+            true_indices = np.argsort(~different_point_mask, axis=1, kind="stable")[
+                :, :-num_same_included
+            ]
+            distances[duplicate_inds, -(k - num_same_included) :] = distances[
+                duplicate_inds, true_indices.T
+            ].T
+            indices[duplicate_inds, -(k - num_same_included) :] = indices[
+                duplicate_inds, true_indices.T
+            ].T
+            indices[duplicate_inds, :num_same_included] = sorted_first_k_duplicate_inds
+            distances[duplicate_inds, :num_same_included] = 0
+
+
+@pytest.mark.parametrize("k", [1, 3, 10, 30])
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_batched_duplicate_correction_matches_one_set_at_a_time(k, seed):
+    rng = np.random.default_rng(seed)
+    features = rng.random((8000, 4))
+    # Duplicate sets of many sizes, some of them sharing a size
+    set_sizes = rng.choice([2, 2, 3, 5, k + 1, k + 2, 3 * k + 1], size=80)
+    rows = rng.permutation(len(features))[: set_sizes.sum()]
+    for duplicate_inds in np.split(rows, np.cumsum(set_sizes)[:-1]):
+        features[duplicate_inds] = features[duplicate_inds[0]]
+
+    knn = features_to_knn(features, n_neighbors=k, metric="euclidean")
+    distances, indices = knn.kneighbors()
+    exact_duplicate_sets = knn_graph_module._compute_exact_duplicate_sets(features)
+    assert len(exact_duplicate_sets) == 80
+
+    expected_distances, expected_indices = distances.copy(), indices.copy()
+    correct_knn_distances_and_indices_one_set_at_a_time(
+        expected_distances, expected_indices, exact_duplicate_sets
+    )
+    correct_knn_distances_and_indices_with_exact_duplicate_sets_inplace(
+        distances, indices, exact_duplicate_sets
+    )
+    np.testing.assert_array_equal(distances, expected_distances)
+    np.testing.assert_array_equal(indices, expected_indices)
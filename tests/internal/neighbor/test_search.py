@@ -0,0 +1,227 @@
+import pickle
+
+import numpy as np
+import pytest
+from scipy.spatial.distance import cdist, euclidean
+from sklearn.metrics import pairwise_distances
+from sklearn.neighbors import NearestNeighbors
+
+from cleanlab.internal.neighbor import search as search_module
+from cleanlab.internal.neighbor.knn_graph import create_knn_graph_and_index
+from cleanlab.internal.neighbor.search import (
+    BlockedNearestNeighbors,
+    IVFNearestNeighbors,
+    construct_knn,
+)
+
+
+def exact_pairwise_distances(X, Y, metric):
+    """Pairwise distances, without the rounding errors of computing euclidean distances from inner products."""
+    if metric == "cosine":
+        return pairwise_distances(X, Y, metric="cosine")
+    return cdist(X, Y, metric="euclidean")
+
+
+@pytest.mark.parametrize(
+    "metric", ["cosine", "euclidean", euclidean], ids=lambda x: getattr(x, "__name__", x)
+)
+@pytest.mark.parametrize("block_size", [2**22, 64], ids=lambda x: f"block_size={x}")
+@pytest.mark.parametrize("n_jobs", [None, 2], ids=lambda x: f"n_jobs={x}")
+@pytest.mark.parametrize("offset", [0, 1000], ids=lambda x: f"offset={x}")
+def test_matches_exact_brute_force(metric, block_size, n_jobs, offset, monkeypatch):
+    monkeypatch.setattr(search_module, "KNN_BLOCK_SIZE", block_size)
+    rng = np.random.default_rng(0)
+    # A large offset makes the distances tiny compared to the norms of the features
+    features = rng.normal(size=(300, 20)) + offset
+    features[1] = features[0]  # Exact duplicate
+    features[2] = 0  # Zero vector
+    queries = np.vstack([features[:5], rng.normal(size=(30, 20)) + offset])
+
+    knn = BlockedNearestNeighbors(n_neighbors=8, metric=metric, n_jobs=n_jobs).fit(features)
+    assert knn._blocked_metric is not None
+
+    for X in [None, queries]:
+        distances, indices = knn.kneighbors(X)
+        # Each pairwise distance is computed directly, without the rounding errors of a brute-force search
+        all_distances = exact_pairwise_distances(features if X is None else X, features, metric)
+        if X is None:
+            np.fill_diagonal(all_distances, np.inf)
+        expected_distances = np.sort(all_distances, axis=1)[:, :8]
+        assert distances.dtype == np.float64
+        np.testing.assert_allclose(distances, expected_distances, atol=1e-12)
+        # Neighbors may only differ between points at the same distance
+        query_features = features if X is None else X
+        neighbor_distances = exact_pairwise_distances(query_features, features, metric)[
+            np.arange(len(indices))[:, np.newaxis], indices
+        ]
+        np.testing.assert_allclose(neighbor_distances, expected_distances, atol=1e-12)
+
+    # Points are not their own neighbors, and exact duplicates are at distance zero
+    indices = knn.kneighbors(return_distance=False)
+    assert not np.any(indices == np.arange(len(features))[:, np.newaxis])
+    assert indices[0, 0] == 1 and indices[1, 0] == 0
+    assert knn.kneighbors(features[:1], n_neighbors=2)[0][0].tolist() == [0, 0]
+
+
+def test_uncertain_neighbors_are_searched_in_float64(monkeypatch):
+    rng = np.random.default_rng(0)
+    features = rng.normal(size=(500, 20)) + 1000
+    all_distances = exact_pairwise_distances(features, features, "euclidean")
+    np.fill_diagonal(all_distances, np.inf)
+    expected_distances = np.sort(all_distances, axis=1)[:, :5]
+
+    knn = BlockedNearestNeighbors(n_neighbors=5, metric="euclidean").fit(features)
+    np.testing.assert_allclose(knn.kneighbors()[0], expected_distances, atol=1e-12)
+    assert knn._blocked_fit_X64 is None
+
+    # Pretend that the float32 search cannot be trusted for any query point
+    monkeypatch.setattr(
+        search_module.BlockedNearestNeighbors,
+        "_is_certified",
+        lambda self, X_query, *args: np.zeros(len(X_query), dtype=bool),
+    )
+    np.testing.assert_allclose(knn.kneighbors()[0], expected_distances, atol=1e-12)
+    assert knn._blocked_fit_X64 is not None
+
+
+def test_small_low_dimensional_features_with_large_offset():
+    # Few low-dimensional points are searched with scipy's euclidean function by default
+    rng = np.random.default_rng(0)
+    features = np.column_stack(
+        [rng.integers(1990, 2020, size=80), 1e6 + 10 * rng.normal(size=80)]
+    ).astype(float)
+    knn_graph, knn = create_knn_graph_and_index(features, n_neighbors=5)
+    assert knn._blocked_metric == "euclidean"
+    all_distances = exact_pairwise_distances(features, features, "euclidean")
+    np.fill_diagonal(all_distances, np.inf)
+    np.testing.assert_allclose(
+        knn_graph.data.reshape(-1, 5), np.sort(all_distances, axis=1)[:, :5], atol=1e-9
+    )
+
+
+def test_falls_back_to_sklearn():
+    rng = np.random.default_rng(0)
+    features = rng.normal(size=(200, 3))
+
+    # Low-dimensional euclidean search is faster with trees
+    knn = BlockedNearestNeighbors(n_neighbors=5, metric="euclidean").fit(features)
+    assert knn._blocked_metric is None and knn._fit_method != "brute"
+
+    # Other metrics are computed by sklearn
+    V = features.var(axis=0)
+    knn = BlockedNearestNeighbors(n_neighbors=5, metric="seuclidean", metric_params={"V": V})
+    expected_knn = NearestNeighbors(n_neighbors=5, metric="seuclidean", metric_params={"V": V})
+    np.testing.assert_array_equal(
+        knn.fit(features).kneighbors()[1], expected_knn.fit(features).kneighbors()[1]
+    )
+    assert knn._blocked_metric is None
+
+
+def test_construct_knn():
+    knn = construct_knn(n_neighbors=3, metric="cosine")
+    assert isinstance(knn, BlockedNearestNeighbors)
+    assert isinstance(knn, NearestNeighbors)
+    assert knn.get_params()["n_neighbors"] == 3
+
+
+def test_too_many_neighbors():
+    features = np.random.rand(5, 10)
+    knn = BlockedNearestNeighbors(n_neighbors=5, metric="cosine").fit(features)
+    with pytest.raises(ValueError, match="Expected n_neighbors < n_samples_fit"):
+        knn.kneighbors()
+    assert knn.kneighbors(features[:2])[1].shape == (2, 5)
+
+
+def test_pickle_drops_float32_copy():
+    features = np.random.rand(100, 10)
+    knn = BlockedNearestNeighbors(n_neighbors=3, metric="cosine").fit(features)
+    distances, indices = knn.kneighbors()
+    assert knn._blocked_fit_X is not None
+
+    unpickled_knn = pickle.loads(pickle.dumps(knn))
+    assert unpickled_knn._blocked_fit_X is None
+    unpickled_distances, unpickled_indices = unpickled_knn.kneighbors()
+    np.testing.assert_array_equal(unpickled_indices, indices)
+    np.testing.assert_allclose(unpickled_distances, distances)
+
+
+@pytest.mark.parametrize("k", [1, 5, 30])
+def test_argsmallest_k(k):
+    rng = np.random.default_rng(0)
+    values = rng.random((50, 5000)).astype(np.float32)
+    values[:10] = np.sort(values[:10], axis=1)[:, ::-1]  # Worst case for the strided bound
+    values[10:20] = np.round(values[10:20], 2)  # Many ties
+    values[20, :] = np.inf
+    values[20, :k] = 0.5
+    indices = search_module._argsmallest_k(values, k)
+    assert indices.shape == (50, k)
+    np.testing.assert_array_equal(
+        np.sort(np.take_along_axis(values, indices, axis=1), axis=1),
+        np.sort(values, axis=1)[:, :k],
+    )
+    assert all(len(set(row)) == k for row in indices.tolist())
+
+
+class TestIVFNearestNeighbors:
+    @pytest.fixture
+    def features(self):
+        rng = np.random.default_rng(0)
+        centers = rng.normal(size=(20, 16))
+        features = centers[rng.integers(0, 20, size=2000)] + 0.3 * rng.normal(size=(2000, 16))
+        features[1] = features[0]  # Exact duplicate
+        return features
+
+    @pytest.mark.parametrize("metric", ["cosine", "euclidean"])
+    def test_recall(self, features, metric):
+        exact_knn = BlockedNearestNeighbors(n_neighbors=10, metric=metric, algorithm="brute")
+        _, exact_indices = exact_knn.fit(features).kneighbors()
+
+        recalls = []
+        for n_probe in [1, 4]:
+            knn = IVFNearestNeighbors(n_neighbors=10, metric=metric, n_probe=n_probe)
+            distances, indices = knn.fit(features).kneighbors()
+            assert len(knn.cluster_centers_) == int(np.sqrt(len(features)))
+            recalls.append(
+                np.mean([len(set(a) & set(b)) for a, b in zip(indices, exact_indices)]) / 10
+            )
+
+            # Distances to the neighbors that were found are exact, and sorted
+            expected_distances = [
+                pairwise_distances(features[[i]], features[indices[i]], metric=metric)[0]
+                for i in range(len(indices))
+            ]
+            np.testing.assert_allclose(distances, expected_distances, atol=1e-12)
+            assert np.all(np.diff(distances, axis=1) >= 0)
+            assert not np.any(indices == np.arange(len(features))[:, np.newaxis])
+            assert indices[0, 0] == 1 and indices[1, 0] == 0
+
+        assert recalls[0] <= recalls[1]
+        assert recalls[1] > 0.95
+
+    def test_exact_when_probing_all_clusters(self, features):
+        knn = IVFNearestNeighbors(n_neighbors=5, metric="cosine", n_clusters=8, n_probe=8)
+        exact_knn = BlockedNearestNeighbors(n_neighbors=5, metric="cosine")
+        queries = features[:50] + 0.1
+        np.testing.assert_allclose(
+            knn.fit(features).kneighbors(queries)[0],
+            exact_knn.fit(features).kneighbors(queries)[0],
+        )
+
+    def test_too_few_candidates_falls_back_to_exact_search(self, features):
+        # With many small clusters, the probed clusters of some points hold fewer than n_neighbors points
+        knn = IVFNearestNeighbors(n_neighbors=30, metric="cosine", n_clusters=200, n_probe=1)
+        distances, indices = knn.fit(features).kneighbors()
+        assert np.all(np.isfinite(distances)) and np.all(indices >= 0)
+        assert not np.any(indices == np.arange(len(features))[:, np.newaxis])
+
+    def test_construct_knn(self, features):
+        knn = construct_knn(n_neighbors=3, metric="cosine", algorithm="ivf", n_probe=2)
+        assert isinstance(knn, IVFNearestNeighbors)
+        assert knn.get_params()["n_probe"] == 2 and knn.get_params()["algorithm"] == "auto"
+
+        knn_graph, knn = create_knn_graph_and_index(
+            features, n_neighbors=3, metric="cosine", algorithm="ivf"
+        )
+        assert isinstance(knn, IVFNearestNeighbors)
+        assert knn_graph.shape == (len(features), len(features))
+        assert knn_graph.nnz == 3 * len(features)
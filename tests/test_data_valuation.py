@@ -109,3 +109,30 @@ class TestDataShapleyKNNScore:
         assert scores.shape == (len(labels),)
         assert np.all(scores >= -1)
         assert np.all(scores <= 1)
+
+    @settings(max_examples=200, deadline=None)
+    @given(valid_data())
+    def test_knn_shapley_score_matches_reference(self, data):
+        labels, features, k = data
+
+        knn_graph, _ = create_knn_graph_and_index(features, n_neighbors=k)
+        neighbor_indices = knn_graph.indices.reshape(-1, k)
+
+        scores = _knn_shapley_score(neighbor_indices, labels, k)
+        np.testing.assert_allclose(
+            scores, _reference_knn_shapley_score(neighbor_indices, labels, k), atol=1e-12
+        )
+
+
+def _reference_knn_shapley_score(neighbor_indices, y, k):
+    """Direct implementation of the recursion in equations (18) and (19) of https://arxiv.org/abs/1908.08619,
+    with an N x N matrix of per-test-point scores."""
+    N = y.shape[0]
+    scores = np.zeros((N, N))
+    for y_alpha, s_alpha, idx in zip(y, scores, neighbor_indices):
+        ans_matches = (y[idx] == y_alpha).flatten()
+        for j in range(k - 2, -1, -1):
+            s_alpha[idx[j]] = s_alpha[idx[j + 1]] + float(
+                int(ans_matches[j]) - int(ans_matches[j + 1])
+            )
+    return np.mean(scores / k, axis=0)
@@ -20,6 +20,7 @@ import typing
 
 import numpy as np
 import pytest
+import scipy.sparse
 import sklearn
 from hypothesis import given, settings
 from hypothesis import strategies as st
@@ -696,6 +697,94 @@ def test_get_cross_validated_multilabel_pred_probs(dummy_features, labels, cv, p
     assert np.allclose(pred_probs, pred_probs_gold, atol=5e-4)
 
 
+@pytest.mark.parametrize("K", [2, 3, 4], ids=["K=2", "K=3", "K=4"])
+def test_multilabel_ids_match_unique_rows(K):
+    np.random.seed(0)
+    given_labels = np.random.randint(0, 2, size=(50, K))
+    _, expected_ids = np.unique(given_labels, axis=0, return_inverse=True)
+    multilabel_ids = ml_scorer._get_multilabel_ids(given_labels)
+    assert np.array_equal(multilabel_ids, expected_ids.ravel())
+
+
+class TestIterativeStratifiedKFold:
+    @pytest.fixture
+    def many_class_labels(self):
+        # Almost every example has a unique class-assignment configuration
+        np.random.seed(0)
+        return (np.random.rand(300, 40) < 0.1).astype(int)
+
+    @pytest.mark.parametrize("sparse", [False, True], ids=["dense", "sparse"])
+    def test_folds_partition_dataset(self, many_class_labels, sparse):
+        given_labels = scipy.sparse.csr_matrix(many_class_labels) if sparse else many_class_labels
+        cv = ml_scorer.IterativeStratifiedKFold(n_splits=3, shuffle=True, random_state=0)
+        splits = list(ml_scorer._get_split_generator(given_labels, cv))
+        assert len(splits) == cv.get_n_splits() == 3
+        test_indices = np.concatenate([test for _, test in splits])
+        assert np.array_equal(np.sort(test_indices), np.arange(len(many_class_labels)))
+        for train, test in splits:
+            assert len(np.intersect1d(train, test)) == 0
+            assert len(train) + len(test) == len(many_class_labels)
+            assert abs(len(test) - len(many_class_labels) / 3) <= 5
+
+    def test_each_class_is_stratified(self, many_class_labels):
+        class_counts = many_class_labels.sum(axis=0)
+
+        def get_class_count_deviations(cv):
+            return np.array(
+                [
+                    np.abs(many_class_labels[test].sum(axis=0) - class_counts / 3)
+                    for _, test in cv.split(many_class_labels, many_class_labels)
+                ]
+            ).max(axis=0)
+
+        deviations = get_class_count_deviations(ml_scorer.IterativeStratifiedKFold(n_splits=3))
+        # The rarest class is split as evenly as possible
+        assert deviations[np.argmin(class_counts)] < 1
+        # Other classes are better stratified than with random splits
+        random_deviations = get_class_count_deviations(
+            sklearn.model_selection.KFold(n_splits=3, shuffle=True, random_state=0)
+        )
+        assert deviations.mean() < random_deviations.mean()
+
+    def test_shuffle_is_reproducible(self, many_class_labels):
+        def get_test_folds(random_state):
+            cv = ml_scorer.IterativeStratifiedKFold(
+                n_splits=2, shuffle=True, random_state=random_state
+            )
+            return [test for _, test in cv.split(many_class_labels, many_class_labels)]
+
+        for a, b in zip(get_test_folds(0), get_test_folds(0)):
+            assert np.array_equal(a, b)
+        assert not np.array_equal(get_test_folds(0)[0], get_test_folds(1)[0])
+
+    def test_invalid_arguments(self, many_class_labels):
+        with pytest.raises(ValueError, match="n_splits"):
+            ml_scorer.IterativeStratifiedKFold(n_splits=1)
+        with pytest.raises(ValueError, match="random_state"):
+            ml_scorer.IterativeStratifiedKFold(n_splits=2, random_state=0)
+        cv = ml_scorer.IterativeStratifiedKFold(n_splits=301)
+        with pytest.raises(ValueError, match="n_splits"):
+            next(cv.split(many_class_labels, many_class_labels))
+
+    def test_get_cross_validated_multilabel_pred_probs(self, many_class_labels):
+        np.random.seed(0)
+        features = np.random.rand(len(many_class_labels), 2)
+        # Every class needs positive examples in each training fold
+        given_labels = many_class_labels[:, many_class_labels.sum(axis=0) >= 3]
+        cv = ml_scorer.IterativeStratifiedKFold(n_splits=3)
+        clf = OneVsRestClassifier(LogisticRegression(random_state=0))
+        pred_probs = ml_scorer.get_cross_validated_multilabel_pred_probs(
+            features, given_labels, clf=clf, cv=cv
+        )
+        assert pred_probs.shape == given_labels.shape
+        assert np.all(pred_probs >= 0) and np.all(pred_probs <= 1)
+
+        pred_probs_parallel = ml_scorer.get_cross_validated_multilabel_pred_probs(
+            features, given_labels, clf=clf, cv=cv, n_jobs=2
+        )
+        assert np.allclose(pred_probs, pred_probs_parallel)
+
+
 class TestExponentialMovingAverage:
     """Test the ml_scorer.expontential_moving_average function."""
 
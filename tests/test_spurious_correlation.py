@@ -16,11 +16,18 @@ The test is implemented using the cleanlab library using Datalab module, which h
 """
 
 import numpy as np
+import pandas as pd
 from PIL import Image, ImageDraw, ImageEnhance, ImageFilter
 import random
 from datasets import Dataset
 import pytest
+from sklearn.model_selection import cross_val_score
+from sklearn.naive_bayes import GaussianNB
 from cleanlab import Datalab
+from cleanlab.datalab.internal.spurious_correlation import (
+    SpuriousCorrelations,
+    relative_room_for_improvement,
+)
 import contextlib
 import io
 from unittest import mock
@@ -481,3 +488,37 @@ class TestImagelabReporterAdapter:
                 report_correlation_metric not in report
             ), "Report should not contain correlation metric description"
             assert filtered_correlations_df.empty
+
+
+@pytest.mark.parametrize("num_classes", [2, 5])
+def test_batched_scores_match_gaussian_nb_cross_validation(num_classes):
+    """The batched Gaussian Naive Bayes fit must reproduce the scores of scikit-learn's
+    cross-validated GaussianNB, trained on each property separately."""
+    rng = np.random.default_rng(seed)
+    N = 200
+    labels = rng.integers(0, num_classes, N)
+    data = pd.DataFrame(
+        {
+            "uniform_score": rng.random(N),
+            "discrete_score": rng.integers(0, 3, N),
+            "constant_score": np.zeros(N),
+            "correlated_score": labels + rng.normal(0, 0.5, N),
+        }
+    )
+    correlations = SpuriousCorrelations(data=data, labels=labels)
+    baseline_accuracy = correlations._get_baseline()
+
+    expected_scores = []
+    for property_of_interest in data.columns:
+        mean_accuracy = cross_val_score(
+            GaussianNB(), data[[property_of_interest]].values, labels, cv=5, scoring="accuracy"
+        ).mean()
+        expected_scores.append(relative_room_for_improvement(baseline_accuracy, mean_accuracy))
+
+    scores = correlations.calculate_correlations()
+    assert scores["property"].tolist() == data.columns.tolist()
+    assert scores["score"].tolist() == expected_scores
+    assert (
+        correlations.calculate_spurious_correlation("correlated_score", baseline_accuracy)
+        == expected_scores[-1]
+    )